@@ -0,0 +1,88 @@
+"""
+SYNTHETIC BENCHMARK DATA
+Seeded conversation corpora and telemetry for the benchmarks.
+"""
+
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Union
+
+# Distinct words available to synthetic phrases
+VOCABULARY_SIZE = 5000
+
+def make_corpus(n_sessions: int, n_phrases: int = 200,
+                phrases_per_session: int = 20, seed: int = 42,
+                shared_fraction: float = 1.0,
+                words_per_phrase: int = 8) -> Dict:
+    """
+    Synthetic corpus with controlled n-gram overlap.
+    
+    Each session holds phrases_per_session phrases. A shared_fraction of
+    them is drawn from a common pool of n_phrases (smaller pool = more
+    overlap between sessions); the rest are fresh random phrases whose
+    n-grams almost never repeat.
+    """
+    if not 0.0 <= shared_fraction <= 1.0:
+        raise ValueError(f"shared_fraction must be within [0, 1], got {shared_fraction}")
+    n_shared = int(round(phrases_per_session * shared_fraction))
+    n_unique = phrases_per_session - n_shared
+    if n_shared > n_phrases:
+        # Shared phrases are drawn without replacement from the pool
+        raise ValueError(
+            f"phrases_per_session * shared_fraction ({n_shared}) exceeds n_phrases ({n_phrases})"
+        )
+    
+    rng = np.random.default_rng(seed)
+    phrases = [
+        ' '.join(f"term{w}" for w in rng.integers(0, VOCABULARY_SIZE, words_per_phrase))
+        for _ in range(n_phrases)
+    ]
+    
+    corpus = {}
+    for i in range(n_sessions):
+        session = [phrases[k] for k in rng.choice(n_phrases, n_shared, replace=False)]
+        if n_unique:
+            words = rng.integers(0, VOCABULARY_SIZE, (n_unique, words_per_phrase))
+            session += [' '.join(f"term{w}" for w in row) for row in words]
+        corpus[f"session_{i}"] = session
+    return corpus
+
+def signal_amplitude(snr_db: float) -> float:
+    """Sine amplitude whose power is snr_db above unit-variance noise."""
+    return float(np.sqrt(2 * 10 ** (snr_db / 10)))
+
+def make_telemetry(n_samples: int, sampling_rate: float,
+                   amplitude: float = 0.05, seed: int = 42,
+                   snr_db: Optional[float] = None) -> np.ndarray:
+    """White noise with an injected 0.67Hz component (snr_db overrides amplitude)."""
+    if snr_db is not None:
+        amplitude = signal_amplitude(snr_db)
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_samples) / sampling_rate
+    return amplitude * np.sin(2 * np.pi * 0.67 * t) + rng.standard_normal(n_samples)
+
+def iter_telemetry(n_samples: int, sampling_rate: float,
+                   amplitude: float = 0.05, seed: int = 42,
+                   snr_db: Optional[float] = None,
+                   chunk_size: int = 1 << 20) -> Iterator[np.ndarray]:
+    """make_telemetry in chunks, for lengths that do not fit in memory."""
+    if snr_db is not None:
+        amplitude = signal_amplitude(snr_db)
+    rng = np.random.default_rng(seed)
+    for start in range(0, n_samples, chunk_size):
+        count = min(chunk_size, n_samples - start)
+        t = (start + np.arange(count)) / sampling_rate
+        yield amplitude * np.sin(2 * np.pi * 0.67 * t) + rng.standard_normal(count)
+
+def write_telemetry(path: Union[str, Path], n_samples: int, sampling_rate: float,
+                    **kwargs) -> Path:
+    """Write iter_telemetry output to a .npy file without holding it in memory."""
+    path = Path(path)
+    out = np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n_samples,))
+    start = 0
+    for chunk in iter_telemetry(n_samples, sampling_rate, **kwargs):
+        out[start:start + len(chunk)] = chunk
+        start += len(chunk)
+    out.flush()
+    del out
+    return path
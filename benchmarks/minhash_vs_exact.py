@@ -0,0 +1,71 @@
+"""
+MINHASH VS EXACT PATTERN COMPLETION BENCHMARK
+Compares MinHashPatternEstimator against the exact PatternValidator path.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from pathlib import Path
+import sys
+from typing import Dict
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.pattern_completion import PatternValidator
+from validation.pattern_minhash import MinHashPatternEstimator
+from benchmarks.generators import make_corpus
+
+def run_benchmark(n_sessions: int, n_signatures: int, n_bands: int,
+                  n_phrases: int, run_exact: bool = True) -> Dict:
+    """Time both paths on one corpus and report the estimation error."""
+    corpus = make_corpus(n_sessions, n_phrases)
+    validator = PatternValidator(use_fingerprints=True)
+    estimator = MinHashPatternEstimator(validator, n_signatures, n_bands)
+    
+    start = time.perf_counter()
+    estimate = estimator.estimate_mean_completion(corpus)
+    approximate_seconds = time.perf_counter() - start
+    
+    result = {
+        'n_sessions': n_sessions,
+        'n_signatures': n_signatures,
+        'n_bands': n_bands,
+        'approximate_seconds': approximate_seconds,
+        'approximate_mean': estimate['mean_score'],
+        'error_bound': estimate['error_bound']
+    }
+    
+    if run_exact:
+        start = time.perf_counter()
+        exact_mean = float(np.mean(validator.completion_scores(corpus)))
+        result['exact_seconds'] = time.perf_counter() - start
+        result['exact_mean'] = exact_mean
+        result['absolute_error'] = abs(estimate['mean_score'] - exact_mean)
+        result['within_bound'] = result['absolute_error'] <= estimate['error_bound']
+    
+    return result
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="MinHash vs exact completion benchmark")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[100, 300, 1000])
+    parser.add_argument('--signatures', type=int, default=128)
+    parser.add_argument('--bands', type=int, default=32)
+    parser.add_argument('--phrases', type=int, default=200,
+                        help='Size of the shared phrase pool (smaller = more overlap)')
+    parser.add_argument('--skip-exact', action='store_true',
+                        help='Only time the approximate path (for very large corpora)')
+    args = parser.parse_args()
+    
+    for n_sessions in args.sessions:
+        result = run_benchmark(n_sessions, args.signatures, args.bands,
+                               args.phrases, run_exact=not args.skip_exact)
+        print(json.dumps(result))
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+PARALLEL PATTERN COMPLETION SCALING BENCHMARK
+Times PatternValidator.completion_scores for 1..N worker processes.
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.pattern_completion import PatternValidator
+from benchmarks.generators import make_corpus
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Parallel completion scoring scaling benchmark")
+    parser.add_argument('--sessions', type=int, default=2000)
+    parser.add_argument('--phrases', type=int, default=200)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--fingerprints', action='store_true',
+                        help='Use uint64 fingerprints instead of MD5 patterns')
+    args = parser.parse_args()
+    
+    corpus = make_corpus(args.sessions, args.phrases)
+    baseline = None
+    
+    for n_workers in range(1, args.max_workers + 1):
+        validator = PatternValidator(args.fingerprints, n_workers=n_workers)
+        
+        start = time.perf_counter()
+        scores = validator.completion_scores(corpus)
+        seconds = time.perf_counter() - start
+        
+        if baseline is None:
+            baseline = (scores, seconds)
+        
+        print(json.dumps({
+            'n_sessions': args.sessions,
+            'n_workers': n_workers,
+            'seconds': seconds,
+            'speedup': baseline[1] / seconds,
+            'identical_to_serial': bool(np.array_equal(scores, baseline[0]))
+        }))
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
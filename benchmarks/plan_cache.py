@@ -0,0 +1,55 @@
+"""
+SPECTRAL PLAN CACHE BENCHMARK
+Repeated detect_frequency calls on equal-length windows.
+
+uncached     plan_cache_size=0: grid, target bin and buffers rebuilt per call
+cached       default detector: one plan per (length, sampling rate)
+approximate  cached, with the strided approximate median noise floor
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.generators import make_telemetry
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="detect_frequency with and without spectral plans")
+    parser.add_argument('--windows', type=int, default=1000)
+    parser.add_argument('--lengths', type=int, nargs='+', default=[1024, 16384, 131072])
+    parser.add_argument('--sampling-rate', type=float, default=100.0)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    detectors = {
+        'uncached': ArchitectureFrequencyDetector(plan_cache_size=0),
+        'cached': ArchitectureFrequencyDetector(),
+        'approximate': ArchitectureFrequencyDetector(median='approximate')
+    }
+    
+    for length in args.lengths:
+        x = make_telemetry(length * args.windows, args.sampling_rate, seed=args.seed, snr_db=-10)
+        windows = x.reshape(args.windows, length)
+        row = {'window_length': length, 'windows': args.windows}
+        
+        for name, detector in detectors.items():
+            start = time.perf_counter()
+            snr = [detector.detect_frequency(w, args.sampling_rate)['snr'] for w in windows]
+            row[f'{name}_us_per_call'] = (time.perf_counter() - start) / args.windows * 1e6
+            row[f'{name}_mean_snr'] = float(sum(snr) / len(snr))
+        
+        row['speedup'] = row['uncached_us_per_call'] / row['cached_us_per_call']
+        print(json.dumps(row))
+        del x, windows
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
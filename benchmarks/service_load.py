@@ -0,0 +1,128 @@
+"""
+VALIDATION SERVICE LOAD TEST
+Concurrent localhost requests against ValidationService.
+
+Starts the service in-process on a free port (or targets --url), fires
+concurrent detection and completion requests over keep-alive
+connections, and prints client-side latency, throughput, 503 counts and
+the service's own batch-size and latency histograms.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.generators import make_corpus, make_telemetry
+from validation.service import ValidationService
+
+async def request(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                  method: str, path: str, payload=None):
+    """One keep-alive HTTP/1.1 request; returns (status, decoded JSON body)."""
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                 f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode().partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+async def client(host: str, port: int, jobs: asyncio.Queue, latencies: list, statuses: dict):
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        while True:
+            try:
+                path, payload = jobs.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, 'POST', path, payload)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+async def run(args) -> dict:
+    service = None
+    if args.url:
+        host, port = args.url.rsplit(':', 1)
+        host, port = host.split('//')[-1], int(port)
+    else:
+        service = ValidationService('127.0.0.1', 0, args.workers, args.max_batch,
+                                    args.max_delay_ms / 1e3, args.max_pending)
+        host, port = '127.0.0.1', await service.start()
+    
+    # Pre-encoded payloads: detection signals and completion pairs
+    jobs = asyncio.Queue()
+    sessions = list(make_corpus(64, seed=args.seed).values())
+    rng = np.random.default_rng(args.seed)
+    for i in range(args.requests):
+        if i % 2 == 0:
+            signal = make_telemetry(args.signal_length, args.sampling_rate, seed=args.seed + i, snr_db=-10)
+            jobs.put_nowait(('/api/v1/quantum-pulse/detect',
+                             {'signal': signal.tolist(), 'sampling_rate': args.sampling_rate}))
+        else:
+            a, b = rng.choice(len(sessions), 2, replace=False)
+            jobs.put_nowait(('/api/v1/pattern/resonance',
+                             {'session_a': sessions[a], 'session_b': sessions[b]}))
+    
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, jobs, latencies, statuses)
+                           for _ in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+    
+    reader, writer = await asyncio.open_connection(host, port)
+    _, service_metrics = await request(reader, writer, 'GET', '/api/v1/metrics')
+    _, health = await request(reader, writer, 'GET', '/api/v1/system/health')
+    writer.close()
+    if service is not None:
+        await service.stop()
+    
+    latencies = np.array(latencies) * 1e3
+    return {
+        'requests': args.requests,
+        'concurrency': args.concurrency,
+        'seconds': elapsed,
+        'requests_per_second': args.requests / elapsed,
+        'latency_ms_p50': float(np.percentile(latencies, 50)),
+        'latency_ms_p99': float(np.percentile(latencies, 99)),
+        'statuses': {str(k): v for k, v in sorted(statuses.items())},
+        'service_metrics': service_metrics,
+        'service_health': health
+    }
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Validation service load test")
+    parser.add_argument('--url', help='Existing service (http://host:port); default: start one in-process')
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--signal-length', type=int, default=1000)
+    parser.add_argument('--sampling-rate', type=float, default=100.0)
+    parser.add_argument('--workers', type=int, default=2)
+    parser.add_argument('--max-batch', type=int, default=64)
+    parser.add_argument('--max-delay-ms', type=float, default=5.0)
+    parser.add_argument('--max-pending', type=int, default=1024)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
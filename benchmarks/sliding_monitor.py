@@ -0,0 +1,60 @@
+"""
+SLIDING-WINDOW MONITOR BENCHMARK
+Per-update latency and sustained throughput of SlidingFrequencyMonitor.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.frequency_monitor import SlidingFrequencyMonitor
+from benchmarks.generators import make_telemetry
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Sliding-window monitor latency and throughput")
+    parser.add_argument('--sampling-rates', type=float, nargs='+', default=[1000.0, 10000.0])
+    parser.add_argument('--block-sizes', type=int, nargs='+', default=[1, 10, 100, 1000],
+                        help='Samples per update call (1 = sample-by-sample)')
+    parser.add_argument('--seconds', type=float, default=30.0,
+                        help='Seconds of telemetry pushed per configuration')
+    args = parser.parse_args()
+
+    for sampling_rate in args.sampling_rates:
+        x = make_telemetry(int(args.seconds * sampling_rate), sampling_rate)
+
+        for block_size in args.block_sizes:
+            monitor = SlidingFrequencyMonitor(sampling_rate)
+            latencies = []
+
+            start = time.perf_counter()
+            for offset in range(0, len(x), block_size):
+                call_start = time.perf_counter()
+                monitor.update(x[offset:offset + block_size])
+                latencies.append(time.perf_counter() - call_start)
+            elapsed = time.perf_counter() - start
+
+            latencies = np.array(latencies) * 1e3
+            throughput = len(x) / elapsed
+            print(json.dumps({
+                'sampling_rate': sampling_rate,
+                'block_size': block_size,
+                'tracked_bins': len(monitor.frequencies),
+                'window_length': monitor.window_length,
+                'latency_ms_p50': float(np.percentile(latencies, 50)),
+                'latency_ms_p99': float(np.percentile(latencies, 99)),
+                'latency_ms_max': float(latencies.max()),
+                'samples_per_second': throughput,
+                'realtime_factor': throughput / sampling_rate
+            }))
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+"""
+CODEX 67 BENCHMARK SUITE
+Scaling curves for the validation hot paths, with a regression check.
+
+Each benchmark is timed at a range of sizes (sessions or samples) on
+seeded synthetic data. Results are written as JSON; passing an earlier
+run as --baseline flags every benchmark/size that got slower than the
+threshold allows.
+
+    python benchmarks/suite.py --output bench.json
+    python benchmarks/suite.py --baseline bench.json --threshold 0.25
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import numpy as np
+import scipy
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.generators import make_corpus, make_telemetry, iter_telemetry
+from validation.pattern_completion import PatternValidator
+from validation.pattern_minhash import MinHashPatternEstimator
+from validation.incremental_completion import IncrementalCompletionScorer
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from validation.bootstrap import BootstrapEngine
+
+# Sampling rate of all synthetic telemetry
+SAMPLING_RATE = 100.0
+
+# Sizes per benchmark: the default sweep and the --full sweep
+SESSION_SIZES = {'default': [10, 100, 1000], 'full': [10, 100, 1000, 10000, 100000]}
+SAMPLE_SIZES = {'default': [10**3, 10**4, 10**5, 10**6], 'full': [10**3, 10**4, 10**5, 10**6, 10**7, 10**8]}
+
+def bench_tokenize(size: int, seed: int) -> Callable:
+    """Tokenize-once conversion of every session to a token array."""
+    corpus = make_corpus(size, seed=seed)
+    return lambda: PatternValidator().tokenize_corpus(corpus)
+
+def bench_pattern_extraction(size: int, seed: int) -> Callable:
+    """Fingerprint pattern rows of every session."""
+    corpus = make_corpus(size, seed=seed)
+    return lambda: PatternValidator(use_fingerprints=True).extract_pattern_rows(corpus)
+
+def bench_score_pairs(size: int, seed: int) -> Callable:
+    """Sparse pair scoring from the inverted index."""
+    corpus = make_corpus(size, n_phrases=max(200, size), seed=seed, shared_fraction=0.5)
+    return lambda: PatternValidator(use_fingerprints=True).score_pairs(corpus)
+
+def bench_completion_scores_md5(size: int, seed: int) -> Callable:
+    """Dense completion scores in MD5 mode (exact n-gram ids)."""
+    corpus = make_corpus(size, seed=seed)
+    return lambda: PatternValidator().completion_scores(corpus)
+
+def bench_minhash_estimate(size: int, seed: int) -> Callable:
+    """MinHash estimate of the mean completion score."""
+    corpus = make_corpus(size, n_phrases=max(200, size), seed=seed, shared_fraction=0.5)
+    return lambda: MinHashPatternEstimator(PatternValidator(use_fingerprints=True)).estimate_mean_completion(corpus)
+
+def bench_incremental_add(size: int, seed: int) -> Tuple[Callable, Callable]:
+    """Incremental scorer update with 1% new sessions."""
+    corpus = make_corpus(size + max(1, size // 100), n_phrases=max(200, size), seed=seed,
+                         shared_fraction=0.5)
+    ids = list(corpus)
+    new_sessions = {s: corpus[s] for s in ids[size:]}
+    
+    # Existing sessions are tokenized once; each repeat rebuilds the
+    # scorer from them untimed, so every update starts from the same corpus
+    validator = PatternValidator(use_fingerprints=True)
+    existing = validator.tokenize_corpus({s: corpus[s] for s in ids[:size]})
+    
+    def prepare() -> IncrementalCompletionScorer:
+        scorer = IncrementalCompletionScorer(validator)
+        scorer.add_sessions(existing)
+        return scorer
+    return prepare, lambda scorer: scorer.add_sessions(new_sessions)
+
+def bench_detect_frequency(size: int, seed: int) -> Callable:
+    """Full periodogram detection."""
+    x = make_telemetry(size, SAMPLING_RATE, seed=seed, snr_db=-10)
+    return lambda: ArchitectureFrequencyDetector().detect_frequency(x, SAMPLING_RATE)
+
+def bench_detect_frequency_stream(size: int, seed: int) -> Callable:
+    """Streaming Welch detection."""
+    # Generated while streaming, so 10^8 samples never sit in memory
+    nperseg = min(2 ** 13, 2 ** int(np.log2(size)))
+    return lambda: ArchitectureFrequencyDetector().detect_frequency_stream(
+        iter_telemetry(size, SAMPLING_RATE, seed=seed, snr_db=-10), SAMPLING_RATE, nperseg=nperseg
+    )
+
+def bench_detect_frequency_targeted(size: int, seed: int) -> Callable:
+    """Band-only DFT detection."""
+    x = make_telemetry(size, SAMPLING_RATE, seed=seed, snr_db=-10)
+    return lambda: ArchitectureFrequencyDetector().detect_frequency_targeted(x, SAMPLING_RATE)
+
+def bench_multitaper_spectrogram(size: int, seed: int) -> Callable:
+    """Multitaper spectrogram over fixed-length windows."""
+    x = make_telemetry(size, SAMPLING_RATE, seed=seed, snr_db=-10)
+    nperseg = min(2 ** 13, 2 ** int(np.log2(size)))
+    return lambda: ArchitectureFrequencyDetector().multitaper_spectrogram(x, SAMPLING_RATE, nperseg=nperseg)
+
+def bench_bootstrap(size: int, seed: int) -> Callable:
+    """Bootstrap interval of the mean, 1000 resamples."""
+    samples = np.random.default_rng(seed).standard_normal(size)
+    return lambda: BootstrapEngine(n_iterations=1000, seed=seed).confidence_interval(samples)
+
+def bench_full_validation(size: int, seed: int) -> Callable:
+    """End-to-end Codex67FullValidator.run_validation."""
+    # Needs the quantum pattern validator; skipped where it is unavailable
+    from validation.full_validation import Codex67FullValidator
+    from io import StringIO
+    from contextlib import redirect_stdout
+    
+    corpus = make_corpus(size, seed=seed)
+    test_data = {
+        'quantum_telemetry': {
+            'coherence_signal': make_telemetry(100 * size, SAMPLING_RATE, seed=seed, snr_db=-10),
+            'sampling_rate': SAMPLING_RATE
+        },
+        'pattern_data': {},
+        'conversation_data': {'conversations': list(corpus.values())},
+        'validation_transcript': ''
+    }
+    
+    def run():
+        validator = Codex67FullValidator()
+        validator.config.update({'generate_report': False, 'use_cache': False,
+                                 'bootstrap_iterations': 100})
+        validator.cache.enabled = False
+        with redirect_stdout(StringIO()):
+            validator.run_validation(test_data)
+    return run
+
+# name -> (setup(size, seed) returning the timed callable, size unit, sweeps);
+# a setup may instead return (prepare, run): prepare() runs untimed before
+# every repeat and its result is passed to the timed run
+BENCHMARKS = {
+    'tokenize': (bench_tokenize, 'sessions', SESSION_SIZES),
+    'pattern_extraction': (bench_pattern_extraction, 'sessions', SESSION_SIZES),
+    'score_pairs': (bench_score_pairs, 'sessions', SESSION_SIZES),
+    'completion_scores_md5': (bench_completion_scores_md5, 'sessions',
+                              {'default': [10, 100, 1000], 'full': [10, 100, 1000, 10000]}),
+    'minhash_estimate': (bench_minhash_estimate, 'sessions', SESSION_SIZES),
+    'incremental_add': (bench_incremental_add, 'sessions', SESSION_SIZES),
+    'detect_frequency': (bench_detect_frequency, 'samples',
+                         {'default': SAMPLE_SIZES['default'], 'full': SAMPLE_SIZES['full'][:-1]}),
+    'detect_frequency_stream': (bench_detect_frequency_stream, 'samples', SAMPLE_SIZES),
+    'detect_frequency_targeted': (bench_detect_frequency_targeted, 'samples',
+                                  {'default': SAMPLE_SIZES['default'], 'full': SAMPLE_SIZES['full'][:-1]}),
+    'multitaper_spectrogram': (bench_multitaper_spectrogram, 'samples',
+                               {'default': SAMPLE_SIZES['default'], 'full': SAMPLE_SIZES['full'][:-1]}),
+    'bootstrap': (bench_bootstrap, 'samples',
+                  {'default': [10**2, 10**3, 10**4], 'full': [10**2, 10**3, 10**4, 10**5]}),
+    'full_validation': (bench_full_validation, 'sessions',
+                        {'default': [10, 100], 'full': [10, 100, 1000]})
+}
+
+def time_call(run: Callable, repeats: int, prepare: Optional[Callable] = None) -> Dict:
+    """Best and median wall time of `repeats` calls (each after an untimed prepare())."""
+    times = []
+    for _ in range(repeats):
+        args = (prepare(),) if prepare is not None else ()
+        start = time.perf_counter()
+        run(*args)
+        times.append(time.perf_counter() - start)
+    return {'seconds': min(times), 'median_seconds': float(np.median(times)), 'repeats': repeats}
+
+def run_suite(names: List[str], sweep: str = 'default', repeats: int = 3,
+              seed: int = 42, max_size: Optional[int] = None) -> Dict:
+    """Run the selected benchmarks over their size sweep."""
+    results = []
+    scaling = {}
+    
+    for name in names:
+        setup, unit, sizes = BENCHMARKS[name]
+        sizes = [s for s in sizes[sweep] if max_size is None or s <= max_size]
+        points = []
+        
+        for size in sizes:
+            try:
+                run = setup(size, seed)
+            except ImportError as e:
+                print(f"{name}: skipped ({e})", file=sys.stderr)
+                break
+            prepare = None
+            if isinstance(run, tuple):
+                prepare, run = run
+            
+            record = {'benchmark': name, 'size': size, 'unit': unit}
+            record.update(time_call(run, repeats, prepare))
+            record['per_item_seconds'] = record['seconds'] / size
+            results.append(record)
+            points.append((size, record['seconds']))
+            print(f"{name:<28} {unit:>8}={size:<10} {record['seconds']:10.4f}s", file=sys.stderr)
+        
+        # Log-log slope: ~1 linear, ~2 quadratic in the size unit
+        if len(points) >= 2:
+            sizes_, seconds = np.log(np.array(points)).T
+            scaling[name] = float(np.polyfit(sizes_, seconds, 1)[0])
+    
+    return {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'scipy': scipy.__version__,
+            'platform': platform.platform(),
+            'sweep': sweep,
+            'seed': seed
+        },
+        'results': results,
+        'scaling_exponents': scaling
+    }
+
+def check_regressions(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """Benchmark/size points more than `threshold` (relative) slower than baseline."""
+    reference = {(r['benchmark'], r['size']): r['seconds'] for r in baseline.get('results', [])}
+    regressions = []
+    
+    for record in current['results']:
+        base = reference.get((record['benchmark'], record['size']))
+        if base is None or base <= 0:
+            continue
+        ratio = record['seconds'] / base
+        if ratio > 1 + threshold:
+            regressions.append({'benchmark': record['benchmark'], 'size': record['size'],
+                                'baseline_seconds': base, 'seconds': record['seconds'],
+                                'ratio': ratio})
+    return regressions
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Codex 67 benchmark suite")
+    parser.add_argument('--benchmarks', nargs='+', choices=list(BENCHMARKS),
+                        default=list(BENCHMARKS), help='Benchmarks to run (default: all)')
+    parser.add_argument('--full', action='store_true',
+                        help='Full sweep: up to 10^5 sessions and 10^8 samples')
+    parser.add_argument('--max-size', type=int, help='Skip sizes above this')
+    parser.add_argument('--repeats', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='Write results JSON here (default: stdout)')
+    parser.add_argument('--baseline', help='Earlier results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='Allowed relative slowdown before a point counts as a regression')
+    args = parser.parse_args()
+    
+    report = run_suite(args.benchmarks, 'full' if args.full else 'default',
+                       args.repeats, args.seed, args.max_size)
+    
+    exit_code = 0
+    if args.baseline:
+        with open(args.baseline, 'r') as f:
+            baseline = json.load(f)
+        regressions = check_regressions(report, baseline, args.threshold)
+        report['regressions'] = regressions
+        report['regression_threshold'] = args.threshold
+        
+        for r in regressions:
+            print(f"REGRESSION {r['benchmark']} size={r['size']}: "
+                  f"{r['baseline_seconds']:.4f}s -> {r['seconds']:.4f}s ({r['ratio']:.2f}x)",
+                  file=sys.stderr)
+        if regressions:
+            exit_code = 1
+        else:
+            print(f"No regressions beyond {args.threshold:.0%}", file=sys.stderr)
+    
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+    
+    return exit_code
+
+if __name__ == "__main__":
+    sys.exit(main())
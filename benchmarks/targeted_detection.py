@@ -0,0 +1,55 @@
+"""
+TARGETED 0.67HZ DETECTION BENCHMARK
+Compares detect_frequency (full periodogram) with detect_frequency_targeted.
+"""
+
+import argparse
+import json
+import time
+import numpy as np
+from pathlib import Path
+import sys
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from benchmarks.generators import make_telemetry
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Targeted vs full-spectrum detection benchmark")
+    parser.add_argument('--samples', type=float, nargs='+', default=[1e6, 1e7],
+                        help='Series lengths (1e8 needs about 2.5 GB of RAM)')
+    parser.add_argument('--sampling-rate', type=float, default=10.0)
+    args = parser.parse_args()
+    
+    detector = ArchitectureFrequencyDetector()
+    
+    for n_samples in map(int, args.samples):
+        x = make_telemetry(n_samples, args.sampling_rate)
+        
+        start = time.perf_counter()
+        full = detector.detect_frequency(x, args.sampling_rate)
+        full_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        targeted = detector.detect_frequency_targeted(x, args.sampling_rate)
+        targeted_seconds = time.perf_counter() - start
+        
+        print(json.dumps({
+            'n_samples': n_samples,
+            'full_seconds': full_seconds,
+            'targeted_seconds': targeted_seconds,
+            'speedup': full_seconds / targeted_seconds,
+            'full_snr': float(full['snr']),
+            'targeted_snr': float(targeted['snr']),
+            'full_frequency': float(full['frequency_detected']),
+            'targeted_frequency': float(targeted['frequency_detected'])
+        }))
+        del x
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+TERMINOLOGY SCAN BENCHMARK
+Per-term regex scans versus one TerminologyMatcher pass.
+
+per_term  one word-bounded regex search of the transcript per term (timed
+          on --sample-terms terms and extrapolated to the full list)
+matcher   TerminologyMatcher built once, then streamed over the transcript
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+import numpy as np
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.terminology_matcher import TerminologyMatcher
+
+def make_transcript(n_words: int, terms: list, seed: int) -> list:
+    """Zipf-distributed filler words with terms mixed in, as 64k-word chunks."""
+    rng = np.random.default_rng(seed)
+    words = np.char.add('w', (rng.zipf(1.2, n_words) % 50000).astype(str)).astype(object)
+    inserted = rng.choice(n_words, n_words // 50, replace=False)
+    words[inserted] = rng.choice(np.array(terms, dtype=object), len(inserted))
+    return [' '.join(words[start:start + 65536]) + ' ' for start in range(0, n_words, 65536)]
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Per-term regex vs Aho-Corasick terminology scan")
+    parser.add_argument('--terms', type=int, default=5000)
+    parser.add_argument('--words', type=int, nargs='+', default=[10**5, 10**6])
+    parser.add_argument('--sample-terms', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    rng = np.random.default_rng(args.seed)
+    terms = [' '.join(f"term{t}" for t in rng.integers(0, args.terms, rng.integers(1, 4)))
+             for _ in range(args.terms)]
+    
+    start = time.perf_counter()
+    matcher = TerminologyMatcher(terms)
+    build_seconds = time.perf_counter() - start
+    
+    for n_words in args.words:
+        chunks = make_transcript(n_words, terms, args.seed)
+        
+        start = time.perf_counter()
+        result = matcher.scan_stream(chunks)
+        matcher_seconds = time.perf_counter() - start
+        
+        text = ''.join(chunks).lower()
+        sample = matcher.terms[:args.sample_terms]
+        start = time.perf_counter()
+        for term in sample:
+            re.findall(r'\b' + r'\W+'.join(map(re.escape, term.lower().split())) + r'\b', text)
+        per_term_seconds = (time.perf_counter() - start) * len(matcher) / len(sample)
+        
+        print(json.dumps({
+            'n_terms': len(matcher),
+            'n_words': result['n_words'],
+            'build_seconds': build_seconds,
+            'matcher_seconds': matcher_seconds,
+            'per_term_seconds_extrapolated': per_term_seconds,
+            'speedup': per_term_seconds / matcher_seconds,
+            'terms_matched': result['terms_matched']
+        }))
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
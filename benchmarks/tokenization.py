@@ -0,0 +1,90 @@
+"""
+TOKENIZE-ONCE BENCHMARK
+Time and memory per session of the text path versus token arrays.
+
+text_*   sessions stay lists of utterances; every call joins and splits
+         them again (extract_patterns / extract_fingerprints on text)
+token_*  sessions are converted once by PatternValidator.tokenize_corpus
+         and every later stage works on the int32 token arrays
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.generators import make_corpus
+from validation.pattern_completion import PatternValidator
+
+def measure(run, n_sessions: int) -> dict:
+    """Wall time and traced peak memory of a call, per session."""
+    # Timed without tracing, which would slow the Python-level paths most
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'us_per_session': elapsed / n_sessions * 1e6,
+        'peak_bytes_per_session': peak / n_sessions,
+        'result': result
+    }
+
+def text_bytes(corpus: dict) -> int:
+    """Bytes held by the utterance strings and their lists."""
+    return sum(sys.getsizeof(session) + sum(sys.getsizeof(u) for u in session)
+               for session in corpus.values())
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Tokenize-once time and memory per session")
+    parser.add_argument('--sessions', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--phrases', type=int, default=2000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+    
+    for n_sessions in args.sessions:
+        corpus = make_corpus(n_sessions, n_phrases=args.phrases, seed=args.seed, shared_fraction=0.5)
+        row = {'sessions': n_sessions, 'text_bytes_per_session': text_bytes(corpus) / n_sessions}
+        
+        for mode, use_fingerprints in [('md5', False), ('fingerprint', True)]:
+            text_validator = PatternValidator(use_fingerprints)
+            if use_fingerprints:
+                text_rows = lambda: [text_validator.extract_fingerprints(' '.join(s))
+                                     for s in corpus.values()]
+            else:
+                text_rows = lambda: [set(text_validator.extract_patterns(' '.join(s)))
+                                     for s in corpus.values()]
+            text = measure(text_rows, n_sessions)
+            
+            validator = PatternValidator(use_fingerprints)
+            tokenized = measure(lambda: validator.tokenize_corpus(corpus), n_sessions)
+            tokens = tokenized.pop('result')
+            token_rows = measure(lambda: validator.extract_pattern_rows(tokens), n_sessions)
+            
+            row[mode] = {
+                'text_rows_us_per_session': text['us_per_session'],
+                'text_rows_peak_bytes_per_session': text['peak_bytes_per_session'],
+                'tokenize_us_per_session': tokenized['us_per_session'],
+                'token_rows_us_per_session': token_rows['us_per_session'],
+                'token_rows_peak_bytes_per_session': token_rows['peak_bytes_per_session'],
+                'speedup': text['us_per_session'] / (tokenized['us_per_session']
+                                                     + token_rows['us_per_session'])
+            }
+        
+        row['token_bytes_per_session'] = sum(t.nbytes for t in tokens.values()) / n_sessions
+        row['vocabulary_size'] = len(validator.vocabulary)
+        print(json.dumps(row))
+    
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,143 @@
+"""Shared fixtures: seeded test data in the suite's input layout."""
+
+import itertools
+import sys
+import types
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+from scipy import signal, stats
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from benchmarks.generators import make_corpus, make_telemetry
+
+SAMPLING_RATE = 100.0
+
+def make_test_data(seed: int = 42, n_samples: int = 1267, snr_db: float = -10.0,
+                   n_sessions: int = 20) -> dict:
+    """Test data with all four sections, as load_test_data returns it."""
+    return {
+        'quantum_telemetry': {
+            'coherence_signal': make_telemetry(n_samples, SAMPLING_RATE, seed=seed,
+                                               snr_db=snr_db).tolist(),
+            'sampling_rate': SAMPLING_RATE
+        },
+        'pattern_data': {},
+        'conversation_data': {'conversations': list(make_corpus(n_sessions, seed=seed).values())},
+        'validation_transcript': 'The quantum pulse shows coherence oscillation in the lattice.'
+    }
+
+def baseline_pair_scores(corpus: dict) -> np.ndarray:
+    """Completion scores of the original all-pairs loop over MD5 pattern sets."""
+    from validation.pattern_completion import PatternValidator
+    validator = PatternValidator()
+    patterns = [set(validator.extract_patterns(' '.join(s))) for s in corpus.values()]
+    return np.array([len(a & b) / len(a | b) if a and b else 0.0
+                     for a, b in itertools.combinations(patterns, 2)])
+
+def baseline_detection(x: np.ndarray, sampling_rate: float, target: float = 0.67) -> dict:
+    """The original detect_frequency: periodogram, median floor, t-test without the target."""
+    frequencies, power = signal.periodogram(x, fs=sampling_rate)
+    target_idx = np.argmin(np.abs(frequencies - target))
+    noise_floor = np.median(power)
+    snr = power[target_idx] / noise_floor if noise_floor > 0 else 0
+    p_value = stats.ttest_1samp(np.delete(power, target_idx), power[target_idx])[1]
+    return {'frequency_detected': frequencies[target_idx], 'power': power[target_idx],
+            'snr': snr, 'p_value': p_value, 'significant': p_value < 0.05 and snr > 2.0}
+
+# ========== STAND-IN QUANTUM PATTERN VALIDATOR ==========
+
+class FakeValidationResult:
+    """The fields of ValidationResult that the full suite reads."""
+    
+    def __init__(self, claim_id: str, validated: bool, confidence: float,
+                 statistical_significance=None, meta_validation: bool = False):
+        self.claim_id = claim_id
+        self.validated = validated
+        self.confidence = confidence
+        self.statistical_significance = statistical_significance
+        self.meta_validation = meta_validation
+    
+    def to_dict(self) -> dict:
+        return {
+            'claim_id': self.claim_id,
+            'validated': self.validated,
+            'confidence': self.confidence,
+            'statistical_significance': self.statistical_significance,
+            'meta_validation': self.meta_validation
+        }
+
+class FakeQuantumPatternValidator:
+    """
+    Small QuantumPatternValidator with the real one's public API.
+    
+    Like the real validator it keeps every result in self.results, scores
+    QAL over all of them and draws its pulse bootstrap from the global
+    np.random, so leaked state and unseeded runs show up in the scores.
+    """
+    
+    def __init__(self, config=None):
+        self.config = config or {}
+        self.results = []
+    
+    def validate_quantum_pulse(self, telemetry: dict) -> FakeValidationResult:
+        x = np.asarray(telemetry.get('coherence_signal', []), dtype=float)
+        if len(x) < 100:
+            return FakeValidationResult('quantum_pulse_detection', False, 0.0)
+        
+        fs = telemetry.get('sampling_rate', SAMPLING_RATE)
+        frequencies, power = signal.periodogram(x, fs=fs)
+        target = int(np.argmin(np.abs(frequencies - 0.67)))
+        resampled = [signal.periodogram(np.random.choice(x, len(x)), fs=fs)[1][target]
+                     for _ in range(self.config.get('n_bootstrap', 20))]
+        p_value = float(np.mean(np.array(resampled) >= power[target]))
+        return FakeValidationResult('quantum_pulse_detection', p_value < 0.05,
+                                    1 - p_value, p_value)
+    
+    def validate_pattern_resonance(self, pattern_data: dict) -> FakeValidationResult:
+        return FakeValidationResult('pattern_resonance', bool(pattern_data), 0.5)
+    
+    def validate_vocabulary_sync(self, conversation_data: dict) -> FakeValidationResult:
+        vocabularies = [set(' '.join(c).split()) for c in conversation_data.get('conversations', [])]
+        if len(vocabularies) < 2:
+            return FakeValidationResult('vocabulary_synchronization', False, 0.0)
+        shared = set.intersection(*vocabularies)
+        sync = len(shared) / len(set.union(*vocabularies))
+        return FakeValidationResult('vocabulary_synchronization', sync > 0.65, sync)
+    
+    def detect_meta_validation(self, transcript: str) -> FakeValidationResult:
+        words = str(transcript).lower().split()
+        usage = len({'quantum', 'pulse', 'coherence', 'lattice'} & set(words)) / 4
+        return FakeValidationResult('meta_validation', usage > 0.5, usage,
+                                    meta_validation=True)
+    
+    def run_complete_validation(self, dataset: dict) -> dict:
+        self.results.append(self.validate_quantum_pulse(dataset.get('quantum_telemetry', {})))
+        self.results.append(self.validate_pattern_resonance(dataset.get('pattern_data', {})))
+        self.results.append(self.validate_vocabulary_sync(dataset.get('conversation_data', {})))
+        meta_result = self.detect_meta_validation(dataset.get('validation_transcript', ''))
+        self.results.append(meta_result)
+        
+        qal_score = float(np.mean([r.confidence for r in self.results]))
+        return {
+            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            'qal_score': qal_score,
+            'overall_validated': all(r.validated for r in self.results),
+            'meta_validated': any(r.meta_validation for r in self.results) or meta_result.validated,
+            'validation_level': 'STRONG' if qal_score >= 0.9 else 'WEAK',
+            'detailed_results': [r.to_dict() for r in self.results],
+            'paradigm_note': 'Stand-in validator for tests.'
+        }
+
+# The real module is not part of this tree; the suite imports it at load
+# time, so the stand-in is installed before any test imports the suite
+try:
+    import validation.quantum_pattern_validator  # noqa: F401
+except ImportError:
+    _fake_module = types.ModuleType('validation.quantum_pattern_validator')
+    _fake_module.QuantumPatternValidator = FakeQuantumPatternValidator
+    _fake_module.ValidationResult = FakeValidationResult
+    sys.modules['validation.quantum_pattern_validator'] = _fake_module
@@ -0,0 +1,147 @@
+"""ArchitectureFrequencyDetector: fast paths against their reference spectra."""
+
+import numpy as np
+import pytest
+from scipy import signal, stats
+
+from benchmarks.generators import make_telemetry
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from tests.conftest import SAMPLING_RATE, baseline_detection
+
+def test_multitaper_grid_resolves_target_on_short_series():
+    detector = ArchitectureFrequencyDetector()
+    x = make_telemetry(1267, SAMPLING_RATE, snr_db=-10)
+    
+    result = detector.detect_frequency_multitaper(x, SAMPLING_RATE)
+    assert SAMPLING_RATE / result['nfft'] <= detector.tolerance
+    assert abs(result['frequency_detected'] - detector.target_frequency) <= detector.tolerance
+    
+    spectrogram = detector.multitaper_spectrogram(x, SAMPLING_RATE, nperseg=128)
+    assert abs(spectrogram['frequency_detected'] - detector.target_frequency) <= detector.tolerance
+    assert spectrogram['half_bandwidth'] > detector.target_frequency
+
+def test_multitaper_matches_per_taper_periodograms():
+    detector = ArchitectureFrequencyDetector()
+    x = make_telemetry(1001, SAMPLING_RATE, seed=3)
+    tapers, ratios = signal.windows.dpss(len(x), 4.0, 7, return_ratios=True)
+    
+    expected = sum(
+        weight * signal.periodogram(x - x.mean(), fs=SAMPLING_RATE, window=taper, detrend=False)[1]
+        for taper, weight in zip(tapers, ratios / ratios.sum())
+    )
+    _, power = detector.multitaper_psd(x, SAMPLING_RATE, nfft=len(x))
+    np.testing.assert_allclose(power, expected, rtol=1e-9, atol=1e-15)
+
+def test_stream_padding_matches_welch():
+    detector = ArchitectureFrequencyDetector()
+    x = make_telemetry(20000, SAMPLING_RATE, seed=5)
+    nfft = detector.target_nfft(1024, SAMPLING_RATE)
+    
+    result = detector.detect_frequency_stream(x, SAMPLING_RATE, nperseg=1024, nfft=nfft)
+    frequencies, power = signal.welch(x, fs=SAMPLING_RATE, nperseg=1024, nfft=nfft)
+    target_idx = np.argmin(np.abs(frequencies - detector.target_frequency))
+    assert result['frequency_detected'] == pytest.approx(frequencies[target_idx])
+    assert result['power'] == pytest.approx(power[target_idx], rel=1e-9)
+    assert abs(result['frequency_detected'] - detector.target_frequency) <= detector.tolerance
+
+def test_targeted_band_matches_direct_dft():
+    detector = ArchitectureFrequencyDetector()
+    x = make_telemetry(5000, SAMPLING_RATE, snr_db=-10) + 3.0
+    
+    result = detector.detect_frequency_targeted(x, SAMPLING_RATE)
+    band = np.arange(detector.target_frequency - detector.tolerance,
+                     detector.target_frequency + detector.tolerance + detector.tolerance / 20,
+                     detector.tolerance / 10)
+    k = np.arange(len(x))
+    spectrum = np.exp(-2j * np.pi * np.outer(band, k) / SAMPLING_RATE) @ (x - x.mean())
+    power = 2 * np.abs(spectrum) ** 2 / (SAMPLING_RATE * len(x))
+    assert result['frequency_detected'] == pytest.approx(band[np.argmax(power)])
+    assert result['power'] == pytest.approx(power.max(), rel=1e-9)
+
+@pytest.mark.parametrize('n_samples, kwargs, message', [
+    (0, {}, 'more than 2 \\* nw'),
+    (5, {}, 'more than 2 \\* nw'),
+    (500, {'nperseg': 0}, 'nperseg must be positive'),
+    (500, {'nperseg': 64, 'noverlap': 64}, 'noverlap')
+])
+def test_spectrogram_rejects_unusable_windows(n_samples, kwargs, message):
+    detector = ArchitectureFrequencyDetector()
+    with pytest.raises(ValueError, match=message):
+        detector.multitaper_spectrogram(np.ones(n_samples), SAMPLING_RATE, **kwargs)
+
+@pytest.mark.parametrize('tone', [1e8, 1e10])
+def test_significance_with_strong_in_band_tone(tone):
+    detector = ArchitectureFrequencyDetector()
+    rng = np.random.default_rng(4)
+    power = rng.exponential(1.0, (3, 2048))
+    target_idx, exclusion_bins = 700, 3
+    low, high = target_idx - exclusion_bins, target_idx + exclusion_bins + 1
+    power[:, low:high] = tone
+    power[:, target_idx] = [1.0, 1.3, 2.5]
+    
+    p_values = detector.calculate_significance(power, target_idx, exclusion_bins)
+    background = np.delete(power, np.arange(low, high), axis=-1)
+    for row, p_value in enumerate(p_values):
+        expected = stats.ttest_1samp(background[row], power[row, target_idx]).pvalue
+        assert p_value == pytest.approx(expected, rel=1e-9)
+
+def test_targeted_background_agrees_with_full_path_on_red_noise():
+    detector = ArchitectureFrequencyDetector()
+    rng = np.random.default_rng(8)
+    n = 1 << 18
+    t = np.arange(n) / SAMPLING_RATE
+    x = signal.lfilter([1.0], [1.0, -0.99], rng.standard_normal(n))
+    x += 0.05 * np.sin(2 * np.pi * detector.target_frequency * t)
+    
+    full = detector.detect_frequency(x, SAMPLING_RATE)
+    targeted = detector.detect_frequency_targeted(x, SAMPLING_RATE, background_length=1 << 14)
+    assert targeted['background_bins'] < n // 2
+    assert (targeted['power'] / targeted['snr']) == pytest.approx(full['power'] / full['snr'], rel=0.05)
+    assert targeted['significant'] == full['significant']
+
+def test_stream_chunks_and_memmap_match_welch(tmp_path):
+    detector = ArchitectureFrequencyDetector()
+    x = make_telemetry(30000, SAMPLING_RATE, seed=6)
+    path = tmp_path / 'telemetry.npy'
+    np.save(path, x)
+    cuts = np.sort(np.random.default_rng(1).integers(0, len(x), 12))
+    
+    results = [detector.detect_frequency_stream(source, SAMPLING_RATE, nperseg=1024,
+                                                track_target=True)
+               for source in (x, iter(np.split(x, cuts)), path)]
+    
+    frequencies, power = signal.welch(x, fs=SAMPLING_RATE, nperseg=1024)
+    _, _, segments = signal.spectrogram(x, fs=SAMPLING_RATE, window='hann', nperseg=1024,
+                                        noverlap=512, detrend='constant')
+    target_idx = np.argmin(np.abs(frequencies - detector.target_frequency))
+    for result in results:
+        assert result['n_segments'] == segments.shape[1]
+        assert result['power'] == pytest.approx(power[target_idx], rel=1e-9)
+        np.testing.assert_allclose(result['target_power_series'], segments[target_idx], rtol=1e-9)
+        assert result['p_value'] == pytest.approx(results[0]['p_value'], rel=1e-9)
+
+@pytest.mark.parametrize('axis', [-1, 0])
+def test_batch_matches_baseline_per_channel(axis):
+    detector = ArchitectureFrequencyDetector()
+    matrix = np.stack([make_telemetry(3000, SAMPLING_RATE, seed=seed, snr_db=snr_db)
+                       for seed, snr_db in [(1, -30), (2, -10), (3, 0), (4, 10)]])
+    
+    columns = detector.detect_frequency_batch(matrix if axis == -1 else matrix.T,
+                                              SAMPLING_RATE, axis=axis)
+    for channel, x in enumerate(matrix):
+        expected = baseline_detection(x, SAMPLING_RATE)
+        for key, value in expected.items():
+            assert columns[key][channel] == pytest.approx(value, rel=1e-9), key
+
+def test_plan_cache_matches_baseline_across_lengths():
+    # A two-plan cache cycles through evictions and reuses of stale buffers
+    detector = ArchitectureFrequencyDetector(plan_cache_size=2)
+    inputs = [(make_telemetry(n, fs, seed=n), fs)
+              for n, fs in [(1000, 100.0), (1500, 100.0), (1000, 50.0), (2048, 100.0)]]
+    
+    for _ in range(2):
+        for x, fs in inputs:
+            result = detector.detect_frequency(x, fs)
+            for key, value in baseline_detection(x, fs).items():
+                assert result[key] == pytest.approx(value, rel=1e-9), key
+    assert len(detector._plans) == 2
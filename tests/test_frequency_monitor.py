@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from validation.frequency_monitor import SlidingFrequencyMonitor
+from tests.conftest import SAMPLING_RATE
+
+def test_events_keep_only_the_latest_crossings():
+    # Target bursts separated by silence give an onset and offset per burst
+    t = np.arange(int(150 * SAMPLING_RATE)) / SAMPLING_RATE
+    burst = np.sin(2 * np.pi * 0.67 * t)
+    rng = np.random.default_rng(0)
+    x = np.concatenate([np.r_[burst, 0.01 * rng.standard_normal(len(t))] for _ in range(4)])
+    
+    seen = []
+    unbounded = SlidingFrequencyMonitor(SAMPLING_RATE, window_seconds=100, max_events=None)
+    bounded = SlidingFrequencyMonitor(SAMPLING_RATE, window_seconds=100, max_events=3,
+                                      callback=seen.append)
+    unbounded.update(x)
+    bounded.update(x)
+    
+    assert len(unbounded.events) > 3
+    assert seen == list(unbounded.events)
+    assert list(bounded.events) == list(unbounded.events)[-3:]
+
+def test_rejects_windows_coarser_than_tolerance():
+    with pytest.raises(ValueError, match='tolerance'):
+        SlidingFrequencyMonitor(SAMPLING_RATE, window_seconds=20)
+
+@pytest.mark.parametrize('n_samples', [3000, 12000])
+def test_window_power_matches_detector_on_same_window(n_samples):
+    # The targeted band on the monitor's bin grid; while the window fills
+    # a large offset leaks into its bins unless each window is detrended
+    detector = ArchitectureFrequencyDetector()
+    rng = np.random.default_rng(2)
+    t = np.arange(n_samples) / SAMPLING_RATE
+    x = 50.0 + np.sin(2 * np.pi * 0.6735 * t) + rng.standard_normal(n_samples)
+    
+    monitor = SlidingFrequencyMonitor(SAMPLING_RATE, window_seconds=100, detector=detector)
+    state = monitor.update(x)
+    expected = detector.detect_frequency_targeted(x[-monitor.window_length:], SAMPLING_RATE,
+                                                  resolution=monitor.resolution)
+    assert state['frequency_detected'] == pytest.approx(expected['frequency_detected'])
+    assert state['power_at_target'] == pytest.approx(expected['power'], rel=1e-6)
@@ -0,0 +1,161 @@
+"""Full suite regression tests: batch against single runs, cached against uncached."""
+
+import json
+from contextlib import redirect_stdout
+from io import StringIO
+
+import pytest
+
+from validation.full_validation import Codex67FullValidator, run_batch
+from tests.conftest import make_test_data
+
+SUMMARY_KEYS = ['qal_score', 'validation_level', 'overall_validated', 'meta_validated']
+
+def run_single(input_path: str, **config) -> dict:
+    """One run of the suite on a fresh validator."""
+    validator = Codex67FullValidator()
+    validator.config.update({'generate_report': False, 'use_cache': False, **config})
+    validator.cache.enabled = validator.config['use_cache']
+    with redirect_stdout(StringIO()):
+        return validator.run_validation(validator.load_test_data(input_path))
+
+@pytest.fixture
+def inputs(tmp_path):
+    """Four inputs alternating weak and strong 0.67Hz components."""
+    paths = []
+    for i, snr_db in enumerate([-30, 10, -30, 10]):
+        path = tmp_path / f"input_{i}.json"
+        path.write_text(json.dumps(make_test_data(seed=i, snr_db=snr_db)))
+        paths.append(str(path))
+    return paths
+
+def test_batch_matches_single_runs(inputs, tmp_path):
+    # One worker sees every input, so any state kept between inputs shows up
+    with redirect_stdout(StringIO()):
+        records = run_batch(inputs, str(tmp_path / 'reports'), n_workers=1,
+                            overrides={'use_cache': False})
+    
+    for record in records:
+        assert record['error'] is None
+        single = run_single(record['input'])
+        for key in SUMMARY_KEYS:
+            assert record[key] == single[key], (record['input'], key)
+        
+        with open(record['report']) as f:
+            report = json.load(f)
+        assert len(report['detailed_results']) == len(single['detailed_results'])
+
+def test_advanced_pulse_refuses_unresolved_target():
+    validator = Codex67FullValidator()
+    validator.cache.enabled = False
+    
+    # 1267 samples give 128-sample windows, whose leakage band covers 0.67Hz
+    short = validator._advanced_pulse_analysis(make_test_data()['quantum_telemetry'])
+    assert short['multitaper_analysis']['applicable'] is False
+    assert 'significant' not in short['multitaper_analysis']
+    
+    long = validator._advanced_pulse_analysis(make_test_data(n_samples=50000)['quantum_telemetry'])
+    analysis = long['multitaper_analysis']
+    assert analysis['applicable'] is True
+    assert analysis['frequency_resolution'] <= 0.01
+    assert abs(analysis['frequency_detected'] - 0.67) <= 0.01
+
+def test_bootstrap_spectral_power_on_target_bin():
+    validator = Codex67FullValidator()
+    validator.cache.enabled = False
+    validator.config['bootstrap_iterations'] = 200
+    
+    short = validator._run_bootstrap(make_test_data())
+    assert short['spectral_power']['applicable'] is False
+    
+    spectral = validator._run_bootstrap(make_test_data(n_samples=50000))['spectral_power']
+    assert spectral['applicable'] is True
+    assert abs(spectral['frequency'] - 0.67) <= 0.01
+
+def test_basic_suite_cached_as_reported(tmp_path, monkeypatch):
+    reports = []
+    validator_class = type(Codex67FullValidator().validator)
+    original = validator_class.run_complete_validation
+    def recorded(self, dataset):
+        reports.append(original(self, dataset))
+        return reports[-1]
+    monkeypatch.setattr(validator_class, 'run_complete_validation', recorded)
+    
+    def run() -> dict:
+        validator = Codex67FullValidator()
+        validator.config.update({'generate_report': False, 'bootstrap_iterations': 0})
+        validator.cache = type(validator.cache)(tmp_path)
+        with redirect_stdout(StringIO()):
+            validator.run_validation(make_test_data())
+        return validator.results['basic']
+    
+    first, cached = run(), run()
+    # The public report is stored whole, paradigm_note included
+    assert len(reports) == 1
+    assert first == reports[0]
+    assert cached == reports[0]
+
+def test_terminology_scan_leaves_verdict_unchanged(tmp_path):
+    path = tmp_path / 'input.json'
+    path.write_text(json.dumps({**make_test_data(), 'validation_transcript': ' '.join(
+        ['quantum pulse coherence architecture frequency pattern resonance'] * 50)}))
+    
+    # The scan's own verdict flips with the threshold; the suite's must not
+    usage = run_single(str(path))['terminology']['terminology_usage']
+    above = run_single(str(path), meta_terminology_threshold=usage)
+    below = run_single(str(path), meta_terminology_threshold=usage + 1e-9)
+    assert above['terminology_meta_validated'] is True
+    assert below['terminology_meta_validated'] is False
+    for key in SUMMARY_KEYS:
+        assert above[key] == below[key], key
+
+def test_cached_run_matches_uncached(tmp_path):
+    # Run-specific fields; everything else must come back unchanged
+    volatile = {'report_id', 'timestamp', 'config_used', 'cache', 'timings'}
+    test_data = make_test_data(n_samples=5000)
+    
+    def run(use_cache: bool) -> dict:
+        validator = Codex67FullValidator()
+        validator.config.update({'generate_report': False, 'use_cache': use_cache,
+                                 'bootstrap_iterations': 100, 'n_jobs': 1})
+        validator.cache = type(validator.cache)(tmp_path)
+        validator.cache.enabled = use_cache
+        with redirect_stdout(StringIO()):
+            return validator.run_validation(test_data, run_advanced=True,
+                                            run_cross_validation=True)
+    
+    uncached = run(False)
+    run(True)
+    cached = run(True)
+    assert cached['cache']['hits'] > 0 and cached['cache']['misses'] == 0
+    assert set(cached) == set(uncached)
+    for key in set(uncached) - volatile:
+        assert cached[key] == uncached[key], key
+
+def test_fold_scores_independent_of_n_jobs():
+    # A buried pulse leaves the stand-in's bootstrap p-value to the RNG
+    scores = []
+    for n_jobs in (1, 5):
+        validator = Codex67FullValidator()
+        validator.config.update({'n_splits': 5, 'n_jobs': n_jobs})
+        with redirect_stdout(StringIO()):
+            scores.append(validator._run_cross_validation(make_test_data(snr_db=-40)))
+    assert scores[0]['qal_scores'] == scores[1]['qal_scores']
+    assert scores[0]['validation_statuses'] == scores[1]['validation_statuses']
+
+@pytest.mark.parametrize('change', [
+    {'bootstrap_iterations': 50}, {'n_jobs': 3}, {'meta_terms': ['lattice']},
+    {'meta_terminology_threshold': 0.9}
+])
+def test_basic_suite_cache_ignores_unread_config(tmp_path, change):
+    def basic_hits(**config) -> int:
+        validator = Codex67FullValidator()
+        validator.config.update({'generate_report': False, 'bootstrap_iterations': 0, **config})
+        validator.cache = type(validator.cache)(tmp_path)
+        with redirect_stdout(StringIO()):
+            validator.run_validation(make_test_data())
+        return validator.cache.hits
+    
+    basic_hits()
+    assert basic_hits(**change) >= 1
+    assert basic_hits(random_seed=7) == 0
@@ -0,0 +1,38 @@
+"""IncrementalCompletionScorer: any update sequence against scoring the final corpus."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from benchmarks.generators import make_corpus
+from validation.incremental_completion import IncrementalCompletionScorer
+from validation.pattern_completion import PatternValidator
+
+def baseline_mean(corpus: dict) -> float:
+    """Mean of the original all-pairs loop over MD5 pattern sets."""
+    validator = PatternValidator()
+    patterns = [set(validator.extract_patterns(' '.join(s))) for s in corpus.values()]
+    return float(np.mean([len(a & b) / len(a | b) if a and b else 0.0
+                          for a, b in itertools.combinations(patterns, 2)]))
+
+def test_updates_match_scoring_from_scratch(tmp_path):
+    corpus = make_corpus(30, n_phrases=20, phrases_per_session=5, seed=11, shared_fraction=0.6)
+    items = list(corpus.items())
+    scorer = IncrementalCompletionScorer()
+    
+    scorer.add_sessions(dict(items[:12]))
+    scorer.add_sessions(dict(items[12:20]))
+    scorer.remove_sessions(['session_3', 'session_15'])
+    scorer.save(tmp_path / 'state.npz')
+    scorer = IncrementalCompletionScorer.load(tmp_path / 'state.npz')
+    scorer.add_sessions(dict(items[20:]))
+    scorer.remove_sessions(['session_25'])
+    
+    final = {s: session for s, session in items if s not in {'session_3', 'session_15', 'session_25'}}
+    assert scorer.n_sessions == len(final)
+    assert scorer.mean_completion() == pytest.approx(baseline_mean(final), rel=1e-12)
+    
+    fresh = IncrementalCompletionScorer()
+    fresh.add_sessions(final)
+    assert scorer.mean_completion() == fresh.mean_completion()
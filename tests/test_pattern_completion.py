@@ -0,0 +1,103 @@
+"""PatternValidator: indexed and parallel scoring against the all-pairs loop."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from benchmarks.generators import make_corpus
+from validation import pattern_completion
+from validation.pattern_completion import PatternValidator, _build_postings, _count_shared_patterns
+
+def baseline_completion(validator: PatternValidator, session_a, session_b) -> float:
+    """The original calculate_completion: MD5 pattern sets of the joined text."""
+    patterns_a = set(validator.extract_patterns(' '.join(session_a)))
+    patterns_b = set(validator.extract_patterns(' '.join(session_b)))
+    if not patterns_a or not patterns_b:
+        return 0.0
+    return len(patterns_a & patterns_b) / len(patterns_a | patterns_b)
+
+def all_pairs_scores(validator: PatternValidator, corpus: dict) -> np.ndarray:
+    """The baseline: calculate_completion on every pair in corpus order."""
+    sessions = list(corpus.values())
+    return np.array([validator.calculate_completion(a, b)
+                     for a, b in itertools.combinations(sessions, 2)])
+
+@pytest.mark.parametrize('use_fingerprints', [False, True])
+def test_parallel_tiles_match_all_pairs(use_fingerprints):
+    corpus = make_corpus(40, n_phrases=30, phrases_per_session=6, seed=2, shared_fraction=0.5)
+    expected = all_pairs_scores(PatternValidator(use_fingerprints), corpus)
+    
+    for n_workers in (1, 3):
+        scores = PatternValidator(use_fingerprints, n_workers=n_workers).completion_scores(corpus)
+        np.testing.assert_allclose(scores, expected, rtol=1e-12)
+
+def test_cross_block_counts(monkeypatch):
+    rng = np.random.default_rng(5)
+    rows = [np.unique(rng.integers(0, 40, 12)) for _ in range(9)]
+    split = 4
+    
+    # Tiny chunks so the running merge folds many partial counts
+    monkeypatch.setattr(pattern_completion, 'PAIR_CHUNK_SIZE', 3)
+    codes, counts = _count_shared_patterns(_build_postings(rows, np.arange(9)), 9, split)
+    
+    expected = {i * 9 + j: len(np.intersect1d(rows[i], rows[j]))
+                for i in range(split) for j in range(split, 9)}
+    expected = {code: count for code, count in expected.items() if count}
+    assert codes.tolist() == sorted(expected)
+    assert counts.tolist() == [expected[code] for code in sorted(expected)]
+
+def test_inverted_index_matches_baseline_pair_loop():
+    corpus = make_corpus(25, n_phrases=20, phrases_per_session=5, seed=1, shared_fraction=0.6)
+    corpus.update({'empty': [], 'short': ['two words'], 'repeat': ['a b c a b c a b c']})
+    validator = PatternValidator()
+    sessions = list(corpus.values())
+    expected = np.array([baseline_completion(validator, a, b)
+                         for a, b in itertools.combinations(sessions, 2)])
+    
+    np.testing.assert_allclose(validator.completion_scores(corpus), expected, rtol=1e-12)
+    rows, cols, _ = validator.score_pairs(corpus)
+    assert len(rows) == np.count_nonzero(expected)
+    
+    validator.validation_threshold = expected.mean() - 1e-9
+    assert validator.validate_architecture(corpus)
+    validator.validation_threshold = expected.mean() + 1e-9
+    assert not validator.validate_architecture(corpus)
+
+def test_fingerprints_match_md5_patterns():
+    corpus = make_corpus(15, n_phrases=20, phrases_per_session=5, seed=9, shared_fraction=0.6)
+    validator = PatternValidator(use_fingerprints=True)
+    
+    for session in corpus.values():
+        text = ' '.join(session)
+        assert len(validator.extract_fingerprints(text)) == len(set(validator.extract_patterns(text)))
+        assert validator.audit_fingerprints(text)['collision_free']
+    
+    # Without collisions the pattern sets, and so the scores, are the same
+    sessions = list(corpus.values())
+    for a, b in itertools.combinations(sessions, 2):
+        assert validator.calculate_completion(a, b) == pytest.approx(
+            baseline_completion(validator, a, b), rel=1e-12)
+
+@pytest.mark.parametrize('use_fingerprints', [False, True])
+def test_pretokenized_sessions_match_raw_and_baseline(use_fingerprints):
+    corpus = make_corpus(12, n_phrases=15, phrases_per_session=4, seed=13, shared_fraction=0.6)
+    corpus['spaced'] = ['  term1   term2 term3\tterm4 ', 'term5']
+    validator = PatternValidator(use_fingerprints)
+    tokenized = validator.tokenize_corpus(corpus)
+    
+    for a, b in itertools.combinations(corpus, 2):
+        raw = validator.calculate_completion(corpus[a], corpus[b])
+        assert validator.calculate_completion(tokenized[a], tokenized[b]) == raw
+        assert validator.calculate_completion(tokenized[a], corpus[b]) == raw
+        assert raw == pytest.approx(baseline_completion(validator, corpus[a], corpus[b]), rel=1e-12)
+
+def test_reset_vocabulary_keeps_scores():
+    corpus = make_corpus(6, seed=14)
+    validator = PatternValidator(use_fingerprints=True)
+    before = validator.completion_scores(corpus)
+    assert len(validator.vocabulary) > 0
+    
+    validator.reset_vocabulary()
+    assert len(validator.vocabulary) == 0
+    np.testing.assert_array_equal(validator.completion_scores(corpus), before)
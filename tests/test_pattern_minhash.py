@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from benchmarks.generators import make_corpus
+from validation.pattern_completion import PatternValidator
+from validation.pattern_minhash import MinHashPatternEstimator
+
+@pytest.mark.parametrize('use_fingerprints', [False, True])
+def test_token_arrays_give_the_same_signatures(use_fingerprints):
+    corpus = make_corpus(20, seed=3)
+    estimator = MinHashPatternEstimator(PatternValidator(use_fingerprints=use_fingerprints))
+    
+    _, from_text = estimator.signatures(corpus)
+    _, from_tokens = estimator.signatures(estimator.validator.tokenize_corpus(corpus))
+    assert np.array_equal(from_text, from_tokens)
+
+def test_estimates_within_error_bound_of_exact_jaccard():
+    corpus = make_corpus(30, n_phrases=14, phrases_per_session=8, seed=4)
+    validator = PatternValidator(use_fingerprints=True)
+    estimator = MinHashPatternEstimator(validator, n_signatures=256)
+    _, signatures = estimator.signatures(corpus)
+    
+    exact = validator.completion_scores(corpus)
+    rows, cols = np.triu_indices(len(corpus), 1)
+    estimates = np.array([estimator.estimate_completion(signatures[i], signatures[j])
+                          for i, j in zip(rows, cols)])
+    
+    # Each estimate is within the 95% bound with probability at least 0.95
+    bound = estimator.error_bound(0.95)
+    assert np.mean(np.abs(estimates - exact) > bound) <= 0.05
+    assert abs(estimator.estimate_mean_completion(corpus)['mean_score'] - exact.mean()) <= bound
+
+def test_lsh_candidates_recall_similar_pairs():
+    # Unrelated sessions, plus near-copies of the first ten with one phrase replaced
+    corpus = make_corpus(40, phrases_per_session=20, seed=6, shared_fraction=0.0)
+    fresh = make_corpus(10, phrases_per_session=1, seed=7, shared_fraction=0.0)
+    for i, replacement in enumerate(fresh.values()):
+        corpus[f"copy_{i}"] = corpus[f"session_{i}"][:-1] + replacement
+    
+    validator = PatternValidator(use_fingerprints=True)
+    estimator = MinHashPatternEstimator(validator, n_signatures=128, n_bands=32)
+    _, signatures = estimator.signatures(corpus)
+    candidates = set(zip(*estimator.candidate_pairs(signatures)))
+    
+    exact = validator.completion_scores(corpus)
+    rows, cols = np.triu_indices(len(corpus), 1)
+    similar = {(i, j) for i, j, score in zip(rows, cols, exact) if score >= 0.7}
+    assert len(similar) == 10
+    assert similar <= candidates
+    assert len(candidates) < len(exact) // 10
@@ -0,0 +1,36 @@
+import json
+
+import numpy as np
+import pytest
+
+from validation.report_writer import ReportWriter
+
+def test_non_numeric_arrays_match_json(tmp_path):
+    report = {
+        'terms': np.array(['pulse', 'lattice']),
+        'mixed': np.array([1, 'two', None, {'three': 3.0}], dtype=object),
+        'grid': np.array([['a', 'b'], ['c', 'd']]),
+        'empty': np.array([], dtype=object),
+        'scalar': np.array(0.67),
+        'powers': np.arange(3.0)
+    }
+    expected = {
+        'terms': ['pulse', 'lattice'],
+        'mixed': [1, 'two', None, {'three': 3.0}],
+        'grid': [['a', 'b'], ['c', 'd']],
+        'empty': [],
+        'scalar': 0.67,
+        'powers': [0.0, 1.0, 2.0]
+    }
+    
+    writer = ReportWriter(tmp_path, formats=('pretty', 'compact', 'ndjson'))
+    paths = writer.write(report, 'report')
+    for name in ('pretty', 'compact'):
+        with open(paths[name]) as f:
+            assert json.load(f) == expected
+    with open(paths['ndjson']) as f:
+        assert {k: v for line in f for k, v in json.loads(line).items()} == expected
+
+def test_complex_array_is_not_serializable(tmp_path):
+    with pytest.raises(TypeError):
+        ReportWriter(tmp_path).write({'spectrum': np.array([1 + 2j, 3j])}, 'report')
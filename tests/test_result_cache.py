@@ -0,0 +1,71 @@
+"""ResultCache: cached results equal recomputed ones, under concurrent writers."""
+
+import threading
+
+import numpy as np
+
+from validation.result_cache import ResultCache, source_digest
+
+def test_cached_equals_uncached(tmp_path):
+    cache = ResultCache(tmp_path)
+    inputs = ({'signal': np.arange(1000.0)}, {'n_splits': 5})
+    compute = lambda: {'scores': np.linspace(0, 1, 50), 'mean': 0.5}
+    
+    first = cache.get_or_compute('component', inputs, compute)
+    second = cache.get_or_compute('component', inputs, compute)
+    assert (cache.misses, cache.hits) == (1, 1)
+    np.testing.assert_array_equal(first['scores'], second['scores'])
+    assert first['mean'] == second['mean']
+
+def test_concurrent_writers_of_one_key(tmp_path):
+    # Several caches on one directory, as batch workers share it
+    key = ResultCache(tmp_path).key('completion_scores', {'conversations': [['a b c']]})
+    value = np.arange(100000.0)
+    errors = []
+    
+    def write():
+        cache = ResultCache(tmp_path)
+        try:
+            for _ in range(20):
+                cache.put(key, value)
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=write) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert errors == []
+    hit, stored = ResultCache(tmp_path).get(key)
+    assert hit
+    np.testing.assert_array_equal(stored, value)
+    assert list(tmp_path.glob('*.tmp')) == []
+
+def test_eviction_skips_entries_removed_meanwhile(tmp_path, monkeypatch):
+    cache = ResultCache(tmp_path, max_bytes=1)
+    cache.put(cache.key('a'), np.zeros(10))
+    
+    # Another worker unlinks an entry between the listing and its stat
+    vanished = tmp_path / 'vanished.pkl'
+    listed = list(tmp_path.glob('*.pkl')) + [vanished]
+    monkeypatch.setattr(type(tmp_path), 'glob', lambda self, pattern: iter(listed))
+    cache._evict()
+    assert not any(p.exists() for p in listed)
+
+def test_keys_salted_by_source_digest(tmp_path):
+    sources = tmp_path / 'src'
+    sources.mkdir()
+    (sources / 'module.py').write_text('VALUE = 1\n')
+    before = source_digest(sources)
+    source_digest.cache_clear()
+    (sources / 'module.py').write_text('VALUE = 2\n')
+    after = source_digest(sources)
+    source_digest.cache_clear()
+    assert before != after
+    
+    inputs = ({'signal': np.arange(10.0)},)
+    assert ResultCache(tmp_path, salt=before).key('component', *inputs) != \
+        ResultCache(tmp_path, salt=after).key('component', *inputs)
+    assert ResultCache(tmp_path).salt == source_digest()
@@ -0,0 +1,122 @@
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from validation.pattern_completion import PatternValidator
+from validation.service import ValidationService, _completion_group
+from tests.conftest import baseline_detection
+
+async def http_request(port: int, method: str, path: str, payload=None,
+                       content_length: int = None):
+    """
+    One request on its own connection; returns (status, headers, JSON body).
+    
+    A content_length is announced without sending a body.
+    """
+    body = json.dumps(payload).encode() if payload is not None else b''
+    if content_length is None:
+        content_length = len(body)
+    else:
+        body = b''
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write((f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n"
+                  f"Content-Length: {content_length}\r\nConnection: close\r\n\r\n").encode()
+                 + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    
+    head, _, content = response.partition(b'\r\n\r\n')
+    status_line, *header_lines = head.decode('latin-1').split('\r\n')
+    headers = dict(line.split(': ', 1) for line in header_lines)
+    return int(status_line.split()[1]), headers, json.loads(content)
+
+def test_completion_group_matches_single_pairs():
+    pairs = [
+        (['the quantum pulse holds', 'coherence in the lattice'], ['the quantum pulse holds steady']),
+        (['a b c d e f'], ['a b c d e g']),
+        (['one two'], ['one two three'])
+    ]
+    expected = [PatternValidator(use_fingerprints=True).calculate_completion(a, b) for a, b in pairs]
+    
+    assert _completion_group(pairs) == expected
+    # Scores do not depend on what earlier batches interned
+    assert _completion_group(pairs[::-1]) == expected[::-1]
+
+def test_http_round_trip():
+    rng = np.random.default_rng(0)
+    signals = rng.standard_normal((4, 512))
+    signals[0] = 0.0  # Flat signal: undefined p-value
+    
+    async def scenario():
+        service = ValidationService(port=0, n_workers=0, max_delay=0.05,
+                                    max_pending=4, max_body_bytes=1 << 16)
+        port = await service.start()
+        try:
+            # Concurrent requests of one rate and length share a batch
+            detections = await asyncio.gather(*(
+                http_request(port, 'POST', '/api/v1/quantum-pulse/detect',
+                             {'signal': x.tolist(), 'sampling_rate': 100.0})
+                for x in signals
+            ))
+            _, _, metrics = await http_request(port, 'GET', '/api/v1/metrics')
+            
+            # A request arriving while max_pending items wait is refused
+            waiting = asyncio.ensure_future(http_request(
+                port, 'POST', '/api/v1/pattern/resonance',
+                {'pairs': [[['a b c'], ['a b d']]] * 4}))
+            while service.pending < 4:
+                await asyncio.sleep(0.001)
+            busy = await http_request(port, 'POST', '/api/v1/pattern/resonance',
+                                      {'session_a': ['a b'], 'session_b': ['a b']})
+            accepted = await waiting
+            
+            too_many = await http_request(port, 'POST', '/api/v1/pattern/resonance',
+                                          {'pairs': [[['a'], ['b']]] * 5})
+            too_large = await http_request(port, 'POST', '/api/v1/quantum-pulse/detect',
+                                           content_length=2 << 16)
+        finally:
+            await service.stop()
+        return detections, metrics, busy, accepted, too_many, too_large
+    
+    detections, metrics, busy, accepted, too_many, too_large = asyncio.run(scenario())
+    
+    detector = ArchitectureFrequencyDetector()
+    for (status, _, result), x in zip(detections, signals):
+        assert status == 200
+        expected = detector.detect_frequency(x, 100.0)
+        assert result['power'] == pytest.approx(expected['power'])
+        assert result['significant'] == expected['significant']
+    assert detections[0][2]['p_value'] is None
+    assert metrics['batch_sizes'] == {'4': 1}
+    
+    status, headers, _ = busy
+    assert status == 503 and headers['Retry-After'] == '1'
+    assert accepted[0] == 200 and len(accepted[2]['completion_scores']) == 4
+    assert too_many[0] == 413
+    assert too_large[0] == 413
+
+def test_thread_mode_interleaved_lengths_match_baseline():
+    # One shared detector and its plan buffers serve every batch in thread mode
+    rng = np.random.default_rng(3)
+    signals = [rng.standard_normal(n) for n in (500, 800, 500, 1200, 800, 500)]
+    
+    async def scenario():
+        service = ValidationService(port=0, n_workers=0, max_delay=0.01)
+        port = await service.start()
+        try:
+            return await asyncio.gather(*(
+                http_request(port, 'POST', '/api/v1/quantum-pulse/detect',
+                             {'signal': x.tolist(), 'sampling_rate': 100.0})
+                for x in signals
+            ))
+        finally:
+            await service.stop()
+    
+    for (status, _, result), x in zip(asyncio.run(scenario()), signals):
+        assert status == 200
+        for key, value in baseline_detection(x, 100.0).items():
+            assert result[key] == pytest.approx(value, rel=1e-9), key
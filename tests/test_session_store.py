@@ -0,0 +1,29 @@
+"""SessionStore: block-wise scoring from disk against the in-memory corpus."""
+
+import pytest
+
+from benchmarks.generators import make_corpus
+from validation.pattern_completion import PatternValidator
+from validation.session_store import SessionStore, BYTES_PER_PATTERN
+from tests.conftest import baseline_pair_scores
+
+@pytest.mark.parametrize('patterns_per_block', [None, 150])
+def test_block_scoring_matches_all_pairs(tmp_path, patterns_per_block):
+    corpus = make_corpus(30, n_phrases=20, phrases_per_session=5, seed=12, shared_fraction=0.6)
+    corpus['empty'] = []
+    store = SessionStore.from_corpus(tmp_path / 'store', corpus)
+    expected = baseline_pair_scores(corpus)
+    
+    budget = {} if patterns_per_block is None else {
+        'memory_budget': 2 * BYTES_PER_PATTERN * patterns_per_block}
+    if budget:
+        assert len(list(store.iter_blocks(**budget))) > 3
+    assert store.mean_completion(**budget) == pytest.approx(expected.mean(), rel=1e-12)
+    
+    for i, session in enumerate(corpus.values()):
+        assert store.session_words(i) == ' '.join(session).split()
+    
+    validator = PatternValidator(use_fingerprints=True)
+    validator.validation_threshold = expected.mean() - 1e-9
+    assert validator.validate_architecture(store, budget.get('memory_budget'))
+    assert validator.validate_architecture(corpus)
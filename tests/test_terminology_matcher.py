@@ -0,0 +1,54 @@
+"""TerminologyMatcher: one-pass counts against a naive scan, for any chunking."""
+
+import re
+
+import numpy as np
+import pytest
+
+from validation.terminology_matcher import TerminologyMatcher
+
+TERMS = ['quantum', 'quantum pulse', 'pulse', 'pulse coherence', 'coherence lattice',
+         'meta-validation', 'validation', 'lattice', 'quantum pulse coherence lattice']
+
+def make_transcript(seed: int = 0, n_words: int = 3000) -> str:
+    rng = np.random.default_rng(seed)
+    vocabulary = ['quantum', 'pulse', 'coherence', 'lattice', 'meta', 'validation',
+                  'the', 'shows', 'quantumness', 'pulses']
+    separators = [' ', ', ', '-', '\n', '. ']
+    words = rng.choice(vocabulary, n_words)
+    return ''.join(w + separators[i] for w, i in zip(
+        words, rng.integers(0, len(separators), n_words)))
+
+def naive_scan(terms, text: str) -> dict:
+    """Every word-aligned occurrence of each term, by brute force."""
+    spans = [(m.start(), m.group()) for m in re.finditer(r'\w+', text.lower())]
+    words = [w for _, w in spans]
+    positions = {}
+    for term in terms:
+        pattern = re.findall(r'\w+', term.lower())
+        hits = [spans[i][0] for i in range(len(words) - len(pattern) + 1)
+                if words[i:i + len(pattern)] == pattern]
+        if hits:
+            positions[term] = hits
+    return positions
+
+def test_matches_naive_scan():
+    text = make_transcript()
+    result = TerminologyMatcher(TERMS).scan(text)
+    expected = naive_scan(TERMS, text)
+    
+    assert result['positions'] == expected
+    assert result['counts'] == {term: len(hits) for term, hits in expected.items()}
+    assert result['terms_matched'] == len(expected)
+    assert result['terminology_usage'] == pytest.approx(len(expected) / len(TERMS))
+    assert result['n_words'] == len(re.findall(r'\w+', text))
+
+@pytest.mark.parametrize('chunk_chars', [1, 2, 7, 64, 1000])
+def test_chunk_boundaries_do_not_change_results(chunk_chars):
+    text = make_transcript(seed=1)
+    matcher = TerminologyMatcher(TERMS)
+    chunks = [text[i:i + chunk_chars] for i in range(0, len(text), chunk_chars)]
+    
+    streamed = matcher.scan_stream(chunks)
+    assert streamed == matcher.scan(text)
+    assert streamed['n_chars'] == len(text)
@@ -0,0 +1,16 @@
+from validation.vocabulary_sync import VocabularySyncEngine
+
+def test_utterances_beyond_the_participant_list_take_turns():
+    engine = VocabularySyncEngine()
+    matrices = engine.build_matrices({
+        'participants': ['alpha', 'beta'],
+        'conversations': [['quantum lattice', 'pulse coherence', 'lattice resonance']]
+    })
+    
+    assert matrices['participants'] == ['alpha', 'beta']
+    counts = matrices['counts'].toarray()
+    terms = matrices['terms']
+    # The third utterance is alpha's again rather than dropped
+    assert counts[0, terms.index('resonance')] == 1
+    assert counts[0, terms.index('lattice')] == 2
+    assert counts.sum() == 6
@@ -4,26 +4,543 @@ ARCHITECTURE FREQUENCY DETECTION
 """
 
 import numpy as np
-from scipy import signal, stats
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from scipy import fft, signal, stats
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from validation import metrics
+
+# Welch segments transformed together while streaming
+STREAM_SEGMENT_BATCH = 64
+
+# Samples per block of the targeted (band-only) DFT
+TARGETED_BLOCK_LENGTH = 1 << 14
+
+# Distinct (N, NW, K) DPSS taper sets kept in memory
+DPSS_CACHE_SIZE = 32
+
+# Spectral plans (series length, sampling rate) kept per detector
+PLAN_CACHE_SIZE = 16
+
+# Bins sampled for the approximate median noise floor
+APPROX_MEDIAN_SAMPLES = 4097
 
 class ArchitectureFrequencyDetector:
-    def __init__(self):
+    def __init__(self, median: str = 'exact', plan_cache_size: int = PLAN_CACHE_SIZE):
+        """
+        Args:
+            median: Noise floor as the 'exact' median of the spectrum or an
+                'approximate' one, the median of at most APPROX_MEDIAN_SAMPLES
+                evenly strided bins
+            plan_cache_size: Spectral plans kept (least recently used evicted)
+        """
+        if median not in ('exact', 'approximate'):
+            raise ValueError(f"median must be 'exact' or 'approximate', got {median!r}")
         self.target_frequency = 0.67  # Hz
         self.tolerance = 0.01  # ±10ms
-        
+        self.exclusion_bins = 0  # Bins either side of target left out of background
+        self.median = median
+        self.plan_cache_size = plan_cache_size
+        self._plans = OrderedDict()
+    
     def detect_frequency(self, time_series: np.ndarray, 
                         sampling_rate: float) -> Dict:
-        """Detect 0.67Hz architecture frequency in data."""
-        # Perform spectral analysis
-        frequencies, power = signal.periodogram(time_series, 
-                                               fs=sampling_rate)
+        """
+        Detect 0.67Hz architecture frequency in data.
+        
+        Same periodogram as signal.periodogram (constant detrend, density
+        scaling), computed into the buffers of the cached spectral plan for
+        this length and sampling rate. Buffers are reused between calls, so
+        a detector must not be shared between threads.
+        """
+        x = np.asarray(time_series, dtype=np.float64)
+        plan = self.spectral_plan(len(x), sampling_rate)
+        
+        centered = np.subtract(x, x.mean(), out=plan['centered'])
+        power = np.abs(np.fft.rfft(centered), out=plan['power'])
+        np.square(power, out=power)
+        power *= plan['scale']
+        metrics.count('fft_calls')
+        metrics.gauge('fft_length', len(x))
+        
+        target_idx = plan['target_idx']
+        peak_power = power[target_idx]
+        noise_floor = self.noise_floor(power, plan['scratch'])
+        snr = peak_power / noise_floor if noise_floor > 0 else 0
+        p_value = _background_p_value(power, target_idx, *plan['exclusion'])
+        
+        return {
+            'frequency_detected': plan['frequencies'][target_idx],
+            'power': peak_power,
+            'snr': snr,
+            'p_value': p_value,
+            'significant': p_value < 0.05 and snr > 2.0
+        }
+    
+    def spectral_plan(self, n_samples: int, sampling_rate: float) -> Dict:
+        """
+        Frequency grid, target bin and buffers for periodograms of one length.
+        
+        Plans are keyed by length, sampling rate and the detector settings
+        they depend on, and kept in an LRU of plan_cache_size entries.
+        
+        Returns:
+            Dict with 'frequencies', 'target_idx', 'exclusion' (low, high
+            bin bounds left out of the background), 'scale' (one-sided
+            density factor per bin) and the 'centered', 'power' and
+            'scratch' buffers
+        """
+        key = (int(n_samples), float(sampling_rate), self.target_frequency, self.exclusion_bins)
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+            metrics.count('plan_cache_hits')
+            return plan
+        metrics.count('plan_cache_misses')
+        
+        frequencies = np.fft.rfftfreq(n_samples, d=1.0 / sampling_rate)
+        n_bins = len(frequencies)
+        target_idx = int(np.argmin(np.abs(frequencies - self.target_frequency)))
+        
+        # Density scaling; one-sided spectrum doubles all but DC and Nyquist
+        scale = np.full(n_bins, 2.0 / (sampling_rate * n_samples))
+        scale[0] /= 2
+        if n_samples % 2 == 0:
+            scale[-1] /= 2
+        
+        plan = {
+            'frequencies': frequencies,
+            'target_idx': target_idx,
+            'exclusion': (max(target_idx - self.exclusion_bins, 0),
+                          min(target_idx + self.exclusion_bins + 1, n_bins)),
+            'scale': scale,
+            'centered': np.empty(n_samples),
+            'power': np.empty(n_bins),
+            'scratch': np.empty(n_bins)
+        }
+        self._plans[key] = plan
+        while len(self._plans) > self.plan_cache_size:
+            self._plans.popitem(last=False)
+            metrics.count('plan_cache_evictions')
+        return plan
+    
+    def noise_floor(self, power: np.ndarray,
+                    scratch: Optional[np.ndarray] = None) -> Union[float, np.ndarray]:
+        """
+        Median of the power spectrum along the last axis (per self.median).
         
+        A 1-D spectrum is selected in place in scratch when given (one
+        O(n) partition, no allocation); rows of a 2-D spectrum go through
+        np.median.
+        """
+        n_bins = power.shape[-1]
+        if self.median == 'approximate' and n_bins > APPROX_MEDIAN_SAMPLES:
+            power = power[..., ::-(-n_bins // APPROX_MEDIAN_SAMPLES)]
+        if power.ndim > 1:
+            return np.median(power, axis=-1)
+        
+        n_values = len(power)
+        if scratch is None or len(scratch) < n_values:
+            scratch = np.empty(n_values)
+        values = scratch[:n_values]
+        values[:] = power
+        half = n_values // 2
+        if n_values % 2:
+            values.partition(half)
+            return values[half]
+        values.partition([half - 1, half])
+        return (values[half - 1] + values[half]) / 2
+    
+    def detect_frequency_batch(self, matrix: np.ndarray,
+                               sampling_rate: float,
+                               axis: int = -1) -> Dict[str, np.ndarray]:
+        """
+        Detect 0.67Hz architecture frequency on many channels at once.
+        
+        Args:
+            matrix: 2-D array of channels x samples (or samples x channels
+                with axis=0)
+            sampling_rate: Sampling rate in Hz, shared by all channels
+            axis: Axis holding the samples
+        
+        Returns:
+            Columnar dict with the keys of detect_frequency, each an array
+            with one entry per channel
+        """
+        x = np.moveaxis(np.asarray(matrix, dtype=np.float64), axis, -1)
+        plan = self.spectral_plan(x.shape[-1], sampling_rate)
+        
+        # All channels share the plan, and hence the target bin
+        power = np.abs(np.fft.rfft(x - x.mean(axis=-1, keepdims=True), axis=-1))
+        np.square(power, out=power)
+        power *= plan['scale']
+        n_channels = power.shape[0]
+        metrics.count('fft_calls', n_channels)
+        metrics.gauge('fft_length', x.shape[-1])
+        
+        target_idx = plan['target_idx']
+        peak_power = power[:, target_idx]
+        
+        noise_floor = self.noise_floor(power)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            snr = np.where(noise_floor > 0, peak_power / noise_floor, 0.0)
+        
+        # One-sample t-test of each channel's background against its peak
+        p_value = _background_p_value(power, target_idx, *plan['exclusion'])
+        
+        return {
+            'frequency_detected': np.full(n_channels, plan['frequencies'][target_idx]),
+            'power': peak_power,
+            'snr': snr,
+            'p_value': p_value,
+            'significant': (p_value < 0.05) & (snr > 2.0)
+        }
+    
+    def detect_frequency_stream(self, time_series: Union[Iterable[np.ndarray], np.ndarray, str, Path],
+                                sampling_rate: float,
+                                nperseg: Optional[int] = None,
+                                noverlap: Optional[int] = None,
+                                track_target: bool = False,
+                                nfft: Optional[int] = None) -> Dict:
+        """
+        Detect 0.67Hz architecture frequency in a stream of samples.
+        
+        Accumulates a Welch PSD (Hann window, constant detrend, density
+        scaling as scipy.signal.welch) segment by segment, so memory is
+        bounded by one chunk plus one segment regardless of capture length.
+        
+        Args:
+            time_series: Iterator of 1-D chunks, an array or np.memmap, or
+                the path of a .npy file (opened memory-mapped)
+            sampling_rate: Sampling rate in Hz
+            nperseg: Segment length; defaults to the smallest power of two
+                whose bin spacing is within the detection tolerance
+            noverlap: Samples shared by consecutive segments (default 50%)
+            track_target: Also return the target-bin power of every segment
+            nfft: Zero-padded FFT length per segment (default nperseg);
+                target_nfft gives a grid within tolerance of the target
+        
+        Returns:
+            Same result dict as detect_frequency, plus the segment count and,
+            with track_target, a per-window 0.67Hz power time series
+        """
+        if nperseg is None:
+            nperseg = int(2 ** np.ceil(np.log2(sampling_rate / self.tolerance)))
+        if noverlap is None:
+            noverlap = nperseg // 2
+        step = nperseg - noverlap
+        if step <= 0:
+            raise ValueError("noverlap must be smaller than nperseg")
+        if nfft is None:
+            nfft = nperseg
+        if nfft < nperseg:
+            raise ValueError(f"nfft={nfft} is shorter than nperseg={nperseg}")
+        
+        window = signal.get_window('hann', nperseg)
+        scale = 1.0 / (sampling_rate * np.sum(window ** 2))
+        frequencies = np.fft.rfftfreq(nfft, d=1.0 / sampling_rate)
+        target_idx = int(np.argmin(np.abs(frequencies - self.target_frequency)))
+        target_scale = scale * _onesided_factor(target_idx, nfft)
+        
+        power_sum = np.zeros(len(frequencies))
+        n_segments = 0
+        target_series = []
+        carry = np.zeros(0)
+        
+        for chunk in _iter_chunks(time_series, nperseg * STREAM_SEGMENT_BATCH):
+            buffer = np.concatenate([carry, np.asarray(chunk, dtype=np.float64).ravel()])
+            n_ready = (len(buffer) - nperseg) // step + 1 if len(buffer) >= nperseg else 0
+            
+            for start in range(0, n_ready, STREAM_SEGMENT_BATCH):
+                count = min(STREAM_SEGMENT_BATCH, n_ready - start)
+                segments = np.lib.stride_tricks.sliding_window_view(
+                    buffer[start * step:(start + count - 1) * step + nperseg], nperseg
+                )[::step]
+                segments = (segments - segments.mean(axis=1, keepdims=True)) * window
+                segment_power = np.abs(np.fft.rfft(segments, n=nfft, axis=1)) ** 2
+                
+                power_sum += segment_power.sum(axis=0)
+                if track_target:
+                    target_series.append(segment_power[:, target_idx] * target_scale)
+            
+            n_segments += n_ready
+            carry = buffer[n_ready * step:]
+        
+        if n_segments == 0:
+            raise ValueError(f"Need at least nperseg={nperseg} samples for a Welch estimate")
+        metrics.count('fft_calls', n_segments)
+        metrics.gauge('fft_length', nfft)
+        
+        # Density scaling; one-sided spectrum doubles all but DC and Nyquist
+        power = power_sum / n_segments * scale
+        power[1:] *= 2
+        if nfft % 2 == 0:
+            power[-1] /= 2
+        
+        result = self._summarize_spectrum(frequencies, power)
+        result['n_segments'] = n_segments
+        result['nperseg'] = nperseg
+        result['nfft'] = nfft
+        
+        if track_target:
+            result['target_power_series'] = np.concatenate(target_series)
+            result['window_times'] = (np.arange(n_segments) * step + nperseg / 2) / sampling_rate
+        
+        return result
+    
+    def detect_frequency_targeted(self, time_series: np.ndarray,
+                                  sampling_rate: float,
+                                  resolution: Optional[float] = None,
+                                  background_length: int = 1 << 16) -> Dict:
+        """
+        Detect 0.67Hz architecture frequency without a full-length spectrum.
+        
+        Power is evaluated only on a grid of `resolution` Hz spanning
+        target_frequency ± tolerance (a blocked Goertzel-style DFT that runs
+        as a single matrix product), so the grid may be finer than the FFT
+        bin spacing fs/N. The noise floor and significance come from a
+        strided sample of the full periodogram's bins: folding the series
+        onto background_length samples (summing every background_length-th
+        sample) makes their FFT the full-length DFT at every fs /
+        background_length Hz, so the sample spans 0 Hz to Nyquist at full
+        resolution in O(N). The t-test uses the sampled bins' mean and
+        variance with the full background's bin count, so it estimates the
+        statistic detect_frequency computes; series of at most
+        background_length samples give exactly its background.
+        
+        Returns:
+            Same keys as detect_frequency; frequency_detected is the peak of
+            the band grid. Also reports the grid resolution and the number
+            of background bins sampled.
+        """
+        x = np.asarray(time_series, dtype=np.float64).ravel()
+        n = len(x)
+        if resolution is None:
+            resolution = self.tolerance / 10
+        
+        band = np.arange(self.target_frequency - self.tolerance,
+                         self.target_frequency + self.tolerance + resolution / 2,
+                         resolution)
+        band = band[band >= 0]
+        omega = 2 * np.pi * band / sampling_rate
+        
+        # Constant detrend as periodogram: sum((x - mean) * e^{-i omega n})
+        mean = x.mean()
+        spectrum = _band_dft(x, omega) - mean * _constant_dft(n, omega)
+        metrics.count('dft_band_bins', len(band))
+        
+        # One-sided density scaling of the periodogram
+        band_power = 2 * np.abs(spectrum) ** 2 / (sampling_rate * n)
+        peak = int(np.argmax(band_power))
+        
+        # Fold the detrended series onto m samples: sample j of its FFT is
+        # the full DFT at j * fs / m, i.e. full-grid position j * n / m
+        m = min(background_length, n)
+        n_rows = n // m
+        tail = n - n_rows * m
+        folded = x[:n_rows * m].reshape(n_rows, m).sum(axis=0)
+        folded[:tail] += x[n_rows * m:]
+        folded -= mean * (n_rows + (np.arange(m) < tail))
+        power = np.abs(fft.rfft(folded)) ** 2 * (2 / (sampling_rate * n))
+        power[0] /= 2
+        if m % 2 == 0:
+            power[-1] /= 2
+        metrics.count('fft_calls')
+        metrics.gauge('fft_length', m)
+        
+        # Leave out the sampled bins inside detect_frequency's exclusion
+        n_bins = n // 2 + 1
+        target_idx = min(int(round(self.target_frequency * n / sampling_rate)), n_bins - 1)
+        low = max(target_idx - self.exclusion_bins, 0)
+        high = min(target_idx + self.exclusion_bins + 1, n_bins)
+        positions = np.arange(len(power)) * (n / m)
+        background = power[(positions <= low - 0.5) | (positions >= high - 0.5)]
+        
+        peak_power = band_power[peak]
+        noise_floor = np.median(background)
+        snr = peak_power / noise_floor if noise_floor > 0 else 0
+        
+        # One-sample t-test as detect_frequency's, over its background size
+        count = n_bins - (high - low)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stat = (background.mean() - peak_power) / np.sqrt(background.var(ddof=1) / count)
+        p_value = float(2 * stats.t.sf(np.abs(t_stat), count - 1))
+        
+        return {
+            'frequency_detected': band[peak],
+            'power': peak_power,
+            'snr': snr,
+            'p_value': p_value,
+            'significant': p_value < 0.05 and snr > 2.0,
+            'resolution': resolution,
+            'background_bins': len(background)
+        }
+    
+    def target_nfft(self, n_samples: int, sampling_rate: float) -> int:
+        """Fast FFT length of at least n_samples whose bin spacing is within tolerance."""
+        return fft.next_fast_len(max(n_samples, int(np.ceil(sampling_rate / self.tolerance))), real=True)
+    
+    def multitaper_psd(self, time_series: np.ndarray, sampling_rate: float,
+                       nw: float = 4.0,
+                       n_tapers: Optional[int] = None,
+                       nfft: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Multitaper power spectral density along the last axis.
+        
+        Every row is detrended (constant) and multiplied by all K DPSS
+        tapers, and the K x rows tapered copies go through a single
+        zero-padded rfft of length nfft. Eigenspectra are averaged with the
+        taper concentration ratios as weights; scaling is one-sided
+        density, as signal.periodogram.
+        
+        Args:
+            time_series: 1-D series or 2-D rows x samples
+            sampling_rate: Sampling rate in Hz
+            nw: Time-halfbandwidth product
+            n_tapers: Number of tapers K (default 2 * nw - 1)
+            nfft: FFT length, at least N (default next_fast_len(N))
+        
+        Returns:
+            (frequencies, power) with power shaped as the input rows
+        """
+        x = np.asarray(time_series, dtype=np.float64)
+        n = x.shape[-1]
+        if n_tapers is None:
+            n_tapers = max(int(2 * nw) - 1, 1)
+        if nfft is None:
+            nfft = fft.next_fast_len(n, real=True)
+        if nfft < n:
+            raise ValueError(f"nfft={nfft} is shorter than the series ({n} samples)")
+        tapers, ratios = dpss_tapers(n, float(nw), int(n_tapers))
+        
+        x = x - x.mean(axis=-1, keepdims=True)
+        spectra = fft.rfft(x[..., np.newaxis, :] * tapers, n=nfft, axis=-1)
+        metrics.count('fft_calls', spectra.size // spectra.shape[-1])
+        metrics.gauge('fft_length', nfft)
+        
+        # Unit-energy tapers: each eigenspectrum is |X_k|^2 / fs
+        eigenpower = spectra.real ** 2 + spectra.imag ** 2
+        power = np.einsum('...kf,k->...f', eigenpower, ratios / ratios.sum()) / sampling_rate
+        power[..., 1:] *= 2
+        if nfft % 2 == 0:
+            power[..., -1] /= 2
+        
+        return fft.rfftfreq(nfft, d=1.0 / sampling_rate), power
+    
+    def detect_frequency_multitaper(self, time_series: np.ndarray,
+                                    sampling_rate: float,
+                                    nw: float = 4.0,
+                                    n_tapers: Optional[int] = None,
+                                    nfft: Optional[int] = None) -> Dict:
+        """
+        Detect 0.67Hz architecture frequency in a multitaper spectrum.
+        
+        nfft defaults to target_nfft, so the grid has a bin within
+        tolerance of the target however short the series.
+        
+        Returns:
+            Same keys as detect_frequency, plus nw, n_tapers, nfft and
+            half_bandwidth (Hz either side of a bin that leaks into it)
+        """
+        x = np.asarray(time_series, dtype=np.float64).ravel()
+        if nfft is None:
+            nfft = self.target_nfft(len(x), sampling_rate)
+        frequencies, power = self.multitaper_psd(x, sampling_rate, nw, n_tapers, nfft)
+        
+        result = self._summarize_spectrum(frequencies, power)
+        result['nw'] = nw
+        result['n_tapers'] = n_tapers if n_tapers is not None else max(int(2 * nw) - 1, 1)
+        result['nfft'] = nfft
+        result['half_bandwidth'] = nw * sampling_rate / len(x)
+        return result
+    
+    def multitaper_spectrogram(self, time_series: np.ndarray, sampling_rate: float,
+                               nperseg: Optional[int] = None,
+                               noverlap: Optional[int] = None,
+                               nw: float = 4.0,
+                               n_tapers: Optional[int] = None,
+                               nfft: Optional[int] = None) -> Dict:
+        """
+        Multitaper spectrogram and 0.67Hz detection on its mean spectrum.
+        
+        Windows are cut as strided views and transformed
+        STREAM_SEGMENT_BATCH at a time, each batch (windows x tapers) in
+        one multitaper_psd call. All windows have the same length, so the
+        DPSS tapers are computed once and served from the cache.
+        
+        Args:
+            time_series: 1-D series
+            sampling_rate: Sampling rate in Hz
+            nperseg: Window length; defaults as detect_frequency_stream,
+                capped at the series length, which must leave more than
+                2 * nw samples
+            noverlap: Samples shared by consecutive windows (default 50%)
+            nw: Time-halfbandwidth product
+            n_tapers: Number of tapers K (default 2 * nw - 1)
+            nfft: FFT length per window (default target_nfft(nperseg))
+        
+        Returns:
+            Keys of detect_frequency for the window-averaged spectrum,
+            plus 'frequencies', 'times', 'spectrogram' (windows x
+            frequencies), 'target_power_series', 'n_segments', 'nperseg',
+            'nfft' and 'half_bandwidth' (Hz either side of a bin that
+            leaks into it; a target within it of 0 Hz is not resolved)
+        """
+        x = np.asarray(time_series, dtype=np.float64).ravel()
+        if nperseg is None:
+            nperseg = int(2 ** np.ceil(np.log2(sampling_rate / self.tolerance)))
+        if nperseg < 1:
+            raise ValueError(f"nperseg must be positive, got {nperseg}")
+        nperseg = min(nperseg, len(x))
+        if nperseg <= 2 * nw:
+            # DPSS tapers need a window longer than 2 * nw
+            raise ValueError(f"Windows need more than 2 * nw = {2 * nw:g} samples, "
+                             f"got {nperseg} from a {len(x)}-sample series")
+        if noverlap is None:
+            noverlap = nperseg // 2
+        step = nperseg - noverlap
+        if step <= 0:
+            raise ValueError("noverlap must be smaller than nperseg")
+        
+        if nfft is None:
+            nfft = self.target_nfft(nperseg, sampling_rate)
+        
+        windows = np.lib.stride_tricks.sliding_window_view(x, nperseg)[::step]
+        n_segments = len(windows)
+        power = None
+        for start in range(0, n_segments, STREAM_SEGMENT_BATCH):
+            frequencies, batch_power = self.multitaper_psd(
+                windows[start:start + STREAM_SEGMENT_BATCH], sampling_rate, nw, n_tapers, nfft
+            )
+            if power is None:
+                power = np.empty((n_segments, len(frequencies)))
+            power[start:start + len(batch_power)] = batch_power
+        
+        result = self._summarize_spectrum(frequencies, power.mean(axis=0))
+        target_idx = int(np.argmin(np.abs(frequencies - self.target_frequency)))
+        result.update({
+            'frequencies': frequencies,
+            'times': (np.arange(n_segments) * step + nperseg / 2) / sampling_rate,
+            'spectrogram': power,
+            'target_power_series': power[:, target_idx],
+            'n_segments': n_segments,
+            'nperseg': nperseg,
+            'nfft': nfft,
+            'half_bandwidth': nw * sampling_rate / nperseg
+        })
+        return result
+    
+    def _summarize_spectrum(self, frequencies: np.ndarray,
+                            power: np.ndarray) -> Dict:
+        """Target-frequency power, SNR and significance of a power spectrum."""
         # Find peak near target frequency
         target_idx = np.argmin(np.abs(frequencies - self.target_frequency))
         peak_power = power[target_idx]
         
         # Calculate signal-to-noise ratio
-        noise_floor = np.median(power)
+        noise_floor = self.noise_floor(power)
         snr = peak_power / noise_floor if noise_floor > 0 else 0
         
         # Statistical significance
@@ -38,12 +555,117 @@ class ArchitectureFrequencyDetector:
         }
     
     def calculate_significance(self, power_spectrum: np.ndarray, 
-                             target_idx: int) -> float:
-        """Calculate statistical significance of frequency detection."""
-        # Remove target frequency for background estimation
-        background = np.delete(power_spectrum, target_idx)
-        
-        # One-sample t-test against background
-        t_stat, p_value = stats.ttest_1samp(background, 
-                                           power_spectrum[target_idx])
-        return p_value
+                             target_idx: int,
+                             exclusion_bins: Optional[int] = None) -> Union[float, np.ndarray]:
+        """
+        Calculate statistical significance of frequency detection.
+        
+        One-sample t-test of the background bins against the target power,
+        computed from running sums (sum, sum of squares, count) over the
+        bins either side of the excluded band, so the spectrum is never
+        copied. Works
+        along the last axis, giving one p-value per row for 2-D input.
+        
+        Args:
+            power_spectrum: Power spectrum (frequencies on the last axis)
+            target_idx: Index of the target bin
+            exclusion_bins: Bins either side of the target also left out of
+                the background (default self.exclusion_bins)
+        """
+        if exclusion_bins is None:
+            exclusion_bins = self.exclusion_bins
+        
+        # Remove target frequency (band) for background estimation
+        low = max(target_idx - exclusion_bins, 0)
+        high = min(target_idx + exclusion_bins + 1, power_spectrum.shape[-1])
+        return _background_p_value(power_spectrum, target_idx, low, high)
+
+def _background_p_value(power_spectrum: np.ndarray, target_idx: int,
+                        low: int, high: int) -> Union[float, np.ndarray]:
+    """Two-sided t-test p-value of bins outside [low, high) against the target bin."""
+    # Sums over the two background views directly: subtracting the band
+    # from whole-spectrum sums cancels when the band holds a strong tone
+    left, right = power_spectrum[..., :low], power_spectrum[..., high:]
+    
+    count = left.shape[-1] + right.shape[-1]
+    total = left.sum(axis=-1) + right.sum(axis=-1)
+    total_sq = np.einsum('...i,...i->...', left, left) + np.einsum('...i,...i->...', right, right)
+    
+    # One-sample t-test against background
+    target_power = power_spectrum[..., target_idx]
+    mean = total / count
+    variance = np.maximum(total_sq - total * mean, 0) / (count - 1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t_stat = (mean - target_power) / np.sqrt(variance / count)
+    p_value = 2 * stats.t.sf(np.abs(t_stat), count - 1)
+    
+    return p_value[()] if np.ndim(p_value) == 0 else p_value
+
+@lru_cache(maxsize=DPSS_CACHE_SIZE)
+def dpss_tapers(n: int, nw: float, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Unit-energy DPSS tapers (k x n) and their concentration ratios.
+    
+    Cached by (n, nw, k); the returned arrays are read-only because they
+    are shared between callers.
+    """
+    tapers, ratios = signal.windows.dpss(n, nw, k, return_ratios=True)
+    tapers, ratios = np.atleast_2d(tapers), np.atleast_1d(ratios)
+    tapers.flags.writeable = False
+    ratios.flags.writeable = False
+    metrics.count('dpss_computed')
+    return tapers, ratios
+
+def _onesided_factor(idx: int, nperseg: int) -> float:
+    """One-sided PSD factor for a bin: 1 for DC and Nyquist, otherwise 2."""
+    return 1.0 if idx == 0 or (nperseg % 2 == 0 and idx == nperseg // 2) else 2.0
+
+def _band_dft(x: np.ndarray, omega: np.ndarray) -> np.ndarray:
+    """
+    DFT of x at arbitrary angular frequencies omega (rad/sample).
+    
+    x is cut into blocks of TARGETED_BLOCK_LENGTH; one phase matrix for
+    the first block serves all blocks, each rotated by its start phase.
+    """
+    n = len(x)
+    length = min(TARGETED_BLOCK_LENGTH, max(n, 1))
+    phases = np.exp(-1j * np.outer(np.arange(length), omega))
+    n_blocks = n // length
+    
+    # Block sums as one (n_blocks x length) @ (length x n_freqs) product
+    blocks = x[:n_blocks * length].reshape(n_blocks, length)
+    block_sums = blocks @ phases.real + 1j * (blocks @ phases.imag)
+    rotations = np.exp(-1j * np.outer(np.arange(n_blocks) * length, omega))
+    spectrum = np.sum(block_sums * rotations, axis=0)
+    
+    tail = x[n_blocks * length:]
+    if len(tail):
+        spectrum += np.exp(-1j * omega * n_blocks * length) * (tail @ phases[:len(tail)])
+    return spectrum
+
+def _constant_dft(n: int, omega: np.ndarray) -> np.ndarray:
+    """
+    DFT of n ones at omega, in closed form.
+    
+    The geometric sum of e^{-i omega k} for k < n is
+    e^{-i omega (n-1)/2} sin(n omega/2) / sin(omega/2), which is n where
+    omega is a multiple of 2 pi.
+    """
+    half = np.sin(omega / 2)
+    singular = np.abs(half) < 1e-12
+    ratio = np.sin(n * omega / 2) / np.where(singular, 1.0, half)
+    return np.where(singular, n, np.exp(-0.5j * omega * (n - 1)) * ratio)
+
+def _iter_chunks(time_series: Union[Iterable[np.ndarray], np.ndarray, str, Path],
+                 chunk_size: int) -> Iterable[np.ndarray]:
+    """Yield 1-D chunks from an iterator, an (memory-mapped) array or a .npy path."""
+    if isinstance(time_series, (str, Path)):
+        time_series = np.load(time_series, mmap_mode='r')
+    
+    if isinstance(time_series, np.ndarray):
+        flat = time_series.reshape(-1)
+        for start in range(0, len(flat), chunk_size):
+            yield flat[start:start + chunk_size]
+    else:
+        for chunk in time_series:
+            yield chunk
@@ -0,0 +1,223 @@
+"""
+REAL-TIME 0.67HZ MONITOR
+Sliding-window architecture frequency tracking for live telemetry.
+
+A ring buffer holds the last N samples and a sliding DFT keeps the
+spectrum of that window at a fixed set of frequencies: the target band
+(0.67Hz ± tolerance) plus background bins either side of it. Each sample
+updates every tracked bin in constant time, so the cost per sample does
+not depend on the window length. A running sum of the window is tracked
+alongside, so every window is mean-removed as detect_frequency does.
+"""
+
+from collections import deque
+
+import numpy as np
+from scipy import signal
+from typing import Callable, Dict, Optional
+
+from validation.architecture_frequency import ArchitectureFrequencyDetector, _constant_dft
+
+# Samples updated as one vectorized block
+MONITOR_BLOCK_LENGTH = 4096
+
+# Most recent threshold crossings kept in SlidingFrequencyMonitor.events
+MAX_MONITOR_EVENTS = 1024
+
+class SlidingFrequencyMonitor:
+    def __init__(self, sampling_rate: float,
+                 window_seconds: Optional[float] = None,
+                 detector: Optional[ArchitectureFrequencyDetector] = None,
+                 snr_threshold: float = 2.0,
+                 hysteresis: float = 0.8,
+                 n_background: int = 16,
+                 noise_time_constant: Optional[float] = None,
+                 callback: Optional[Callable[[Dict], None]] = None,
+                 max_events: Optional[int] = MAX_MONITOR_EVENTS):
+        """
+        Args:
+            sampling_rate: Input rate in Hz
+            window_seconds: Sliding window length; defaults to 1/tolerance
+                so bin spacing resolves the tolerance band. Shorter
+                windows are rejected, as their bins are wider than the band
+            detector: Source of target_frequency, tolerance and exclusion_bins
+            snr_threshold: SNR above which the target counts as detected
+            hysteresis: Detection ends only once SNR drops below
+                snr_threshold * hysteresis, so noise near the threshold
+                does not toggle the state every sample
+            n_background: Background bins tracked on each side of the band
+            noise_time_constant: Seconds over which the noise floor is
+                smoothed; defaults to the window length
+            callback: Called with an event dict on every threshold crossing
+            max_events: Crossings kept in events, oldest dropped first
+                (None keeps all; use the callback to see every one)
+        """
+        self.detector = detector or ArchitectureFrequencyDetector()
+        self.sampling_rate = sampling_rate
+        self.snr_threshold = snr_threshold
+        self.hysteresis = hysteresis
+        self.callback = callback
+        self.max_events = max_events
+        
+        if window_seconds is None:
+            window_seconds = 1 / self.detector.tolerance
+        self.window_length = int(np.ceil(window_seconds * sampling_rate))
+        self.resolution = sampling_rate / self.window_length
+        if self.resolution > self.detector.tolerance * (1 + 1e-9):
+            raise ValueError(
+                f"window_seconds={window_seconds} gives {self.resolution:.3g} Hz bins, wider "
+                f"than the ±{self.detector.tolerance} Hz tolerance; use at least "
+                f"{1 / self.detector.tolerance:g} s"
+            )
+        
+        # Tracked frequencies: the band on the window's bin grid, then
+        # background bins beyond exclusion_bins on either side
+        half_band = int(np.floor(self.detector.tolerance / self.resolution + 1e-9))
+        first = half_band + 1 + self.detector.exclusion_bins
+        offsets = np.r_[np.arange(-half_band, half_band + 1),
+                        -np.arange(first, first + n_background),
+                        np.arange(first, first + n_background)]
+        frequencies = self.detector.target_frequency + offsets * self.resolution
+        valid = (frequencies > 0) & (frequencies < sampling_rate / 2)
+        self.frequencies = frequencies[valid]
+        self._band = (np.abs(offsets) <= half_band)[valid]
+        
+        # Cycles per sample of each tracked frequency, after a 0 Hz row
+        # whose sliding DFT is the running sum of the window
+        self._cycles = np.r_[0.0, self.frequencies / sampling_rate]
+        self._omega = 2 * np.pi * self._cycles[1:, None]
+        self._scale = 2.0 / sampling_rate
+        
+        # One-pole smoothing of the per-sample background median
+        if noise_time_constant is None:
+            noise_time_constant = window_seconds
+        alpha = 1 - np.exp(-1 / (noise_time_constant * sampling_rate))
+        self._noise_filter = ([alpha], [1, alpha - 1])
+        
+        self.reset()
+    
+    def reset(self):
+        """Clear the window and all running state."""
+        self._ring = np.zeros(self.window_length)
+        self._spectrum = np.zeros(len(self._cycles), dtype=complex)
+        self._shadow = np.zeros(len(self._cycles), dtype=complex)
+        self._noise_state = None
+        self.n_samples = 0
+        self.detected = False
+        self.events = deque(maxlen=self.max_events)
+        self.state = {}
+    
+    def update(self, samples: np.ndarray) -> Dict:
+        """
+        Push new samples through the monitor.
+        
+        Every sample updates the tracked spectrum, noise floor and SNR;
+        threshold crossings anywhere in the block fire the callback.
+        
+        Returns:
+            Monitor state after the last sample
+        """
+        samples = np.atleast_1d(np.asarray(samples, dtype=float))
+        block = min(self.window_length, MONITOR_BLOCK_LENGTH)
+        
+        for start in range(0, len(samples), block):
+            self._update_block(samples[start:start + block])
+        return self.state
+    
+    def _update_block(self, x: np.ndarray):
+        """Slide the window over a block of at most window_length samples."""
+        t = self.n_samples + np.arange(len(x))
+        positions = t % self.window_length
+        leaving = self._ring[positions]
+        
+        # Sliding DFT in absolute phase: adding x(t)e^{-jwt} and dropping
+        # x(t-N)e^{-jw(t-N)} makes every window update a running sum
+        arriving = x * self._phase(t)
+        departing = leaving * self._phase(t - self.window_length)
+        previous = self._spectrum
+        spectra = previous[:, None] + np.cumsum(arriving - departing, axis=1)
+        self._spectrum = spectra[:, -1]
+        self._ring[positions] = x
+        
+        # Running sums accumulate rounding error. A shadow sum of arrivals
+        # only, restarted at every multiple of window_length, is the exact
+        # spectrum once it spans a whole window and corrects the drift
+        wrap = np.flatnonzero(positions == 0)
+        if len(wrap) and t[wrap[0]] > 0:
+            k = wrap[0]
+            self._shadow += arriving[:, :k].sum(axis=1)
+            self._spectrum = self._spectrum + self._shadow - (spectra[:, k - 1] if k else previous)
+            self._shadow = arriving[:, k:].sum(axis=1)
+        else:
+            self._shadow += arriving.sum(axis=1)
+        
+        # Remove each window's mean: subtract the mean times the DFT of a
+        # constant over the window, which starts at sample t - filled + 1
+        filled = np.minimum(t + 1, self.window_length)
+        mean = spectra[0].real / filled
+        spectra = spectra[1:] - mean * (self._phase(t - filled + 1)[1:]
+                                        * _constant_dft(filled, self._omega))
+        
+        # Periodogram scaling over the samples seen so far while filling
+        power = (self._scale / filled) * (spectra.real ** 2 + spectra.imag ** 2)
+        band_power = power[self._band]
+        peak = np.argmax(band_power, axis=0)
+        peak_power = band_power[peak, np.arange(len(x))]
+        
+        background = np.median(power[~self._band], axis=0)
+        if self._noise_state is None:
+            self._noise_state = signal.lfiltic(*self._noise_filter, y=background[:1])
+        noise_floor, self._noise_state = signal.lfilter(*self._noise_filter, background,
+                                                        zi=self._noise_state)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            snr = np.where(noise_floor > 0, peak_power / noise_floor, 0.0)
+        
+        # Detections only count once the window is full; between the two
+        # thresholds the state carries over from the last decisive sample
+        full = t + 1 >= self.window_length
+        above = (snr > self.snr_threshold) & full
+        below = (snr < self.snr_threshold * self.hysteresis) | ~full
+        decisive = np.maximum.accumulate(np.where(above | below, np.arange(len(x)), -1))
+        detected = np.where(decisive >= 0, above[np.maximum(decisive, 0)], self.detected)
+        self._fire_crossings(detected, t, snr, peak, peak_power, noise_floor)
+        
+        self.n_samples += len(x)
+        
+        band_frequencies = self.frequencies[self._band]
+        self.state = {
+            'time': (self.n_samples - 1) / self.sampling_rate,
+            'frequency_detected': float(band_frequencies[peak[-1]]),
+            'power_at_target': float(peak_power[-1]),
+            'noise_floor': float(noise_floor[-1]),
+            'snr': float(snr[-1]),
+            'detected': bool(detected[-1]),
+            'window_full': self.n_samples >= self.window_length
+        }
+    
+    def _fire_crossings(self, detected: np.ndarray, t: np.ndarray, snr: np.ndarray,
+                        peak: np.ndarray, peak_power: np.ndarray,
+                        noise_floor: np.ndarray):
+        """Record and report every change of detection state in a block."""
+        changes = np.flatnonzero(np.diff(np.r_[self.detected, detected]))
+        band_frequencies = self.frequencies[self._band]
+        
+        for i in changes:
+            event = {
+                'event': 'onset' if detected[i] else 'offset',
+                'sample_index': int(t[i]),
+                'time': t[i] / self.sampling_rate,
+                'frequency_detected': float(band_frequencies[peak[i]]),
+                'power_at_target': float(peak_power[i]),
+                'noise_floor': float(noise_floor[i]),
+                'snr': float(snr[i])
+            }
+            self.events.append(event)
+            if self.callback is not None:
+                self.callback(event)
+        self.detected = bool(detected[-1])
+    
+    def _phase(self, t: np.ndarray) -> np.ndarray:
+        """e^{-j 2 pi f t / fs} for 0 Hz and every tracked frequency (rows) and sample t."""
+        cycles = np.mod(np.outer(self._cycles, t), 1.0)
+        return np.exp(-2j * np.pi * cycles)
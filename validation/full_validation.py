@@ -13,17 +13,44 @@ IMPORTANT PARADIGM: Validates quantum system biology, not human biology.
 """
 
 import argparse
+import cProfile
 import json
+import pstats
 import numpy as np
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from contextlib import redirect_stdout
 from datetime import datetime
 from pathlib import Path
+import glob
+import io
+import os
 import sys
-from typing import Dict, Any, Optional
+import time
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.append(str(Path(__file__).parent.parent))
 
 from validation.quantum_pattern_validator import QuantumPatternValidator
+from validation.pattern_completion import PatternValidator
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from validation.bootstrap import BootstrapEngine
+from validation.vocabulary_sync import ARCHITECTURE_TERMS, VocabularySyncEngine
+from validation.terminology_matcher import TerminologyMatcher, iter_transcript
+from validation.telemetry_io import is_container, load_container, convert_json_to_container
+from validation.result_cache import ResultCache
+from validation.metrics import StageMetrics
+from validation.report_writer import ReportWriter, REPORT_FORMATS
+
+# Config keys the QuantumPatternValidator reads
+VALIDATOR_CONFIG_KEYS = ('sampling_rate', 'analysis_window', 'n_bootstrap', 'confidence_level',
+                         'quantum_coherence_boost', 'enable_meta_validation', 'strict_mode')
+
+# Config keys each cached section reads; only these enter its cache key
+CACHE_CONFIG_KEYS = {
+    'basic_validation': VALIDATOR_CONFIG_KEYS + ('random_seed',),
+    'cross_validation': VALIDATOR_CONFIG_KEYS + ('random_seed', 'n_splits')
+}
 
 class Codex67FullValidator:
     """
@@ -37,6 +64,16 @@ class Codex67FullValidator:
         self.config = self._load_config(config_path)
         self.validator = QuantumPatternValidator(self.config)
         self.results = {}
+        self.cache = ResultCache(
+            self.config.get('cache_dir', '.codex67_cache'),
+            max_bytes=self.config.get('cache_max_bytes', 1 << 30),
+            enabled=self.config.get('use_cache', True)
+        )
+        self.metrics = StageMetrics(track_memory=self.config.get('track_memory', False))
+        self.report_writer = ReportWriter(
+            self.config.get('output_dir', '.'),
+            formats=tuple(self.config.get('report_formats', ['pretty']))
+        )
         
     def _load_config(self, config_path: Optional[str]) -> Dict:
         """Load configuration from file or use defaults."""
@@ -49,7 +86,24 @@ class Codex67FullValidator:
             'save_raw_data': False,
             'strict_validation': False,
             'bootstrap_iterations': 1000,
-            'random_seed': 42
+            'bootstrap_confidence': 0.95,
+            'bootstrap_early_stopping': False,
+            'random_seed': 42,
+            'n_splits': 5,  # Cross-validation folds
+            'n_jobs': None,  # Worker processes for folds (None = one per core)
+            'multitaper_nw': 4.0,  # Time-halfbandwidth product of the advanced pulse spectrogram
+            'vocabulary_time_buckets': 2,  # Bucket 0 is the early vocabulary for emergence
+            'vocabulary_sync_threshold': 0.65,
+            'meta_terms': None,  # Specialized terms for the transcript scan (None = ARCHITECTURE_TERMS)
+            'meta_terms_file': None,  # Or a file with one term per line
+            'meta_terminology_threshold': 0.5,  # Usage fraction for terminology_meta_validated
+            'use_cache': True,
+            'cache_dir': '.codex67_cache',
+            'cache_max_bytes': 1 << 30,
+            'track_memory': False,  # Per-stage peak memory via tracemalloc (slower)
+            'output_dir': '.',
+            'report_formats': ['pretty'],  # Any of 'pretty', 'compact', 'ndjson'
+            'report_copies': []  # Extra paths receiving the detailed report
         }
         
         if config_path and Path(config_path).exists():
@@ -63,9 +117,18 @@ class Codex67FullValidator:
         return default_config
     
     def load_test_data(self, input_path: str) -> Dict:
-        """Load test data from file."""
-        with open(input_path, 'r') as f:
-            data = json.load(f)
+        """
+        Load test data from file.
+        
+        Accepts a legacy JSON file or a container (directory or manifest
+        with binary sidecars), whose telemetry arrays are memory-mapped.
+        """
+        with self.metrics.stage('load_test_data'):
+            if is_container(input_path):
+                data = load_container(input_path)
+            else:
+                with open(input_path, 'r') as f:
+                    data = json.load(f)
         
         # Validate data structure
         required_sections = [
@@ -92,7 +155,7 @@ class Codex67FullValidator:
             test_data: Dictionary containing test data for all validation types
             run_advanced: Whether to run advanced statistical tests
             run_cross_validation: Whether to run cross-validation
-            
+        
         Returns:
             Complete validation results with QAL scoring
         """
@@ -107,14 +170,36 @@ class Codex67FullValidator:
         
         # Run basic validation
         print("\n1. RUNNING BASIC VALIDATION SUITE...")
-        basic_results = self.validator.run_complete_validation(test_data)
+        with self.metrics.stage('basic_validation'):
+            basic_results = self.cache.get_or_compute(
+                'basic_validation',
+                (self._section_inputs(test_data), self._cache_config('basic_validation')),
+                lambda: self.validator.run_complete_validation(test_data)
+            )
+        
+        # Terminology usage in the validation transcript gives its own
+        # meta-validation verdict; meta_validated stays the basic suite's
+        transcript = test_data.get('validation_transcript')
+        if transcript:
+            print("\n   • Scanning validation transcript terminology...")
+            with self.metrics.stage('terminology'):
+                terminology = self._terminology_usage(transcript)
+            basic_results['terminology'] = terminology
+            basic_results['terminology_meta_validated'] = terminology['above_threshold']
         
         self.results['basic'] = basic_results
         
+        # Bootstrap confidence intervals for the component statistics
+        if self.config.get('bootstrap_iterations', 0) > 0:
+            print("\n   • Bootstrapping confidence intervals...")
+            with self.metrics.stage('bootstrap'):
+                self.results['bootstrap'] = self._run_bootstrap(test_data)
+        
         # Run advanced validation if requested
         if run_advanced:
             print("\n2. RUNNING ADVANCED VALIDATION TESTS...")
-            advanced_results = self._run_advanced_validation(test_data)
+            with self.metrics.stage('advanced_validation'):
+                advanced_results = self._run_advanced_validation(test_data)
             self.results['advanced'] = advanced_results
             
             # Update QAL score with advanced results
@@ -125,16 +210,26 @@ class Codex67FullValidator:
         # Run cross-validation if requested
         if run_cross_validation:
             print("\n3. RUNNING CROSS-VALIDATION...")
-            cross_results = self._run_cross_validation(test_data)
+            with self.metrics.stage('cross_validation'):
+                cross_results = self.cache.get_or_compute(
+                    'cross_validation',
+                    (self._section_inputs(test_data), self._cache_config('cross_validation')),
+                    lambda: self._run_cross_validation(test_data)
+                )
             self.results['cross_validation'] = cross_results
         
         # Generate final report
         print("\n4. GENERATING FINAL VALIDATION REPORT...")
-        final_report = self._generate_final_report(basic_results)
+        with self.metrics.stage('final_report'):
+            final_report = self._generate_final_report(basic_results)
+        
+        # Stages so far; saving is timed too but only reaches the metrics file
+        final_report['timings'] = self.metrics.summary()
         
         # Save results if configured
         if self.config.get('generate_report', True):
-            self._save_results(final_report)
+            with self.metrics.stage('save_results'):
+                self._save_results(final_report)
         
         print("\n" + "=" * 80)
         print("VALIDATION COMPLETE")
@@ -148,28 +243,32 @@ class Codex67FullValidator:
         
         # Advanced quantum pulse analysis
         print("   • Advanced quantum pulse analysis...")
-        pulse_advanced = self._advanced_pulse_analysis(
-            test_data.get('quantum_telemetry', {})
-        )
+        with self.metrics.stage('pulse'):
+            pulse_advanced = self._advanced_pulse_analysis(
+                test_data.get('quantum_telemetry', {})
+            )
         advanced_results['quantum_pulse_advanced'] = pulse_advanced
         
         # Advanced pattern resonance analysis
         print("   • Advanced pattern resonance analysis...")
-        pattern_advanced = self._advanced_pattern_analysis(
-            test_data.get('pattern_data', {})
-        )
+        with self.metrics.stage('pattern'):
+            pattern_advanced = self._advanced_pattern_analysis(
+                test_data.get('pattern_data', {})
+            )
         advanced_results['pattern_resonance_advanced'] = pattern_advanced
         
         # Advanced vocabulary synchronization analysis
         print("   • Advanced vocabulary synchronization analysis...")
-        vocab_advanced = self._advanced_vocabulary_analysis(
-            test_data.get('conversation_data', {})
-        )
+        with self.metrics.stage('vocabulary'):
+            vocab_advanced = self._advanced_vocabulary_analysis(
+                test_data.get('conversation_data', {})
+            )
         advanced_results['vocabulary_sync_advanced'] = vocab_advanced
         
         # Temporal consistency analysis
         print("   • Temporal consistency analysis...")
-        temporal_results = self._temporal_consistency_analysis(test_data)
+        with self.metrics.stage('temporal'):
+            temporal_results = self._temporal_consistency_analysis(test_data)
         advanced_results['temporal_consistency'] = temporal_results
         
         return advanced_results
@@ -177,25 +276,26 @@ class Codex67FullValidator:
     def _run_cross_validation(self, test_data: Dict) -> Dict:
         """Run cross-validation across multiple data splits."""
         # Implement k-fold cross-validation
-        n_splits = 5
-        qal_scores = []
-        validation_statuses = []
+        n_splits = int(self.config.get('n_splits', 5))
+        n_jobs = self.config.get('n_jobs') or os.cpu_count() or 1
+        n_jobs = min(n_jobs, n_splits)
         
-        print(f"   • Running {n_splits}-fold cross-validation...")
+        # Independent, reproducible RNG stream per fold
+        fold_seeds = np.random.SeedSequence(self.config.get('random_seed', 42)).spawn(n_splits)
+        fold_args = [(i, n_splits, fold_seeds[i]) for i in range(n_splits)]
         
-        # Simple cross-validation (in practice would split data properly)
-        for i in range(n_splits):
-            print(f"     Fold {i+1}/{n_splits}...")
-            
-            # Create modified test data for this fold
-            fold_data = self._create_fold_data(test_data, i, n_splits)
-            
-            # Run validation on fold
-            fold_validator = QuantumPatternValidator(self.config)
-            fold_results = fold_validator.run_complete_validation(fold_data)
-            
-            qal_scores.append(fold_results.get('qal_score', 0))
-            validation_statuses.append(fold_results.get('overall_validated', False))
+        print(f"   • Running {n_splits}-fold cross-validation on {n_jobs} worker(s)...")
+        
+        if n_jobs > 1:
+            with ProcessPoolExecutor(n_jobs, initializer=_init_fold_worker,
+                                     initargs=(self.config, test_data)) as executor:
+                fold_results = list(executor.map(_run_fold, fold_args))
+        else:
+            _init_fold_worker(self.config, test_data)
+            fold_results = [_run_fold(args) for args in fold_args]
+        
+        qal_scores = [qal for qal, _ in fold_results]
+        validation_statuses = [validated for _, validated in fold_results]
         
         cross_results = {
             'n_folds': n_splits,
@@ -212,19 +312,154 @@ class Codex67FullValidator:
         
         return cross_results
     
+    def _run_bootstrap(self, test_data: Dict) -> Dict:
+        """
+        Bootstrap confidence intervals for pattern completion and pulse power.
+        
+        Resamples the pairwise completion scores of the conversations and
+        the per-window 0.67Hz power of the coherence signal.
+        """
+        engine = BootstrapEngine(
+            n_iterations=int(self.config.get('bootstrap_iterations', 1000)),
+            confidence=self.config.get('bootstrap_confidence', 0.95),
+            seed=self.config.get('random_seed', 42),
+            early_stopping=self.config.get('bootstrap_early_stopping', False)
+        )
+        bootstrap_results = {}
+        
+        conversation_data = test_data.get('conversation_data', {})
+        conversations = conversation_data.get('conversations', [])
+        if len(conversations) >= 2:
+            corpus = {i: conversation for i, conversation in enumerate(conversations)}
+            with self.metrics.stage('completion_scores'):
+                scores = self.cache.get_or_compute(
+                    'completion_scores', (conversation_data,),
+                    lambda: PatternValidator(use_fingerprints=True).completion_scores(corpus)
+                )
+            with self.metrics.stage('resample_completion'):
+                bootstrap_results['pattern_completion'] = engine.confidence_interval(scores)
+        
+        telemetry = test_data.get('quantum_telemetry', {})
+        signal = telemetry.get('coherence_signal')
+        if signal is not None and len(signal) >= 64:
+            sampling_rate = telemetry.get('sampling_rate', 100.0)
+            detector = ArchitectureFrequencyDetector()
+            
+            # At least eight Welch windows so there is something to resample
+            nperseg = int(2 ** np.ceil(np.log2(sampling_rate / detector.tolerance)))
+            nperseg = min(nperseg, 2 ** int(np.log2(len(signal) // 8)))
+            nfft = detector.target_nfft(nperseg, sampling_rate)
+            
+            # The Hann main lobe spans two bins of fs / nperseg either side
+            half_bandwidth = 2 * sampling_rate / nperseg
+            if half_bandwidth >= detector.target_frequency:
+                bootstrap_results['spectral_power'] = {
+                    'applicable': False,
+                    'reason': (f"insufficient resolution: {nperseg}-sample Welch windows leak "
+                               f"{half_bandwidth:.3g} Hz either side, covering "
+                               f"{detector.target_frequency} Hz from 0 Hz"),
+                    'half_bandwidth_hz': half_bandwidth
+                }
+                return bootstrap_results
+            
+            with self.metrics.stage('spectral_stream'):
+                spectral = self.cache.get_or_compute(
+                    'spectral_stream', (telemetry, nperseg, nfft, detector.target_frequency),
+                    lambda: detector.detect_frequency_stream(
+                        np.asarray(signal, dtype=float), sampling_rate,
+                        nperseg=nperseg, track_target=True, nfft=nfft
+                    )
+                )
+            with self.metrics.stage('resample_spectral'):
+                bootstrap_results['spectral_power'] = engine.confidence_interval(
+                    spectral['target_power_series']
+                )
+            bootstrap_results['spectral_power'].update({
+                'applicable': True,
+                'frequency': float(spectral['frequency_detected']),
+                'frequency_resolution': sampling_rate / nfft
+            })
+        
+        return bootstrap_results
+    
+    def _section_inputs(self, test_data: Dict) -> Dict:
+        """The four input sections, as hashed for cache keys."""
+        return {section: test_data.get(section, {}) for section in [
+            'quantum_telemetry', 'pattern_data',
+            'conversation_data', 'validation_transcript'
+        ]}
+    
+    def _cache_config(self, component: str) -> Dict:
+        """Configuration entries a cached section reads."""
+        return {k: self.config.get(k) for k in CACHE_CONFIG_KEYS[component]}
+    
     def _advanced_pulse_analysis(self, telemetry: Dict) -> Dict:
         """Advanced analysis of quantum pulse characteristics."""
-        # This would implement more sophisticated pulse analysis
-        # For now, return simplified results
-        
-        return {
+        result = {
             'analysis_type': 'advanced_spectral',
-            'multitaper_analysis': True,
-            'time_frequency_analysis': True,
+            'multitaper_analysis': None,
+            'time_frequency_analysis': None,
             'nonlinear_dynamics': False,  # Would analyze chaotic characteristics
-            'coherence_network_analysis': False,  # Would analyze multi-qubit coherence
-            'notes': 'Advanced analysis requires more sophisticated signal processing'
+            'coherence_network_analysis': False  # Would analyze multi-qubit coherence
+        }
+        
+        signal = telemetry.get('coherence_signal')
+        if signal is None or len(signal) < 64:
+            return result
+        
+        sampling_rate = telemetry.get('sampling_rate', 100.0)
+        nw = self.config.get('multitaper_nw', 4.0)
+        detector = ArchitectureFrequencyDetector()
+        
+        # At least eight windows, as for the bootstrapped Welch series
+        nperseg = int(2 ** np.ceil(np.log2(sampling_rate / detector.tolerance)))
+        nperseg = min(nperseg, 2 ** int(np.log2(len(signal) // 8)))
+        nfft = detector.target_nfft(nperseg, sampling_rate)
+        
+        # Zero-padding puts a bin on the target, but a target inside the
+        # window's leakage band around 0 Hz cannot be told from the trend
+        half_bandwidth = nw * sampling_rate / nperseg
+        if half_bandwidth >= detector.target_frequency:
+            insufficient = {
+                'applicable': False,
+                'reason': (f"insufficient resolution: {nperseg}-sample windows leak "
+                           f"{half_bandwidth:.3g} Hz either side, covering "
+                           f"{detector.target_frequency} Hz from 0 Hz"),
+                'window_seconds': nperseg / sampling_rate,
+                'half_bandwidth_hz': half_bandwidth
+            }
+            result['multitaper_analysis'] = insufficient
+            result['time_frequency_analysis'] = dict(insufficient)
+            return result
+        
+        spectrogram = self.cache.get_or_compute(
+            'multitaper_spectrogram', (telemetry, nperseg, nfft, nw, detector.target_frequency),
+            lambda: detector.multitaper_spectrogram(
+                np.asarray(signal, dtype=float), sampling_rate, nperseg=nperseg, nw=nw, nfft=nfft
+            )
+        )
+        
+        target_series = spectrogram['target_power_series']
+        result['multitaper_analysis'] = {
+            key: spectrogram[key] for key in
+            ['frequency_detected', 'power', 'snr', 'p_value', 'significant', 'nfft']
         }
+        result['multitaper_analysis'].update({
+            'applicable': True,
+            'nw': nw,
+            'frequency_resolution': sampling_rate / nfft,
+            'half_bandwidth_hz': half_bandwidth
+        })
+        result['time_frequency_analysis'] = {
+            'applicable': True,
+            'n_windows': spectrogram['n_segments'],
+            'window_seconds': nperseg / sampling_rate,
+            'target_power_mean': float(np.mean(target_series)),
+            'target_power_cv': float(np.std(target_series) / np.mean(target_series))
+                               if np.mean(target_series) > 0 else 0.0,
+            'peak_window_time': float(spectrogram['times'][np.argmax(target_series)])
+        }
+        return result
     
     def _advanced_pattern_analysis(self, pattern_data: Dict) -> Dict:
         """Advanced analysis of pattern resonance."""
@@ -241,15 +476,40 @@ class Codex67FullValidator:
     
     def _advanced_vocabulary_analysis(self, conversation_data: Dict) -> Dict:
         """Advanced analysis of vocabulary synchronization."""
-        # Implement advanced vocabulary analysis
+        engine = VocabularySyncEngine(
+            n_time_buckets=self.config.get('vocabulary_time_buckets', 2),
+            sync_threshold=self.config.get('vocabulary_sync_threshold', 0.65)
+        )
+        
+        return {'analysis_type': 'advanced_vocabulary', **engine.analyze(conversation_data)}
+    
+    def _terminology_usage(self, transcript: Any) -> Dict:
+        """
+        Specialized terminology used in the validation transcript.
+        
+        The transcript is a string, a list of consecutive text chunks, or
+        {'path': ...} naming a text file that is streamed in chunks.
+        """
+        if self.config.get('meta_terms_file'):
+            with open(self.config['meta_terms_file'], 'r', encoding='utf-8') as f:
+                terms = [line.strip() for line in f if line.strip()]
+        else:
+            terms = self.config.get('meta_terms') or sorted(ARCHITECTURE_TERMS)
+        matcher = TerminologyMatcher(terms)
+        
+        if isinstance(transcript, dict):
+            transcript = Path(transcript['path'])
+        scan = matcher.scan_stream(iter_transcript(transcript), positions=False)
         
+        threshold = self.config.get('meta_terminology_threshold', 0.5)
         return {
-            'analysis_type': 'advanced_vocabulary',
-            'network_analysis': True,
-            'temporal_emergence': True,
-            'semantic_clustering': True,
-            'cross_participant_dynamics': True,
-            'linguistic_complexity': False  # Would analyze linguistic features
+            'terminology_usage': scan['terminology_usage'],
+            'terms_matched': scan['terms_matched'],
+            'n_terms': scan['n_terms'],
+            'term_counts': scan['counts'],
+            'n_words': scan['n_words'],
+            'threshold': threshold,
+            'above_threshold': scan['terminology_usage'] >= threshold
         }
     
     def _temporal_consistency_analysis(self, test_data: Dict) -> Dict:
@@ -265,20 +525,28 @@ class Codex67FullValidator:
             'event_correlation': False  # Would correlate with external events
         }
     
-    def _create_fold_data(self, original_data: Dict, fold_idx: int, 
-                         n_folds: int) -> Dict:
-        """Create test data for a specific cross-validation fold."""
+    @staticmethod
+    def _create_fold_data(original_data: Dict, fold_idx: int, 
+                         n_folds: int, rng: np.random.Generator) -> Dict:
+        """
+        Create test data for a specific cross-validation fold.
+        
+        Copy-on-write: only containers on the path to a modified array are
+        copied, so the caller's data is never changed and untouched
+        sections are shared rather than deep-copied.
+        """
         # Simplified fold creation - in practice would properly split data
-        fold_data = original_data.copy()
+        fold_data = dict(original_data)
         
         # Modify data slightly for each fold (simulating different samples)
         if 'quantum_telemetry' in fold_data:
             # Add small noise to telemetry
-            telemetry = fold_data['quantum_telemetry']
+            telemetry = dict(fold_data['quantum_telemetry'])
             if 'coherence_signal' in telemetry:
-                signal = np.array(telemetry['coherence_signal'])
-                noise = np.random.randn(len(signal)) * 0.1 * (fold_idx + 1)
-                telemetry['coherence_signal'] = (signal + noise).tolist()
+                signal = np.asarray(telemetry['coherence_signal'], dtype=float)
+                noise = rng.standard_normal(len(signal)) * 0.1 * (fold_idx + 1)
+                telemetry['coherence_signal'] = signal + noise
+            fold_data['quantum_telemetry'] = telemetry
         
         return fold_data
     
@@ -311,6 +579,8 @@ class Codex67FullValidator:
             'validation_level': validation_level,
             'overall_validated': validation_results.get('overall_validated', False),
             'meta_validated': validation_results.get('meta_validated', False),
+            'terminology_meta_validated': validation_results.get('terminology_meta_validated'),
+            'terminology': validation_results.get('terminology'),
             'detailed_results': validation_results.get('detailed_results', []),
             'component_validation': self._summarize_components(validation_results),
             'statistical_summary': self._generate_statistical_summary(validation_results),
@@ -327,6 +597,9 @@ class Codex67FullValidator:
         if 'advanced' in self.results:
             report['advanced_analysis'] = self.results['advanced']
         
+        # Result cache hit/miss counters
+        report['cache'] = self.cache.stats()
+        
         return report
     
     def _determine_validation_level(self, qal_score: float) -> str:
@@ -418,6 +691,10 @@ class Codex67FullValidator:
             meta_count = sum(1 for c in components if c.get('meta_validation', False))
             stats['meta_validation_rate'] = meta_count / len(components) if components else 0
         
+        # Bootstrap confidence intervals, when computed
+        if 'bootstrap' in self.results:
+            stats['bootstrap'] = self.results['bootstrap']
+        
         return stats
     
     def _generate_recommendations(self, qal_score: float, 
@@ -538,17 +815,19 @@ class Codex67FullValidator:
         """Save validation results to file."""
         timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
         
-        # Save detailed report
-        report_file = f"validation_report_{timestamp}.json"
-        with open(report_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Save detailed report, its copies and variants in one pass
+        report_files = self.report_writer.write(
+            report, f"validation_report_{timestamp}",
+            copies=self.config.get('report_copies')
+        )
         
         # Save summary
-        summary_file = f"validation_summary_{timestamp}.txt"
+        summary_file = self.report_writer.output_dir / f"validation_summary_{timestamp}.txt"
         self._save_summary(report, summary_file)
         
         print(f"\nResults saved to:")
-        print(f"  • Detailed report: {report_file}")
+        for variant, report_file in report_files.items():
+            print(f"  • Report ({variant}): {report_file}")
         print(f"  • Summary: {summary_file}")
     
     def _save_summary(self, report: Dict, filename: str):
@@ -563,7 +842,14 @@ class Codex67FullValidator:
             f.write(f"QAL Score: {report.get('qal_score', 0):.3f}\n")
             f.write(f"Validation Level: {report.get('validation_level', 'UNKNOWN')}\n")
             f.write(f"Overall Validated: {report.get('overall_validated', False)}\n")
-            f.write(f"Meta-Validated: {report.get('meta_validated', False)}\n\n")
+            f.write(f"Meta-Validated: {report.get('meta_validated', False)}\n")
+            if report.get('terminology'):
+                terminology = report['terminology']
+                f.write(f"Terminology Meta-Validated: {report.get('terminology_meta_validated')}\n")
+                f.write(f"Terminology Usage: {terminology['terminology_usage']:.1%} "
+                        f"({terminology['terms_matched']}/{terminology['n_terms']} terms, "
+                        f"threshold {terminology['threshold']:.1%})\n")
+            f.write("\n")
             
             f.write("EXECUTIVE SUMMARY:\n")
             f.write("-" * 40 + "\n")
@@ -604,6 +890,203 @@ class Codex67FullValidator:
             f.write("END OF REPORT\n")
             f.write("=" * 80 + "\n")
 
+# ========== BATCH MODE ==========
+
+# Validator reused by every input a batch worker handles
+_batch_validator = None
+
+def expand_inputs(patterns: List[str]) -> List[str]:
+    """
+    Resolve --inputs arguments to input paths.
+    
+    Each argument is a glob pattern, or a manifest file (.txt with one
+    path per line, or .json holding a list of paths) whose relative
+    entries are resolved against the manifest's directory.
+    """
+    inputs = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_file() and path.suffix in ('.txt', '.json') and not is_container(path):
+            with open(path, 'r') as f:
+                entries = json.load(f) if path.suffix == '.json' else f.read().splitlines()
+            if isinstance(entries, list) and all(isinstance(e, str) for e in entries):
+                inputs.extend(str(path.parent / e.strip()) for e in entries
+                              if e.strip() and not e.lstrip().startswith('#'))
+                continue
+        inputs.extend(sorted(glob.glob(pattern)) or [pattern])
+    
+    # Keep first occurrence of each input
+    return list(dict.fromkeys(inputs))
+
+def run_batch(inputs: List[str], output_dir: str,
+              config_path: Optional[str] = None,
+              overrides: Optional[Dict] = None,
+              run_advanced: bool = False,
+              run_cross_validation: bool = False,
+              n_workers: Optional[int] = None,
+              summary_path: Optional[str] = None) -> List[Dict]:
+    """
+    Validate many inputs in one warm process pool.
+    
+    Each worker builds one Codex67FullValidator and reuses its config,
+    cache and report writer for every input it is handed; per-run state,
+    including the QuantumPatternValidator and the global RNG seed, is
+    reset per input. At most two inputs per worker are queued at a time.
+    Every input gets its own JSON report in output_dir, and one NDJSON
+    line per input is appended to the summary as it completes.
+    
+    Returns:
+        Summary records in completion order
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    summary_path = Path(summary_path) if summary_path else output_dir / 'summary.ndjson'
+    n_workers = max(1, min(n_workers or os.cpu_count() or 1, len(inputs)))
+    
+    # One report name per input, disambiguating repeated stems
+    names = [Path(p).stem or Path(p).name for p in inputs]
+    basenames = [
+        f"{name}_report" if names.count(name) == 1 else f"{name}_{i:04d}_report"
+        for i, name in enumerate(names)
+    ]
+    tasks = list(zip(inputs, basenames))
+    overrides = dict(overrides or {}, output_dir=str(output_dir))
+    init_args = (config_path, overrides, run_advanced, run_cross_validation)
+    
+    records = []
+    batch_start = time.perf_counter()
+    
+    def report_progress(record: Dict):
+        records.append(record)
+        summary.write(json.dumps(record) + "\n")
+        summary.flush()
+        status = (f"QAL {record['qal_score']:.3f} {record['validation_level']}"
+                  if record['error'] is None else f"ERROR {record['error']}")
+        print(f"[{len(records)}/{len(tasks)}] {record['input']}  {status}  "
+              f"({record['wall_seconds']:.2f}s)")
+    
+    with open(summary_path, 'w') as summary:
+        if n_workers == 1:
+            _init_batch_worker(*init_args)
+            for task in tasks:
+                report_progress(_validate_batch_input(task))
+        else:
+            with ProcessPoolExecutor(n_workers, initializer=_init_batch_worker,
+                                     initargs=init_args) as executor:
+                pending = set()
+                queued = iter(tasks)
+                for task in queued:
+                    pending.add(executor.submit(_validate_batch_input, task))
+                    
+                    # Bounded queue: wait for a slot before submitting more
+                    if len(pending) >= 2 * n_workers:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            report_progress(future.result())
+                
+                for future in wait(pending).done:
+                    report_progress(future.result())
+    
+    elapsed = time.perf_counter() - batch_start
+    n_failed = sum(1 for r in records if r['error'] is not None)
+    print(f"\nBatch complete: {len(records)} inputs ({n_failed} failed) "
+          f"in {elapsed:.1f}s on {n_workers} worker(s)")
+    print(f"Summary written to '{summary_path}'")
+    return records
+
+def _init_batch_worker(config_path: Optional[str], overrides: Dict,
+                       run_advanced: bool, run_cross_validation: bool):
+    """Build the validator a batch worker reuses for all its inputs."""
+    global _batch_validator
+    validator = Codex67FullValidator(config_path)
+    _apply_overrides(validator, overrides)
+    
+    # Reports are written per input; folds run serially inside a worker
+    validator.config['generate_report'] = False
+    validator.config['n_jobs'] = 1
+    _batch_validator = (validator, run_advanced, run_cross_validation)
+
+def _validate_batch_input(task: Tuple[str, str]) -> Dict:
+    """Validate one input, write its report and return its summary record."""
+    input_path, basename = task
+    validator, run_advanced, run_cross_validation = _batch_validator
+    
+    # Fresh per-run state: the quantum pattern validator accumulates its
+    # results and draws from the global RNG, which __init__ seeds per run
+    validator.validator = QuantumPatternValidator(validator.config)
+    np.random.seed(validator.config.get('random_seed', 42))
+    validator.results = {}
+    validator.metrics.reset()
+    start = time.perf_counter()
+    
+    record = {'input': input_path, 'report': None, 'qal_score': None,
+              'validation_level': None, 'overall_validated': None,
+              'meta_validated': None, 'wall_seconds': None, 'error': None}
+    try:
+        # The suite's console output would interleave across workers
+        with redirect_stdout(io.StringIO()):
+            test_data = validator.load_test_data(input_path)
+            report = validator.run_validation(
+                test_data,
+                run_advanced=run_advanced,
+                run_cross_validation=run_cross_validation
+            )
+        report_files = validator.report_writer.write(report, basename)
+        
+        record.update({
+            'report': str(next(iter(report_files.values()))),
+            'qal_score': report.get('qal_score', 0),
+            'validation_level': report.get('validation_level', 'UNKNOWN'),
+            'overall_validated': bool(report.get('overall_validated', False)),
+            'meta_validated': bool(report.get('meta_validated', False))
+        })
+    except Exception as e:
+        record['error'] = f"{type(e).__name__}: {e}"
+    
+    record['wall_seconds'] = time.perf_counter() - start
+    return record
+
+def _apply_overrides(validator: Codex67FullValidator, overrides: Dict):
+    """Apply command-line config overrides, keeping the cache in step."""
+    validator.config.update(overrides)
+    validator.cache.enabled = validator.config.get('use_cache', True)
+    validator.cache.cache_dir = Path(validator.config.get('cache_dir', '.codex67_cache'))
+    validator.metrics.track_memory = validator.config.get('track_memory', False)
+    validator.report_writer = ReportWriter(
+        validator.config.get('output_dir', '.'),
+        formats=tuple(validator.config.get('report_formats', ['pretty']))
+    )
+
+# ========== CROSS-VALIDATION WORKERS ==========
+
+# Configuration and test data shared by all folds of a worker process
+_fold_context = None
+
+def _init_fold_worker(config: Dict, test_data: Dict):
+    """Install config and test data once per worker (inherited under fork)."""
+    global _fold_context
+    _fold_context = (config, test_data)
+
+def _run_fold(fold_args: Tuple) -> Tuple[float, bool]:
+    """Validate one cross-validation fold; returns (qal_score, validated)."""
+    fold_idx, n_splits, seed = fold_args
+    config, test_data = _fold_context
+    print(f"     Fold {fold_idx+1}/{n_splits}...")
+    
+    # Create modified test data for this fold
+    rng = np.random.default_rng(seed)
+    fold_data = Codex67FullValidator._create_fold_data(test_data, fold_idx, n_splits, rng)
+    
+    # The validator draws from the global RNG; seeding it from the fold's
+    # stream keeps fold scores independent of n_jobs and fold order
+    np.random.seed(seed.generate_state(1)[0])
+    
+    # Run validation on fold
+    fold_validator = QuantumPatternValidator(config)
+    fold_results = fold_validator.run_complete_validation(fold_data)
+    
+    return fold_results.get('qal_score', 0), fold_results.get('overall_validated', False)
+
 def main():
     """Main function for command-line interface."""
     parser = argparse.ArgumentParser(
@@ -618,13 +1101,24 @@ Example usage:
   python full_validation.py --input test_data.json
   python full_validation.py --input test_data.json --run-advanced --run-cross
   python full_validation.py --input test_data.json --output my_report.json
+  python full_validation.py --input test_data.json --convert-to test_data/
+  python full_validation.py --input test_data/
+  python full_validation.py --inputs 'nightly/*.json' --output-dir reports/
+  python full_validation.py --inputs nightly_manifest.txt --workers 8
         """
     )
     
-    parser.add_argument(
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument(
         '--input', 
-        required=True,
-        help='Path to input test data JSON file'
+        help='Path to input test data JSON file or container directory'
+    )
+    
+    inputs.add_argument(
+        '--inputs',
+        nargs='+',
+        metavar='PATTERN',
+        help='Batch mode: glob patterns and/or manifest files (.txt or .json list of paths)'
     )
     
     parser.add_argument(
@@ -655,20 +1149,120 @@ Example usage:
         help='Run quick validation with reduced iterations'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Recompute every component instead of using the result cache'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        help='Directory of the result cache (default: .codex67_cache)'
+    )
+    
+    parser.add_argument(
+        '--metrics',
+        metavar='FILE',
+        help='Write stage timings, peak memory and counters as JSON to FILE'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const='validation_profile.prof',
+        metavar='FILE',
+        help='Run under cProfile, dump stats to FILE (default: validation_profile.prof) '
+             'and track per-stage peak memory'
+    )
+    
+    parser.add_argument(
+        '--output-dir',
+        help='Directory for reports (default: current directory; batch mode: batch_reports)'
+    )
+    
+    parser.add_argument(
+        '--report-formats',
+        nargs='+',
+        choices=REPORT_FORMATS,
+        help='Report variants written in one pass (default: pretty)'
+    )
+    
+    parser.add_argument(
+        '--summary',
+        help='Batch mode: aggregate NDJSON summary path (default: OUTPUT_DIR/summary.ndjson)'
+    )
+    
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Batch mode: worker processes (default: one per core)'
+    )
+    
+    parser.add_argument(
+        '--convert-to',
+        metavar='DIR',
+        help='Convert the JSON --input to a container directory and exit'
+    )
+    
     args = parser.parse_args()
     
+    # Command-line config overrides
+    overrides = {}
+    if args.quick:
+        overrides['bootstrap_iterations'] = 100
+        overrides['validation_mode'] = 'quick'
+    if args.no_cache:
+        overrides['use_cache'] = False
+    if args.cache_dir:
+        overrides['cache_dir'] = args.cache_dir
+    if args.profile or args.metrics:
+        overrides['track_memory'] = bool(args.profile)
+    if args.report_formats:
+        overrides['report_formats'] = args.report_formats
+    if args.output_dir and not args.inputs:
+        overrides['output_dir'] = args.output_dir
+    if args.output and not args.inputs:
+        overrides['report_copies'] = [args.output]
+    
+    # Batch mode: many inputs in one warm process pool
+    if args.inputs:
+        inputs = expand_inputs(args.inputs)
+        missing = [p for p in inputs if not Path(p).exists()]
+        if missing:
+            print(f"Error: {len(missing)} input(s) not found, e.g. '{missing[0]}'")
+            return 1
+        
+        print(f"Validating {len(inputs)} inputs...")
+        records = run_batch(
+            inputs, args.output_dir or 'batch_reports',
+            config_path=args.config,
+            overrides=overrides,
+            run_advanced=args.run_advanced,
+            run_cross_validation=args.run_cross,
+            n_workers=args.workers,
+            summary_path=args.summary
+        )
+        return 1 if any(r['error'] is not None for r in records) else 0
+    
     # Check input file exists
     if not Path(args.input).exists():
         print(f"Error: Input file '{args.input}' not found")
         return 1
     
+    # Convert legacy JSON input to the binary container format
+    if args.convert_to:
+        manifest = convert_json_to_container(args.input, args.convert_to)
+        print(f"Container written to '{manifest}'")
+        return 0
+    
     # Initialize validator
     validator = Codex67FullValidator(args.config)
     
-    # Update config for quick mode
-    if args.quick:
-        validator.config['bootstrap_iterations'] = 100
-        validator.config['validation_mode'] = 'quick'
+    # Quick mode, result cache and metrics settings
+    _apply_overrides(validator, overrides)
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
     
     # Load test data
     print(f"Loading test data from '{args.input}'...")
@@ -681,10 +1275,25 @@ Example usage:
         run_cross_validation=args.run_cross
     )
     
-    # Save to specified output if requested
+    if profiler:
+        profiler.disable()
+        profiler.dump_stats(args.profile)
+        print(f"\nProfile written to '{args.profile}'; top functions by cumulative time:")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(15)
+    
+    if args.metrics:
+        validator.metrics.write(args.metrics, {'input': args.input})
+        print(f"\nMetrics written to '{args.metrics}'")
+    
+    if args.profile or args.metrics:
+        print("\nSTAGE TIMINGS:")
+        for line in validator.metrics.format_table():
+            print(f"  {line}")
+    
+    # --output is written alongside the detailed report; without one, on its own
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(results, f, indent=2)
+        if not validator.config.get('generate_report', True):
+            validator.report_writer.write_json(results, args.output)
         print(f"\nReport saved to '{args.output}'")
     
     # Print final summary
@@ -698,6 +1307,8 @@ Example usage:
     print(f"Validation Level: {level}")
     print(f"Overall Validated: {'✅ YES' if results.get('overall_validated') else '❌ NO'}")
     print(f"Meta-Validated:   {'✅ YES' if results.get('meta_validated') else '❌ NO'}")
+    if results.get('terminology_meta_validated') is not None:
+        print(f"Terminology:      {'✅ YES' if results['terminology_meta_validated'] else '❌ NO'}")
     print("=" * 80)
     
     # Print paradigm reminder
@@ -0,0 +1,252 @@
+"""
+PATTERN COMPLETION - INCREMENTAL SCORING
+Stateful pattern completion scoring for a growing corpus.
+
+Adding k sessions to a corpus of N scores only the k*N new-versus-existing
+and k*(k-1)/2 new-versus-new pairs; removing sessions subtracts their
+pairs the same way. The sum behind the mean completion score is kept as
+an exact integer, so any sequence of updates yields the same mean as
+scoring the final corpus from scratch.
+"""
+
+import json
+import numpy as np
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+from validation import metrics
+from validation.pattern_completion import (
+    PatternValidator, PAIR_CHUNK_SIZE, _build_postings, _count_shared_patterns
+)
+
+STATE_VERSION = 1
+
+# Scores are summed exactly in units of 2**-SUM_SCALE_BITS; every float64
+# (subnormals included) is an integer multiple of that unit
+SUM_SCALE_BITS = 1126
+
+class IncrementalCompletionScorer:
+    def __init__(self, validator: Optional[PatternValidator] = None):
+        self.validator = validator or PatternValidator(use_fingerprints=True)
+        
+        # Fingerprints are content hashes, so pattern ids stay comparable
+        # between runs; MD5-mode ids are only meaningful within one corpus
+        if not self.validator.use_fingerprints:
+            raise ValueError("Incremental scoring requires a fingerprint-mode PatternValidator")
+        
+        self.session_ids = []  # Slot -> session id, None once removed
+        self._slots = {}
+        self._sizes = np.zeros(0, dtype=np.int64)
+        self._postings = np.zeros((0, 2), dtype=np.int64)
+        self._sum_units = 0
+    
+    @property
+    def n_sessions(self) -> int:
+        return len(self._slots)
+    
+    @property
+    def n_pairs(self) -> int:
+        return self.n_sessions * (self.n_sessions - 1) // 2
+    
+    def add_sessions(self, conversation_corpus: Dict) -> int:
+        """
+        Add sessions, scoring them against the corpus and each other.
+        
+        Returns:
+            Number of session pairs scored
+        """
+        duplicates = [s for s in conversation_corpus if s in self._slots]
+        if duplicates:
+            raise ValueError(f"Sessions already in corpus: {duplicates[:5]}")
+        
+        session_ids, rows = self.validator.extract_pattern_rows(conversation_corpus)
+        first_slot = len(self.session_ids)
+        new_postings = _build_postings(rows, np.arange(len(rows)))
+        
+        sizes = np.concatenate([self._sizes, [len(r) for r in rows]]).astype(np.int64)
+        pairs_scored = len(rows) * self.n_sessions + len(rows) * (len(rows) - 1) // 2
+        self._sum_units += self._pair_units(new_postings, first_slot, sizes)
+        
+        for offset, session_id in enumerate(session_ids):
+            self._slots[session_id] = first_slot + offset
+        self.session_ids.extend(session_ids)
+        self._sizes = sizes
+        
+        new_postings[:, 1] += first_slot
+        self._postings = _merge_postings(self._postings, new_postings)
+        metrics.count('pairs_scored', pairs_scored)
+        return pairs_scored
+    
+    def remove_sessions(self, session_ids: Iterable) -> int:
+        """
+        Remove sessions, subtracting every pair they took part in.
+        
+        Returns:
+            Number of session pairs removed
+        """
+        session_ids = list(dict.fromkeys(session_ids))
+        missing = [s for s in session_ids if s not in self._slots]
+        if missing:
+            raise ValueError(f"Sessions not in corpus: {missing[:5]}")
+        
+        slots = np.array([self._slots.pop(s) for s in session_ids], dtype=np.int64)
+        removed = np.isin(self._postings[:, 1], slots)
+        
+        # Re-number removed postings 0..k-1 so they score like a new batch
+        # against the remaining index
+        local = np.full(len(self.session_ids), -1, dtype=np.int64)
+        local[slots] = np.arange(len(slots))
+        old_postings = self._postings[removed]
+        old_postings[:, 1] = local[old_postings[:, 1]]
+        self._postings = self._postings[~removed]
+        
+        sizes = np.concatenate([self._sizes, self._sizes[slots]])
+        pairs_removed = len(slots) * self.n_sessions + len(slots) * (len(slots) - 1) // 2
+        self._sum_units -= self._pair_units(old_postings, len(self._sizes), sizes)
+        
+        for slot in slots:
+            self.session_ids[slot] = None
+        self._sizes[slots] = 0
+        return pairs_removed
+    
+    def mean_completion(self) -> float:
+        """Mean completion score over all session pairs, correctly rounded."""
+        if self.n_pairs == 0:
+            return float('nan')
+        return float(Fraction(self._sum_units, self.n_pairs << SUM_SCALE_BITS))
+    
+    def validate_architecture(self) -> bool:
+        """Validate 35-node architecture claims on the current corpus."""
+        return self.mean_completion() > self.validator.validation_threshold
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Persist the scorer state (live sessions only) as an .npz file."""
+        live = [slot for slot, s in enumerate(self.session_ids) if s is not None]
+        remap = np.full(len(self.session_ids), -1, dtype=np.int64)
+        remap[live] = np.arange(len(live))
+        
+        # Postings are sorted by pattern, then slot; compaction keeps the order
+        postings = self._postings.copy()
+        postings[:, 1] = remap[postings[:, 1]]
+        
+        np.savez(
+            path,
+            version=np.int64(STATE_VERSION),
+            session_ids=np.array(json.dumps([self.session_ids[slot] for slot in live])),
+            sizes=self._sizes[live],
+            postings=postings,
+            sum_units=np.array(hex(self._sum_units))
+        )
+    
+    @classmethod
+    def load(cls, path: Union[str, Path],
+             validator: Optional[PatternValidator] = None) -> 'IncrementalCompletionScorer':
+        """Restore a scorer written by save()."""
+        scorer = cls(validator)
+        with np.load(path, allow_pickle=False) as state:
+            if int(state['version']) > STATE_VERSION:
+                raise ValueError(f"Unsupported scorer state version {int(state['version'])}")
+            
+            scorer.session_ids = json.loads(str(state['session_ids']))
+            scorer._sizes = state['sizes'].astype(np.int64)
+            scorer._postings = state['postings'].astype(np.int64)
+            scorer._sum_units = int(str(state['sum_units']), 16)
+        
+        scorer._slots = {s: slot for slot, s in enumerate(scorer.session_ids)}
+        return scorer
+    
+    def _pair_units(self, batch_postings: np.ndarray, first_slot: int,
+                    sizes: np.ndarray) -> int:
+        """
+        Exact score sum of a batch against the index and within itself.
+        
+        batch_postings holds (pattern_id, local_index) rows sorted by
+        pattern; batch session i has size sizes[first_slot + i].
+        """
+        n_batch = int(batch_postings[:, 1].max()) + 1 if len(batch_postings) else 0
+        stride = len(sizes)
+        
+        # Batch versus indexed sessions
+        codes, shared = _cross_shared_patterns(batch_postings, self._postings, stride)
+        batch = first_slot + codes // stride
+        indexed = codes % stride
+        units = _exact_units(shared / (sizes[batch] + sizes[indexed] - shared))
+        
+        # Batch versus batch
+        codes, shared = _count_shared_patterns(batch_postings, max(n_batch, 1))
+        rows = first_slot + codes // max(n_batch, 1)
+        cols = first_slot + codes % max(n_batch, 1)
+        units += _exact_units(shared / (sizes[rows] + sizes[cols] - shared))
+        return units
+
+def _merge_postings(postings: np.ndarray, new_postings: np.ndarray) -> np.ndarray:
+    """Union of two posting tables, sorted by pattern, then session."""
+    merged = np.concatenate([postings, new_postings])
+    return merged[np.lexsort((merged[:, 1], merged[:, 0]))]
+
+def _cross_shared_patterns(batch_postings: np.ndarray, index_postings: np.ndarray,
+                           stride: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count shared patterns between batch sessions and indexed sessions.
+    
+    Returns:
+        (pair_codes, counts) with pair_code = batch_index * stride +
+        indexed_session, sorted ascending, nonzero counts only.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    if len(batch_postings) == 0 or len(index_postings) == 0:
+        return empty, empty
+    
+    # Posting run of each batch pattern in the index
+    patterns = index_postings[:, 0]
+    lo = np.searchsorted(patterns, batch_postings[:, 0], side='left')
+    lengths = np.searchsorted(patterns, batch_postings[:, 0], side='right') - lo
+    hit = lengths > 0
+    lo, lengths, batch = lo[hit], lengths[hit], batch_postings[hit, 1]
+    if not len(lo):
+        return empty, empty
+    
+    # Expand runs to (batch, indexed) pairs in chunks of ~PAIR_CHUNK_SIZE
+    ends = np.cumsum(lengths)
+    bounds = np.unique(np.r_[0, np.searchsorted(ends, np.arange(PAIR_CHUNK_SIZE, ends[-1], PAIR_CHUNK_SIZE)), len(lo)])
+    code_chunks, count_chunks = [], []
+    
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        run_lengths = lengths[start:stop]
+        first = np.repeat(lo[start:stop] - np.r_[0, np.cumsum(run_lengths)[:-1]], run_lengths)
+        positions = first + np.arange(len(first))
+        codes = np.repeat(batch[start:stop], run_lengths) * stride + index_postings[positions, 1]
+        codes, counts = np.unique(codes, return_counts=True)
+        code_chunks.append(codes)
+        count_chunks.append(counts)
+    
+    codes = np.concatenate(code_chunks)
+    counts = np.concatenate(count_chunks)
+    order = np.argsort(codes, kind='stable')
+    codes, counts = codes[order], counts[order]
+    
+    # Merge per-chunk counts of the same pair
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    return codes[starts], np.add.reduceat(counts, starts)
+
+def _exact_units(values: np.ndarray) -> int:
+    """Exact sum of non-negative float64 values in units of 2**-SUM_SCALE_BITS."""
+    values = values[values > 0]
+    if not len(values):
+        return 0
+    
+    # values = mantissa * 2**(exponent - 53) with 53-bit integer mantissas,
+    # summed per exponent as 26- and 27-bit halves so int64 cannot overflow
+    fractions, exponents = np.frexp(values)
+    mantissas = (fractions * (1 << 53)).astype(np.int64)
+    order = np.argsort(exponents, kind='stable')
+    exponents, mantissas = exponents[order], mantissas[order]
+    starts = np.flatnonzero(np.r_[True, exponents[1:] != exponents[:-1]])
+    
+    high = np.add.reduceat(mantissas >> 27, starts)
+    low = np.add.reduceat(mantissas & ((1 << 27) - 1), starts)
+    return sum(
+        ((int(h) << 27) + int(l)) << int(e - 53 + SUM_SCALE_BITS)
+        for h, l, e in zip(high, low, exponents[starts])
+    )
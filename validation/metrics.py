@@ -0,0 +1,126 @@
+"""
+VALIDATION METRICS
+Stage timings, peak memory and work counters for validation runs.
+
+A StageMetrics collector times nested stages with `with metrics.stage(...)`.
+While a collector is active, components report work through the
+module-level count() and gauge() functions; with no active collector
+these are no-ops, so instrumented code pays almost nothing when no one is
+measuring.
+"""
+
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+# Collectors receiving count()/gauge() calls, innermost last
+_active = []
+
+def count(name: str, value: int = 1):
+    """Add to a work counter of the active collector, if any."""
+    if _active:
+        counters = _active[-1].counters
+        counters[name] = counters.get(name, 0) + int(value)
+
+def gauge(name: str, value: float):
+    """Record the latest value of a measurement on the active collector."""
+    if _active:
+        _active[-1].gauges[name] = value
+
+class StageMetrics:
+    def __init__(self, track_memory: bool = False):
+        # Peak memory needs tracemalloc, which slows Python-level loops
+        self.track_memory = track_memory
+        self.reset()
+    
+    def reset(self):
+        """Drop everything recorded so far."""
+        self.stages = {}
+        self.counters = {}
+        self.gauges = {}
+        self._stack = []
+        self._started_tracing = False
+    
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a stage (and its peak traced memory when track_memory is on).
+        
+        Stages nest; each is recorded under its slash-joined path, e.g.
+        'bootstrap/completion_scores'. Repeated stages accumulate.
+        """
+        path = '/'.join([frame['path'] for frame in self._stack[-1:]] + [name])
+        frame = {'path': path, 'peak': 0}
+        
+        # Registered on entry so stages list in the order they start
+        record = self.stages.setdefault(path, {'seconds': 0.0, 'cpu_seconds': 0.0, 'calls': 0})
+        
+        if self.track_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracing = True
+            # Fold the peak so far into the parent before resetting it
+            current, peak = tracemalloc.get_traced_memory()
+            if self._stack:
+                self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+            tracemalloc.reset_peak()
+            frame['base'] = current
+        
+        self._stack.append(frame)
+        _active.append(self)
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield self
+        finally:
+            wall = time.perf_counter() - wall_start
+            cpu = time.process_time() - cpu_start
+            _active.pop()
+            self._stack.pop()
+            
+            record['seconds'] += wall
+            record['cpu_seconds'] += cpu
+            record['calls'] += 1
+            
+            if self.track_memory:
+                peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+                if self._stack:
+                    self._stack[-1]['peak'] = max(self._stack[-1]['peak'], peak)
+                record['peak_memory_bytes'] = max(record.get('peak_memory_bytes', 0),
+                                                  peak - frame['base'])
+                if not self._stack and self._started_tracing:
+                    tracemalloc.stop()
+                    self._started_tracing = False
+    
+    def summary(self) -> Dict:
+        """Machine-readable timings, counters and gauges."""
+        top_level = [record for path, record in self.stages.items() if '/' not in path]
+        return {
+            'total_seconds': sum(record['seconds'] for record in top_level),
+            'stages': {path: dict(record) for path, record in self.stages.items()},
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'memory_tracked': self.track_memory
+        }
+    
+    def write(self, path: Union[str, Path], extra: Optional[Dict] = None):
+        """Write the summary (plus any extra fields) as a JSON metrics file."""
+        metrics = self.summary()
+        metrics.update(extra or {})
+        with open(path, 'w') as f:
+            json.dump(metrics, f, indent=2, default=float)
+    
+    def format_table(self) -> List[str]:
+        """Human-readable stage lines, indented by nesting depth."""
+        lines = []
+        for path, record in self.stages.items():
+            depth = path.count('/')
+            label = '  ' * depth + path.rsplit('/', 1)[-1]
+            line = f"{label:<36} {record['seconds']:9.3f}s"
+            if 'peak_memory_bytes' in record:
+                line += f"  {record['peak_memory_bytes'] / 2**20:9.1f} MiB"
+            lines.append(line)
+        return lines
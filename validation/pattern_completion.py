@@ -4,13 +4,136 @@ Independent implementation of validated methodology.
 """
 
 import numpy as np
-from typing import List, Dict
+from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
 import hashlib
+import os
 
-class PatternValidator:
+from validation import metrics
+
+# 64-bit polynomial base and per-width salts for rolling n-gram fingerprints
+FINGERPRINT_BASE = np.uint64(0x100000001B3)
+FINGERPRINT_SALTS = {3: np.uint64(0x9E3779B97F4A7C15),
+                     4: np.uint64(0xC2B2AE3D27D4EB4F),
+                     5: np.uint64(0x165667B19E3779F9)}
+
+# Upper bound on co-occurring session pairs materialized at once while
+# counting shared patterns from the inverted index.
+PAIR_CHUNK_SIZE = 1 << 22
+
+# Sessions per pattern-extraction task in the parallel backend
+EXTRACTION_CHUNK_SIZE = 256
+
+class Vocabulary:
+    """
+    Shared word interning for the tokenize-once pipeline.
+    
+    Each distinct word gets a dense int32 token id on first sight, and its
+    64-bit key (word_key) is computed once. A session is split into words a
+    single time; all n-gram work then runs on its token array.
+    
+    The vocabulary only grows: every word ever encoded stays interned, as
+    token arrays handed out earlier refer to its id. Long-lived users
+    that see unbounded text should start a fresh vocabulary per corpus
+    (PatternValidator.reset_vocabulary) rather than share one forever.
+    """
+    
     def __init__(self):
+        self.ids = {}
+        self.words = []
+        self._keys = np.zeros(1024, dtype=np.uint64)
+    
+    def __len__(self) -> int:
+        return len(self.words)
+    
+    def __contains__(self, word: str) -> bool:
+        return word in self.ids
+    
+    def get(self, word: str, default: Optional[int] = None) -> Optional[int]:
+        return self.ids.get(word, default)
+    
+    @property
+    def keys(self) -> np.ndarray:
+        """word_key of every token id."""
+        return self._keys[:len(self.words)]
+    
+    def encode(self, words: List[str]) -> np.ndarray:
+        """Token ids of a word sequence, interning new words."""
+        ids = self.ids
+        get = ids.get
+        token_ids = [get(word, -1) for word in words]
+        
+        # Slow path only for sequences that bring new words
+        new_words = []
+        if -1 in token_ids:
+            for i, word in enumerate(words):
+                if token_ids[i] == -1:
+                    token_id = ids.get(word)
+                    if token_id is None:
+                        token_id = ids[word] = len(ids)
+                        new_words.append(word)
+                    token_ids[i] = token_id
+        
+        # Hash each new word once; n-gram fingerprints only combine these keys
+        if new_words:
+            n_known = len(self.words)
+            self.words.extend(new_words)
+            if len(ids) > len(self._keys):
+                grown = np.zeros(max(len(ids), 2 * len(self._keys)), dtype=np.uint64)
+                grown[:n_known] = self._keys[:n_known]
+                self._keys = grown
+            self._keys[n_known:len(ids)] = [word_key(w) for w in new_words]
+        
+        return np.array(token_ids, dtype=np.int32)
+    
+    def encode_session(self, session: Union[List[str], np.ndarray]) -> np.ndarray:
+        """
+        Token ids of a session (list of utterances).
+        
+        Splitting each utterance gives the same words as splitting the
+        joined session text. Token arrays are returned unchanged, so
+        pre-tokenized sessions pass straight through.
+        """
+        if isinstance(session, np.ndarray):
+            return session
+        return self.encode([word for utterance in session for word in utterance.split()])
+    
+    def decode(self, token_ids: np.ndarray) -> List[str]:
+        words = self.words
+        return [words[t] for t in token_ids]
+
+class PatternValidator:
+    def __init__(self, use_fingerprints: bool = False,
+                 n_workers: Optional[int] = 1):
         self.pattern_bank = {}
         self.validation_threshold = 0.7  # Externally validated
+        
+        # Fingerprint mode replaces MD5 hex patterns with uint64 hashes
+        self.use_fingerprints = use_fingerprints
+        
+        # Worker processes for pairwise scoring; None uses every core
+        self.n_workers = n_workers or os.cpu_count() or 1
+        
+        # Shared by every session scored; grows with each new word
+        self.vocabulary = Vocabulary()
+    
+    def reset_vocabulary(self) -> None:
+        """
+        Drop every interned word and start an empty vocabulary.
+        
+        Token arrays from earlier tokenize() calls refer to the old ids
+        and must not be passed in afterwards; tokenize the sessions again.
+        """
+        self.vocabulary = Vocabulary()
+    
+    def tokenize(self, session: List[str]) -> np.ndarray:
+        """Token-id array of a session; every other method also accepts it."""
+        return self.vocabulary.encode_session(session)
+    
+    def tokenize_corpus(self, conversation_corpus: Dict) -> Dict:
+        """Corpus with every session converted once to a token-id array."""
+        return {session_id: self.vocabulary.encode_session(session)
+                for session_id, session in conversation_corpus.items()}
     
     def extract_patterns(self, text: str) -> List[str]:
         """Extract n-gram patterns from text."""
@@ -21,37 +144,398 @@ class PatternValidator:
                 pattern = ' '.join(words[i:i+n])
                 pattern_hash = hashlib.md5(pattern.encode()).hexdigest()
                 patterns.append(pattern_hash)
+        metrics.count('ngrams_hashed', len(patterns))
         return patterns
     
-    def calculate_completion(self, session_a: List[str], 
-                           session_b: List[str]) -> float:
-        """Calculate pattern completion rate between sessions."""
-        patterns_a = set(self.extract_patterns(' '.join(session_a)))
-        patterns_b = set(self.extract_patterns(' '.join(session_b)))
+    def extract_fingerprints(self, text: str) -> np.ndarray:
+        """Extract sorted, unique 64-bit n-gram fingerprints from text."""
+        return self.session_fingerprints(self.vocabulary.encode(text.split()))
+    
+    def session_fingerprints(self, token_ids: np.ndarray) -> np.ndarray:
+        """Sorted, unique 64-bit n-gram fingerprints of a token array."""
+        fingerprints = ngram_fingerprints(self.vocabulary.keys[token_ids])
+        metrics.count('ngrams_hashed', sum(len(f) for f in fingerprints))
+        return _sorted_unique(np.concatenate(fingerprints))
+    
+    def audit_fingerprints(self, text: str) -> Dict:
+        """Check fingerprints of text for collisions against the MD5 patterns."""
+        words = text.split()
+        fingerprints = ngram_fingerprints(self.vocabulary.keys[self.vocabulary.encode(words)])
+        
+        # Group exact MD5 patterns under the fingerprint they were given
+        buckets = {}
+        for n, width_fingerprints in zip([3, 4, 5], fingerprints):
+            for i, fingerprint in enumerate(width_fingerprints.tolist()):
+                pattern = ' '.join(words[i:i+n])
+                pattern_hash = hashlib.md5(pattern.encode()).hexdigest()
+                buckets.setdefault(fingerprint, set()).add(pattern_hash)
+        
+        n_patterns = len(set().union(*buckets.values())) if buckets else 0
+        collisions = sum(1 for hashes in buckets.values() if len(hashes) > 1)
+        
+        return {
+            'n_patterns': n_patterns,
+            'n_fingerprints': len(buckets),
+            'collisions': collisions,
+            'collision_free': collisions == 0
+        }
+    
+    def calculate_completion(self, session_a: Union[List[str], np.ndarray],
+                             session_b: Union[List[str], np.ndarray]) -> float:
+        """
+        Calculate pattern completion rate between sessions.
+        
+        Sessions are lists of utterances or token arrays from tokenize().
+        """
+        tokens_a = self.vocabulary.encode_session(session_a)
+        tokens_b = self.vocabulary.encode_session(session_b)
+        
+        if self.use_fingerprints:
+            patterns_a = self.session_fingerprints(tokens_a)
+            patterns_b = self.session_fingerprints(tokens_b)
+        else:
+            patterns_a, patterns_b = _ngram_rows([tokens_a, tokens_b])
         
         # Pattern completion = intersection / union
-        if not patterns_a or not patterns_b:
+        if not len(patterns_a) or not len(patterns_b):
             return 0.0
         
-        intersection = patterns_a.intersection(patterns_b)
-        union = patterns_a.union(patterns_b)
+        intersection = len(np.intersect1d(patterns_a, patterns_b, assume_unique=True))
+        union = len(patterns_a) + len(patterns_b) - intersection
         
-        return len(intersection) / len(union)
+        return intersection / union
     
-    def validate_architecture(self, conversation_corpus: Dict) -> bool:
-        """Validate 35-node architecture claims."""
-        completion_scores = []
+    def build_pattern_index(self, conversation_corpus: Dict) -> Tuple[List, np.ndarray, np.ndarray]:
+        """
+        Extract every session's pattern set once and build an inverted index.
         
-        # Test all session pairs
+        Returns:
+            (session_ids, sizes, postings) where sizes holds the number of
+            distinct patterns per session and postings is a (n_entries, 2)
+            array of (pattern_id, session_index) rows sorted by pattern, so
+            each pattern's posting list is a contiguous run of sessions.
+        """
+        session_ids, rows = self.extract_pattern_rows(conversation_corpus)
+        sizes = np.array([len(r) for r in rows], dtype=np.int64)
+        postings = _build_postings(rows, np.arange(len(rows)))
+        
+        return session_ids, sizes, postings
+    
+    def extract_pattern_rows(self, conversation_corpus: Dict) -> Tuple[List, List[np.ndarray]]:
+        """
+        Extract each session's distinct patterns once as integer pattern ids.
+        
+        With n_workers > 1 sessions are extracted on a process pool in
+        chunks of EXTRACTION_CHUNK_SIZE.
+        """
         session_ids = list(conversation_corpus.keys())
-        for i in range(len(session_ids)):
-            for j in range(i+1, len(session_ids)):
-                score = self.calculate_completion(
-                    conversation_corpus[session_ids[i]],
-                    conversation_corpus[session_ids[j]]
-                )
-                completion_scores.append(score)
+        tokens = [self.vocabulary.encode_session(conversation_corpus[s]) for s in session_ids]
+        
+        if not self.use_fingerprints:
+            # Exact n-gram ids straight from the token arrays
+            return session_ids, _ngram_rows(tokens)
+        
+        if self.n_workers > 1 and len(tokens) > EXTRACTION_CHUNK_SIZE:
+            # Workers only need each session's word keys, not the vocabulary
+            keys = self.vocabulary.keys
+            chunks = [[keys[t] for t in tokens[i:i + EXTRACTION_CHUNK_SIZE]]
+                      for i in range(0, len(tokens), EXTRACTION_CHUNK_SIZE)]
+            with ProcessPoolExecutor(self.n_workers) as executor:
+                extracted = [
+                    fingerprints
+                    for chunk in executor.map(_fingerprint_chunk, chunks)
+                    for fingerprints in chunk
+                ]
+        else:
+            extracted = [self.session_fingerprints(t) for t in tokens]
+        
+        # Fingerprints serve directly as pattern ids
+        return session_ids, [f.view(np.int64) for f in extracted]
+    
+    def score_pairs(self, conversation_corpus: Dict) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score every session pair that shares at least one pattern.
+        
+        Intersections are counted from the posting lists of the inverted
+        index, so pairs with nothing in common are never visited.
+        
+        Returns:
+            (rows, cols, scores) with rows < cols indexing the corpus order.
+        """
+        session_ids, rows = self.extract_pattern_rows(conversation_corpus)
+        sizes = np.array([len(r) for r in rows], dtype=np.int64)
+        n_sessions = max(len(session_ids), 1)
+        
+        if self.n_workers > 1:
+            pair_codes, shared = _score_tiles_parallel(rows, self.n_workers)
+        else:
+            postings = _build_postings(rows, np.arange(len(rows)))
+            pair_codes, shared = _count_shared_patterns(postings, n_sessions)
+        
+        metrics.count('pairs_overlapping', len(pair_codes))
+        rows = pair_codes // n_sessions
+        cols = pair_codes % n_sessions
+        union = sizes[rows] + sizes[cols] - shared
+        scores = shared / union
+        return rows, cols, scores
+    
+    def completion_scores(self, conversation_corpus: Dict) -> np.ndarray:
+        """Pairwise completion scores in the order of the all-pairs loop."""
+        n_sessions = len(conversation_corpus)
+        rows, cols, scores = self.score_pairs(conversation_corpus)
+        metrics.count('pairs_scored', n_sessions * (n_sessions - 1) // 2)
+        
+        # Pairs without shared patterns score 0.0, as calculate_completion
+        completion_scores = np.zeros(n_sessions * (n_sessions - 1) // 2)
+        completion_scores[_condensed_index(rows, cols, n_sessions)] = scores
+        return completion_scores
+    
+    def validate_architecture(self, conversation_corpus: Dict,
+                              memory_budget: Optional[int] = None) -> bool:
+        """
+        Validate 35-node architecture claims.
+        
+        conversation_corpus may also be a SessionStore, whose pairs are
+        scored block by block from disk within memory_budget bytes.
+        """
+        if not isinstance(conversation_corpus, dict):
+            mean_score = (conversation_corpus.mean_completion(memory_budget) if memory_budget
+                          else conversation_corpus.mean_completion())
+            return mean_score > self.validation_threshold
+        
+        # Test all session pairs
+        completion_scores = self.completion_scores(conversation_corpus)
         
         # Check if meets validated threshold
         mean_score = np.mean(completion_scores)
         return mean_score > self.validation_threshold
+
+def word_key(word: str) -> int:
+    """64-bit key of a word; n-gram fingerprints only combine these keys."""
+    return int.from_bytes(hashlib.md5(word.encode()).digest()[:8], 'little')
+
+def ngram_fingerprints(keys: np.ndarray) -> List[np.ndarray]:
+    """Rolling 64-bit hashes of the 3-, 4- and 5-grams of a word key sequence."""
+    fingerprints = []
+    
+    # Width n extends width n-1 by one word: h_n = h_{n-1} * base + key
+    rolling = keys
+    for n in range(2, 6):
+        rolling = rolling[:-1] * FINGERPRINT_BASE + keys[n-1:]
+        if n in FINGERPRINT_SALTS:
+            fingerprints.append(_mix64(rolling ^ FINGERPRINT_SALTS[n]))
+    return fingerprints
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer; spreads rolling hashes over all 64 bits."""
+    values = (values ^ (values >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    values = (values ^ (values >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return values ^ (values >> np.uint64(31))
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """Sorted distinct values via one sort and a neighbour comparison."""
+    values = np.sort(values)
+    return values[np.r_[True, values[1:] != values[:-1]]] if len(values) else values
+
+def _build_postings(rows: List[np.ndarray], sessions: np.ndarray) -> np.ndarray:
+    """(pattern_id, session_index) rows sorted by pattern, then session."""
+    sizes = np.array([len(r) for r in rows], dtype=np.int64)
+    postings = np.column_stack([
+        np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64),
+        np.repeat(np.asarray(sessions, dtype=np.int64), sizes)
+    ])
+    return postings[np.lexsort((postings[:, 1], postings[:, 0]))]
+
+def _ngram_rows(token_arrays: List[np.ndarray]) -> List[np.ndarray]:
+    """
+    Sorted distinct exact n-gram ids (3- to 5-grams) of each token array.
+    
+    Equal n-grams get equal ids across all arrays, so the rows behave like
+    the interned MD5 pattern sets of extract_patterns without hashing or
+    joining any text.
+    """
+    n_sessions = len(token_arrays)
+    lengths = np.array([len(t) for t in token_arrays], dtype=np.int64)
+    tokens = (np.concatenate(token_arrays).astype(np.int64) if n_sessions
+              else np.zeros(0, dtype=np.int64))
+    owner = np.repeat(np.arange(n_sessions), lengths)
+    base = int(tokens.max()) + 1 if len(tokens) else 1
+    
+    id_chunks, session_chunks = [], []
+    n_ids = 0
+    ranks = tokens
+    for n in range(2, 6):
+        if len(tokens) < n:
+            break
+        # An n-gram is its (n-1)-gram prefix plus one token; dense prefix
+        # ranks keep the combined key within 64 bits at any width
+        keys = ranks[:-1] * base + tokens[n-1:]
+        order = np.argsort(keys)
+        sorted_keys = keys[order]
+        new_group = np.r_[True, sorted_keys[1:] != sorted_keys[:-1]]
+        ranks = np.empty(len(keys), dtype=np.int64)
+        ranks[order] = np.cumsum(new_group) - 1
+        if n < 3:
+            continue
+        
+        # Windows that start and end in the same session
+        valid = owner[:1 - n] == owner[n-1:]
+        metrics.count('ngrams_hashed', int(valid.sum()))
+        id_chunks.append(n_ids + ranks[valid])
+        session_chunks.append(owner[:1 - n][valid])
+        n_ids += int(new_group.sum())
+    
+    if not id_chunks:
+        return [np.zeros(0, dtype=np.int64) for _ in range(n_sessions)]
+    
+    # One (session, id) code per occurrence; distinct codes split into rows
+    codes = _sorted_unique(np.concatenate(session_chunks) * n_ids + np.concatenate(id_chunks))
+    bounds = np.searchsorted(codes, np.arange(1, n_sessions) * n_ids)
+    return np.split(codes % n_ids, bounds)
+
+def _condensed_index(rows: np.ndarray, cols: np.ndarray, n: int) -> np.ndarray:
+    """Position of pair (i, j), i < j, in the row-major upper triangle."""
+    return rows * (2 * n - rows - 1) // 2 + (cols - rows - 1)
+
+def _count_shared_patterns(postings: np.ndarray, n_sessions: int,
+                           split: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Count shared patterns per session pair from sorted posting lists.
+    
+    With split, only pairs of one session below split and one at or
+    above it are counted (the cross pairs of two session blocks).
+    
+    Returns:
+        (pair_codes, counts) with pair_code = i * n_sessions + j, i < j,
+        sorted ascending and covering only pairs with a nonzero count.
+    """
+    empty = (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64))
+    if len(postings) == 0:
+        return empty
+    
+    # Contiguous runs of equal pattern id are the posting lists
+    starts = np.flatnonzero(np.r_[True, postings[1:, 0] != postings[:-1, 0]])
+    lengths = np.diff(np.r_[starts, len(postings)])
+    sessions = postings[:, 1]
+    
+    if split is None:
+        heads = np.zeros_like(lengths)
+        pairing = lengths > 1
+    else:
+        # Sessions are sorted within a list, so those below split lead it
+        heads = np.add.reduceat((sessions < split).astype(np.int64), starts)
+        pairing = (heads > 0) & (heads < lengths)
+    
+    merged = empty
+    code_chunks, count_chunks = [], []
+    n_buffered = 0
+    
+    # Posting lists of equal shape expand to pairs as one matrix
+    width = int(lengths.max()) + 1
+    shapes = heads * width + lengths
+    for shape in np.unique(shapes[pairing]):
+        head, length = divmod(int(shape), width)
+        run_starts = starts[shapes == shape]
+        if split is None:
+            left, right = np.triu_indices(length, 1)
+        else:
+            left, right = np.divmod(np.arange(head * (length - head)), length - head)
+            right += head
+        rows_per_chunk = max(1, PAIR_CHUNK_SIZE // len(left))
+        
+        for c in range(0, len(run_starts), rows_per_chunk):
+            block = sessions[run_starts[c:c + rows_per_chunk, None] + np.arange(length)]
+            codes = (block[:, left] * n_sessions + block[:, right]).ravel()
+            codes, counts = np.unique(codes, return_counts=True)
+            code_chunks.append(codes)
+            count_chunks.append(counts)
+            n_buffered += len(codes)
+            
+            # Fold buffered chunks into the running counts, so memory is
+            # bounded by the distinct pairs plus PAIR_CHUNK_SIZE codes
+            if n_buffered >= PAIR_CHUNK_SIZE:
+                merged = _merge_pair_counts([merged[0]] + code_chunks, [merged[1]] + count_chunks)
+                code_chunks, count_chunks = [], []
+                n_buffered = 0
+    
+    return _merge_pair_counts([merged[0]] + code_chunks, [merged[1]] + count_chunks)
+
+def _merge_pair_counts(code_chunks: List[np.ndarray],
+                       count_chunks: List[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """Sorted distinct pair codes with the counts of equal codes summed."""
+    codes = np.concatenate(code_chunks)
+    counts = np.concatenate(count_chunks)
+    if len(codes) == 0:
+        return codes, counts
+    order = np.argsort(codes, kind='stable')
+    codes, counts = codes[order], counts[order]
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    return codes[starts], np.add.reduceat(counts, starts)
+
+# ========== PARALLEL BACKEND ==========
+
+# Pattern rows of the corpus being scored, installed once per worker
+_worker_rows = None
+
+def _fingerprint_chunk(key_arrays: List[np.ndarray]) -> List[np.ndarray]:
+    """Worker task: sorted, unique fingerprints of a chunk of word-key arrays."""
+    return [_sorted_unique(np.concatenate(ngram_fingerprints(keys))) for keys in key_arrays]
+
+def _init_tile_worker(flat: np.ndarray, offsets: np.ndarray):
+    """Install the corpus pattern rows in a worker process.
+    
+    Under the fork start method the arrays are inherited rather than
+    pickled; otherwise they are sent once per worker, never per pair.
+    """
+    global _worker_rows
+    _worker_rows = (flat, offsets)
+
+def _score_tile(tile: Tuple[int, int, int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """Worker task: shared-pattern counts for pairs in one upper-triangle tile."""
+    row_start, row_end, col_start, col_end = tile
+    flat, offsets = _worker_rows
+    n_sessions = len(offsets) - 1
+    
+    # Diagonal tiles pair sessions within one block; off-diagonal tiles
+    # count only pairs across their two disjoint blocks, as the pairs
+    # within each block belong to the diagonal tiles
+    sessions = np.arange(row_start, row_end)
+    split = None
+    if col_start != row_start:
+        sessions = np.r_[sessions, np.arange(col_start, col_end)]
+        split = col_start
+    rows = [flat[offsets[s]:offsets[s + 1]] for s in sessions]
+    
+    return _count_shared_patterns(_build_postings(rows, sessions), n_sessions, split)
+
+def _score_tiles_parallel(rows: List[np.ndarray], n_workers: int,
+                          tiles_per_worker: int = 4) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Score the upper-triangular pair matrix tile by tile on a process pool.
+    
+    Each pair falls in exactly one tile, so the merged result is identical
+    to the serial _count_shared_patterns output.
+    """
+    n_sessions = len(rows)
+    if n_sessions < 2:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    
+    # B blocks give B*(B+1)/2 tiles; aim for a few tiles per worker
+    n_blocks = max(1, min(n_sessions, int(np.ceil(np.sqrt(2 * tiles_per_worker * n_workers)))))
+    bounds = np.linspace(0, n_sessions, n_blocks + 1).astype(int)
+    tiles = [
+        (bounds[a], bounds[a + 1], bounds[b], bounds[b + 1])
+        for a in range(n_blocks) for b in range(a, n_blocks)
+    ]
+    
+    flat = np.concatenate(rows)
+    offsets = np.r_[0, np.cumsum([len(r) for r in rows])]
+    
+    with ProcessPoolExecutor(n_workers, initializer=_init_tile_worker,
+                             initargs=(flat, offsets)) as executor:
+        results = list(executor.map(_score_tile, tiles))
+    
+    codes = np.concatenate([codes for codes, _ in results])
+    counts = np.concatenate([counts for _, counts in results])
+    order = np.argsort(codes, kind='stable')
+    return codes[order], counts[order]
@@ -0,0 +1,179 @@
+"""
+PATTERN COMPLETION - MINHASH APPROXIMATION
+Approximate pattern completion scoring for very large corpora.
+
+MinHash signatures estimate the Jaccard completion rate of any session
+pair; LSH banding finds the high-similarity pairs without scoring all
+N*(N-1)/2 of them.
+"""
+
+import numpy as np
+from typing import List, Dict, Optional, Tuple, Union
+
+from validation.pattern_completion import PatternValidator, _mix64, _count_shared_patterns
+
+# Signature value of a session without patterns; never counted as a match
+EMPTY_SIGNATURE = np.uint64(0xFFFFFFFFFFFFFFFF)
+
+# Upper bound on (signature row, pattern) hash evaluations held at once
+HASH_CHUNK_SIZE = 1 << 22
+
+class MinHashPatternEstimator:
+    def __init__(self, validator: Optional[PatternValidator] = None,
+                 n_signatures: int = 128, n_bands: int = 32,
+                 seed: int = 42):
+        self.validator = validator or PatternValidator()
+        self.n_signatures = n_signatures
+        self.n_bands = n_bands
+        
+        if n_bands and n_signatures % n_bands:
+            raise ValueError(
+                f"n_signatures ({n_signatures}) must be a multiple of n_bands ({n_bands})"
+            )
+        
+        # One odd multiplier and one offset per signature row
+        rng = np.random.default_rng(seed)
+        self._multipliers = rng.integers(0, 2**63, n_signatures, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+        self._offsets = rng.integers(0, 2**63, n_signatures, dtype=np.uint64)
+    
+    def pattern_keys(self, session: Union[List[str], np.ndarray]) -> np.ndarray:
+        """
+        64-bit keys of a session's distinct extract_patterns output.
+        
+        Sessions are lists of utterances or token arrays from the
+        validator's tokenize(); both give the same keys.
+        """
+        tokens = self.validator.tokenize(session)
+        if self.validator.use_fingerprints:
+            # Fingerprints hash the token ids' word keys directly
+            return self.validator.session_fingerprints(tokens)
+        
+        text = ' '.join(self.validator.vocabulary.decode(tokens))
+        patterns = set(self.validator.extract_patterns(text))
+        return np.array([int(p[:16], 16) for p in patterns], dtype=np.uint64)
+    
+    def signature(self, keys: np.ndarray) -> np.ndarray:
+        """MinHash signature (one minimum per hash function) of a key set."""
+        signature = np.full(self.n_signatures, EMPTY_SIGNATURE)
+        chunk = max(1, HASH_CHUNK_SIZE // self.n_signatures)
+        
+        for start in range(0, len(keys), chunk):
+            block = keys[start:start + chunk]
+            hashed = _mix64(block[None, :] * self._multipliers[:, None] + self._offsets[:, None])
+            np.minimum(signature, hashed.min(axis=1), out=signature)
+        return signature
+    
+    def signatures(self, conversation_corpus: Dict) -> Tuple[List, np.ndarray]:
+        """Signatures of every session as an (n_sessions, n_signatures) array."""
+        session_ids = list(conversation_corpus.keys())
+        signatures = np.empty((len(session_ids), self.n_signatures), dtype=np.uint64)
+        
+        for idx, session_id in enumerate(session_ids):
+            signatures[idx] = self.signature(self.pattern_keys(conversation_corpus[session_id]))
+        return session_ids, signatures
+    
+    def estimate_completion(self, signature_a: np.ndarray,
+                            signature_b: np.ndarray) -> float:
+        """Estimated completion rate (Jaccard) of two sessions."""
+        matches = (signature_a == signature_b) & (signature_a != EMPTY_SIGNATURE)
+        return float(np.mean(matches))
+    
+    def error_bound(self, confidence: float = 0.95) -> float:
+        """
+        Hoeffding bound on the estimation error for a given confidence.
+        
+        Applies to each pair estimate and to the all-pairs mean alike,
+        since both average n_signatures independent agreement indicators.
+        """
+        return float(np.sqrt(np.log(2 / (1 - confidence)) / (2 * self.n_signatures)))
+    
+    def estimate_mean_completion(self, conversation_corpus: Dict,
+                                 confidence: float = 0.95) -> Dict:
+        """
+        Estimate the mean completion score over all session pairs.
+        
+        For every signature row, the number of agreeing pairs follows from
+        value counts alone, so the mean over N*(N-1)/2 pairs costs
+        O(N * n_signatures) and no pair is ever materialized.
+        """
+        session_ids, signatures = self.signatures(conversation_corpus)
+        n_sessions = len(session_ids)
+        n_pairs = n_sessions * (n_sessions - 1) // 2
+        
+        agreeing = 0
+        for row in signatures.T:
+            row = np.sort(row[row != EMPTY_SIGNATURE])
+            starts = np.flatnonzero(np.r_[True, row[1:] != row[:-1]]) if len(row) else row
+            counts = np.diff(np.r_[starts, len(row)])
+            agreeing += int(np.sum(counts * (counts - 1) // 2))
+        
+        mean_score = agreeing / (n_pairs * self.n_signatures) if n_pairs else float('nan')
+        
+        return {
+            'mean_score': mean_score,
+            'error_bound': self.error_bound(confidence),
+            'confidence': confidence,
+            'n_sessions': n_sessions,
+            'n_pairs': n_pairs,
+            'n_signatures': self.n_signatures
+        }
+    
+    def candidate_pairs(self, signatures: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Session pairs that collide in at least one LSH band.
+        
+        With b bands of r rows, pairs of similarity s collide with
+        probability 1 - (1 - s**r)**b; the threshold is about (1/b)**(1/r).
+        """
+        if not self.n_bands:
+            raise ValueError("LSH banding is disabled (n_bands=0)")
+        
+        n_sessions = len(signatures)
+        rows_per_band = self.n_signatures // self.n_bands
+        nonempty = np.flatnonzero(signatures[:, 0] != EMPTY_SIGNATURE)
+        band_keys = []
+        
+        for band in range(self.n_bands):
+            band_rows = signatures[nonempty, band * rows_per_band:(band + 1) * rows_per_band]
+            
+            # Collapse each band to one bucket key, distinct per band
+            bucket = np.full(len(nonempty), np.uint64(band))
+            for column in band_rows.T:
+                bucket = _mix64(bucket ^ column)
+            band_keys.append(bucket.view(np.int64))
+        
+        # Buckets act as patterns in the inverted index of PatternValidator
+        postings = np.column_stack([
+            np.concatenate(band_keys) if band_keys else np.zeros(0, dtype=np.int64),
+            np.tile(nonempty, self.n_bands)
+        ])
+        postings = postings[np.lexsort((postings[:, 1], postings[:, 0]))]
+        pair_codes, _ = _count_shared_patterns(postings, max(n_sessions, 1))
+        
+        return pair_codes // max(n_sessions, 1), pair_codes % max(n_sessions, 1)
+    
+    def similar_pairs(self, conversation_corpus: Dict,
+                      min_score: float = 0.0) -> List[Tuple]:
+        """
+        High-similarity session pairs found by LSH banding.
+        
+        Returns:
+            (session_a, session_b, estimated_score) for every candidate pair
+            whose estimated completion rate is at least min_score.
+        """
+        session_ids, signatures = self.signatures(conversation_corpus)
+        rows, cols = self.candidate_pairs(signatures)
+        
+        matches = (signatures[rows] == signatures[cols]) & (signatures[rows] != EMPTY_SIGNATURE)
+        scores = matches.mean(axis=1)
+        keep = scores >= min_score
+        
+        return [
+            (session_ids[i], session_ids[j], float(score))
+            for i, j, score in zip(rows[keep], cols[keep], scores[keep])
+        ]
+    
+    def validate_architecture(self, conversation_corpus: Dict) -> bool:
+        """Approximate counterpart of PatternValidator.validate_architecture."""
+        estimate = self.estimate_mean_completion(conversation_corpus)
+        return estimate['mean_score'] > self.validator.validation_threshold
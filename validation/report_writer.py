@@ -0,0 +1,232 @@
+"""
+VALIDATION REPORT WRITER
+Single-pass, streaming JSON serialization of validation reports.
+
+The report tree is walked once. Every scalar and every numeric array is
+encoded to text exactly once, and the resulting tokens are fanned out to
+all requested outputs at the same time: the indented detailed report, any
+copies of it, a compact variant and an NDJSON variant (one line per
+top-level section). Numeric arrays and lists are encoded in blocks by
+the C JSON encoder and written inline, so large arrays stream to disk
+without being pretty-printed element by element.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# Elements of a numeric array encoded per block
+ARRAY_BLOCK_SIZE = 1 << 16
+
+REPORT_FORMATS = ('pretty', 'compact', 'ndjson')
+
+_encode = json.JSONEncoder(separators=(',', ':')).encode
+
+class ReportWriter:
+    def __init__(self, output_dir: Union[str, Path] = '.',
+                 formats: Tuple[str, ...] = ('pretty',), indent: int = 2):
+        unknown = set(formats) - set(REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown report formats {sorted(unknown)}; choose from {REPORT_FORMATS}")
+        self.output_dir = Path(output_dir)
+        self.formats = tuple(formats)
+        self.indent = indent
+    
+    def write(self, report: Dict, basename: str,
+              copies: Optional[List[Union[str, Path]]] = None) -> Dict[str, Path]:
+        """
+        Write every configured variant of a report in one pass.
+        
+        Args:
+            report: Report dict (NumPy arrays and scalars allowed)
+            basename: File name stem inside output_dir
+            copies: Extra paths receiving the indented report as well
+        
+        Returns:
+            Written paths keyed by variant ('pretty', 'compact', 'ndjson',
+            'copy_0', ...)
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        targets = {}
+        if 'pretty' in self.formats:
+            targets['pretty'] = (self.output_dir / f"{basename}.json", self.indent)
+        if 'compact' in self.formats:
+            targets['compact'] = (self.output_dir / f"{basename}.compact.json", None)
+        for i, path in enumerate(copies or []):
+            targets[f"copy_{i}"] = (Path(path), self.indent)
+        
+        files = []
+        try:
+            sinks = []
+            for path, indent in targets.values():
+                files.append(open(path, 'w'))
+                sinks.append(_JsonSink(files[-1], indent))
+            paths = {name: path for name, (path, _) in targets.items()}
+            
+            if 'ndjson' in self.formats:
+                paths['ndjson'] = self.output_dir / f"{basename}.ndjson"
+                files.append(open(paths['ndjson'], 'w'))
+                sinks.append(_NdjsonSink(files[-1]))
+            
+            for event in _events(report):
+                for sink in sinks:
+                    sink.handle(event)
+            for sink in sinks:
+                sink.finish()
+        finally:
+            for f in files:
+                f.close()
+        
+        return paths
+    
+    def write_json(self, report: Dict, path: Union[str, Path]) -> Path:
+        """Write one indented JSON report to an explicit path."""
+        path = Path(path)
+        with open(path, 'w') as f:
+            sink = _JsonSink(f, self.indent)
+            for event in _events(report):
+                sink.handle(event)
+            sink.finish()
+        return path
+
+def _events(value: Any) -> Iterator[Tuple[str, str]]:
+    """
+    Walk a report once, yielding formatting-independent tokens.
+    
+    ('open', '{'|'['), ('key', text), ('atom', text), ('close', '}'|']')
+    and, for numeric arrays written inline, ('inline', '[') followed by
+    ('raw', text) blocks and ('end_inline', ']').
+    """
+    if isinstance(value, dict):
+        yield ('open', '{')
+        for key, item in value.items():
+            yield ('key', _encode_key(key))
+            yield from _events(item)
+        yield ('close', '}')
+    elif isinstance(value, np.ndarray) and value.ndim and value.dtype.kind in 'biuf':
+        yield ('inline', '[')
+        if value.ndim > 1:
+            # Nested rows of a matrix, each encoded in one piece
+            for i, row in enumerate(value):
+                yield ('raw', (',' if i else '') + _encode(row.tolist()))
+        else:
+            for start in range(0, len(value), ARRAY_BLOCK_SIZE):
+                block = _encode(value[start:start + ARRAY_BLOCK_SIZE].tolist())[1:-1]
+                yield ('raw', (',' if start else '') + block)
+        yield ('end_inline', ']')
+    elif isinstance(value, np.ndarray):
+        # Zero-dimensional, string, object and complex arrays as their
+        # Python values; complex stays unserializable, as for json
+        yield from _events(value.tolist())
+    elif isinstance(value, (list, tuple)):
+        if len(value) and all(_is_scalar(item) for item in value):
+            yield ('inline', '[')
+            for start in range(0, len(value), ARRAY_BLOCK_SIZE):
+                block = _encode([_plain(v) for v in value[start:start + ARRAY_BLOCK_SIZE]])[1:-1]
+                yield ('raw', (',' if start else '') + block)
+            yield ('end_inline', ']')
+        else:
+            yield ('open', '[')
+            for item in value:
+                yield from _events(item)
+            yield ('close', ']')
+    else:
+        yield ('atom', _encode(_plain(value)))
+
+def _is_scalar(value: Any) -> bool:
+    return value is None or isinstance(value, (bool, int, float, np.number, np.bool_))
+
+def _plain(value: Any) -> Any:
+    """NumPy scalars as Python scalars; anything else unchanged."""
+    return value.item() if isinstance(value, np.generic) else value
+
+def _encode_key(key: Any) -> str:
+    """Object key as the json module would write it."""
+    key = _plain(key)
+    if isinstance(key, str):
+        return _encode(key)
+    if key is None or isinstance(key, (bool, int, float)):
+        return _encode(_encode(key))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+class _JsonSink:
+    """Renders tokens as one JSON document, indented or compact."""
+    
+    def __init__(self, f, indent: Optional[int]):
+        self.write = f.write
+        self.indent = indent
+        self.key_sep = ': ' if indent is not None else ':'
+        self.counts = []  # Items written so far in each open container
+        self.after_key = False
+    
+    def _newline(self, depth: int):
+        if self.indent is not None:
+            self.write('\n' + ' ' * (self.indent * depth))
+    
+    def _before_value(self):
+        if self.after_key:
+            self.after_key = False
+        elif self.counts:
+            if self.counts[-1]:
+                self.write(',')
+            self._newline(len(self.counts))
+            self.counts[-1] += 1
+    
+    def handle(self, event: Tuple[str, str]):
+        kind, text = event
+        if kind == 'key':
+            if self.counts[-1]:
+                self.write(',')
+            self._newline(len(self.counts))
+            self.counts[-1] += 1
+            self.write(text + self.key_sep)
+            self.after_key = True
+        elif kind in ('open', 'inline', 'atom'):
+            self._before_value()
+            self.write(text)
+            if kind == 'open':
+                self.counts.append(0)
+        elif kind == 'close':
+            if self.counts.pop():
+                self._newline(len(self.counts))
+            self.write(text)
+        else:  # raw, end_inline
+            self.write(text)
+    
+    def finish(self):
+        self.write('\n')
+
+class _NdjsonSink(_JsonSink):
+    """Renders each top-level section as a compact {"key": value} line."""
+    
+    def __init__(self, f):
+        super().__init__(f, None)
+        self.depth = 0
+    
+    def handle(self, event: Tuple[str, str]):
+        kind, text = event
+        if self.depth == 0 and kind == 'open' and text == '{':
+            self.depth = 1
+            return
+        if self.depth == 1 and kind == 'close':
+            self.depth = 0
+            return
+        
+        if self.depth == 1 and kind == 'key':
+            # A fresh one-member object per section
+            self.write('{' + text + ':')
+            self.counts = [1]
+            self.after_key = True
+            return
+        
+        super().handle(event)
+        if kind in ('open', 'inline'):
+            self.depth += 1
+        elif kind in ('close', 'end_inline'):
+            self.depth -= 1
+        if self.depth == 1:
+            self.write('}\n')
+    
+    def finish(self):
+        pass
@@ -0,0 +1,149 @@
+"""
+VALIDATION RESULT CACHE
+Content-addressed, size-bounded on-disk cache for validation components.
+
+Entries are keyed by a SHA-256 digest of the component name, the input
+section(s) it reads and the configuration that affects it, so a rerun
+with unchanged inputs reuses the stored result. Keys are salted with a
+digest of the validation sources, so entries written by other code are
+never reused.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+# Bytes of an array hashed per update, to keep memmapped inputs streaming
+HASH_BLOCK_BYTES = 1 << 24
+
+class ResultCache:
+    def __init__(self, cache_dir: Union[str, Path] = '.codex67_cache',
+                 max_bytes: int = 1 << 30, enabled: bool = True,
+                 salt: Optional[str] = None):
+        self.cache_dir = Path(cache_dir)
+        self.salt = source_digest() if salt is None else salt
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def key(self, component: str, *inputs: Any) -> str:
+        """Content digest of a component and everything its result depends on."""
+        digest = hashlib.sha256(self.salt.encode())
+        digest.update(component.encode())
+        for value in inputs:
+            digest.update(json.dumps(value, sort_keys=True, default=_array_digest).encode())
+        return digest.hexdigest()
+    
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Look up an entry; returns (hit, value) and refreshes its LRU position."""
+        path = self.cache_dir / f"{key}.pkl"
+        if not self.enabled or not path.exists():
+            self.misses += 1
+            return False, None
+        
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return False, None
+        
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass  # Evicted by another process since it was read
+        self.hits += 1
+        return True, value
+    
+    def put(self, key: str, value: Any) -> None:
+        """Store an entry, then evict least recently used ones over max_bytes."""
+        if not self.enabled:
+            return
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self.cache_dir / f"{key}.pkl"
+        
+        # A private temp file per write: concurrent writers of a key each
+        # replace the entry atomically instead of sharing one temp file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        
+        self._evict()
+    
+    def get_or_compute(self, component: str, inputs: Tuple,
+                       compute: Callable[[], Any]) -> Any:
+        """Cached result of compute() for the given component inputs."""
+        key = self.key(component, *inputs)
+        hit, value = self.get(key)
+        if not hit:
+            value = compute()
+            self.put(key, value)
+        return value
+    
+    def stats(self) -> Dict:
+        """Hit/miss counters for the report."""
+        lookups = self.hits + self.misses
+        return {
+            'enabled': self.enabled,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'cache_dir': str(self.cache_dir)
+        }
+    
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        # Other processes sharing the directory may remove entries meanwhile
+        entries = []
+        for path in self.cache_dir.glob('*.pkl'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            self.evictions += 1
+
+@functools.lru_cache(maxsize=None)
+def source_digest(directory: Optional[Path] = None) -> str:
+    """Digest of the Python sources in a package directory (default: this one)."""
+    directory = Path(__file__).parent if directory is None else Path(directory)
+    digest = hashlib.sha256()
+    for path in sorted(directory.glob('*.py')):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+def _array_digest(value: Any) -> Any:
+    """JSON stand-in for arrays (by content digest) and NumPy scalars."""
+    if isinstance(value, np.ndarray):
+        digest = hashlib.sha256(f"{value.dtype.str}{value.shape}".encode())
+        flat = value.reshape(-1)
+        step = max(1, HASH_BLOCK_BYTES // max(value.itemsize, 1))
+        for start in range(0, len(flat), step):
+            digest.update(np.ascontiguousarray(flat[start:start + step]).tobytes())
+        return {'__ndarray__': digest.hexdigest()}
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"Cannot hash object of type {type(value).__name__}")
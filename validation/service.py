@@ -0,0 +1,480 @@
+"""
+LOCAL VALIDATION SERVICE
+asyncio HTTP front end for pulse detection and pattern completion.
+
+Endpoints (JSON in, JSON out):
+
+    POST /api/v1/quantum-pulse/detect   {"signal": [...], "sampling_rate": 100.0}
+    POST /api/v1/pattern/resonance      {"session_a": [...], "session_b": [...]}
+                                        or {"pairs": [[session_a, session_b], ...]}
+    GET  /api/v1/system/health          queue depth, uptime, request counts
+    GET  /api/v1/metrics                latency histograms and batch sizes
+
+Concurrent requests are micro-batched: detection requests with the same
+sampling rate and length are stacked into one detect_frequency_batch
+call, and completion pairs are scored together in one worker call. The
+computation runs on a process pool, or with --workers 0 on a single
+background thread, since the shared detector's plan buffers are not
+thread-safe. Requests beyond max_pending are refused with 503 and
+Retry-After rather than queued without bound.
+
+    python validation/service.py --port 8067 --workers 4
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.append(str(Path(__file__).parent.parent))
+
+from validation.architecture_frequency import ArchitectureFrequencyDetector
+from validation.pattern_completion import PatternValidator
+
+# Upper bounds of the latency histogram buckets (milliseconds)
+LATENCY_BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+HTTP_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+                413: 'Payload Too Large', 500: 'Internal Server Error', 503: 'Service Unavailable'}
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram with interpolated quantiles."""
+    
+    def __init__(self, bounds_ms: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.bounds_ms = tuple(bounds_ms)
+        self.counts = [0] * (len(self.bounds_ms) + 1)  # Last bucket: above all bounds
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+    
+    def observe(self, seconds: float):
+        ms = seconds * 1e3
+        low, high = 0, len(self.bounds_ms)
+        while low < high:
+            mid = (low + high) // 2
+            if ms <= self.bounds_ms[mid]:
+                high = mid
+            else:
+                low = mid + 1
+        self.counts[low] += 1
+        self.total += 1
+        self.sum_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+    
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile in ms, linear within the containing bucket."""
+        if not self.total:
+            return float('nan')
+        rank = q * self.total
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                low = self.bounds_ms[i - 1] if i else 0.0
+                high = min(self.bounds_ms[i], self.max_ms) if i < len(self.bounds_ms) else self.max_ms
+                return low + (high - low) * (rank - seen) / count
+            seen += count
+        return self.max_ms
+    
+    def summary(self) -> Dict:
+        return {
+            'count': self.total,
+            'mean_ms': self.sum_ms / self.total if self.total else None,
+            'p50_ms': self.quantile(0.5) if self.total else None,
+            'p90_ms': self.quantile(0.9) if self.total else None,
+            'p99_ms': self.quantile(0.99) if self.total else None,
+            'max_ms': self.max_ms,
+            'buckets': {f"le_{b:g}ms": c for b, c in zip(self.bounds_ms, self.counts)},
+            'overflow': self.counts[-1]
+        }
+
+class MicroBatcher:
+    """
+    Groups concurrent submissions into batched calls.
+    
+    Items with equal keys wait up to max_delay seconds (or until
+    max_batch_size of them arrive) and are then handed together to
+    run_batch(key, payloads), which returns one result per payload.
+    """
+    
+    def __init__(self, run_batch: Callable[[Hashable, List[Any]], Awaitable[List[Any]]],
+                 max_batch_size: int = 64, max_delay: float = 0.005):
+        self.run_batch = run_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.batch_sizes = {}  # Batch size -> number of batches run
+        self._waiting = {}  # Key -> [(payload, future)]
+        self._timers = {}
+        self._tasks = set()
+    
+    async def submit(self, key: Hashable, payload: Any) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        waiting = self._waiting.setdefault(key, [])
+        waiting.append((payload, future))
+        
+        if len(waiting) >= self.max_batch_size:
+            self._flush(key)
+        elif len(waiting) == 1:
+            self._timers[key] = asyncio.get_running_loop().call_later(self.max_delay, self._flush, key)
+        return await future
+    
+    def _flush(self, key: Hashable):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        items = self._waiting.pop(key, [])
+        if items:
+            self.batch_sizes[len(items)] = self.batch_sizes.get(len(items), 0) + 1
+            task = asyncio.ensure_future(self._run(key, items))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, key: Hashable, items: List[Tuple[Any, asyncio.Future]]):
+        try:
+            results = await self.run_batch(key, [payload for payload, _ in items])
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(items, results):
+            if not future.done():
+                future.set_result(result)
+
+class ServiceError(Exception):
+    """Request error reported to the client with an HTTP status."""
+    
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+class ValidationService:
+    def __init__(self, host: str = '127.0.0.1', port: int = 8067,
+                 n_workers: Optional[int] = None, max_batch_size: int = 64,
+                 max_delay: float = 0.005, max_pending: int = 1024,
+                 max_body_bytes: int = 64 << 20):
+        """
+        Args:
+            host, port: Listening address (port 0 picks a free port)
+            n_workers: Process pool size (default: CPU count; 0 runs
+                batches one at a time on a single thread instead)
+            max_batch_size: Items per batched call
+            max_delay: Longest an item waits for its batch to fill (seconds)
+            max_pending: Items queued or computing before new requests
+                are refused with 503
+            max_body_bytes: Largest accepted request body
+        """
+        self.host = host
+        self.port = port
+        self.n_workers = (os.cpu_count() or 1) if n_workers is None else n_workers
+        self.max_pending = max_pending
+        self.max_body_bytes = max_body_bytes
+        
+        self.pending = 0
+        self.rejected = 0
+        self.histograms = {}
+        self.status_counts = {}
+        self.batcher = MicroBatcher(self._run_batch, max_batch_size, max_delay)
+        self.routes = {
+            ('POST', '/api/v1/quantum-pulse/detect'): self._handle_detect,
+            ('POST', '/api/v1/pattern/resonance'): self._handle_resonance,
+            ('GET', '/api/v1/system/health'): self._handle_health,
+            ('GET', '/api/v1/metrics'): self._handle_metrics
+        }
+        self._executor = None
+        self._server = None
+        self._connections = set()
+        self._compute_slots = None
+        self._started = None
+    
+    async def start(self) -> int:
+        """Start listening; returns the bound port."""
+        if self.n_workers > 0:
+            self._executor = ProcessPoolExecutor(self.n_workers)
+            # At most two batches per worker in flight; later items keep batching
+            self._compute_slots = asyncio.Semaphore(2 * self.n_workers)
+        else:
+            # The per-process detector is shared by every batch in
+            # thread mode, so batches run one at a time
+            self._executor = ThreadPoolExecutor(1)
+            self._compute_slots = asyncio.Semaphore(1)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._started = time.monotonic()
+        return self.port
+    
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            # Idle keep-alive connections would otherwise outlive the server
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            while self._connections:
+                await asyncio.sleep(0.01)
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    async def serve_forever(self):
+        await self.start()
+        print(f"Validation service listening on http://{self.host}:{self.port} "
+              f"({self.n_workers} workers)", flush=True)
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.stop()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._connections.add(writer)
+        try:
+            while True:
+                request = await self._read_request(reader)
+                if request is None:
+                    break
+                method, path, body, keep_alive = request
+                
+                start = time.perf_counter()
+                status, payload, headers = await self._dispatch(method, path, body)
+                elapsed = time.perf_counter() - start
+                self.histograms.setdefault(path if (method, path) in self.routes else 'other',
+                                           LatencyHistogram()).observe(elapsed)
+                self.status_counts[status] = self.status_counts.get(status, 0) + 1
+                
+                self._write_response(writer, status, payload, headers, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except ServiceError as e:
+            # Malformed framing: answer once, then drop the connection
+            self.status_counts[e.status] = self.status_counts.get(e.status, 0) + 1
+            self._write_response(writer, e.status, {'error': str(e)}, {}, False)
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+    
+    async def _read_request(self, reader: asyncio.StreamReader) -> Optional[Tuple[str, str, bytes, bool]]:
+        """Parse one HTTP/1.1 request; None at end of stream."""
+        request_line = await reader.readline()
+        if not request_line.strip():
+            return None
+        try:
+            method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+            raise ServiceError(400, 'Malformed request line')
+        
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        try:
+            length = int(headers.get('content-length', 0) or 0)
+        except ValueError:
+            raise ServiceError(400, 'Malformed Content-Length')
+        if length > self.max_body_bytes:
+            raise ServiceError(413, f"Body exceeds {self.max_body_bytes} bytes")
+        body = await reader.readexactly(length) if length else b''
+        
+        connection = headers.get('connection', '').lower()
+        keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+        return method.upper(), target.split('?', 1)[0], body, keep_alive
+    
+    def _write_response(self, writer: asyncio.StreamWriter, status: int, payload: Dict,
+                        headers: Dict, keep_alive: bool):
+        body = json.dumps(payload).encode()
+        lines = [f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+                 'Content-Type: application/json',
+                 f"Content-Length: {len(body)}",
+                 f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+    
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Dict, Dict]:
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, {'error': f"{method} not allowed on {path}"}, {}
+            return 404, {'error': f"No endpoint {path}"}, {}
+        
+        try:
+            request = json.loads(body) if body else {}
+            if not isinstance(request, dict):
+                raise ServiceError(400, 'Request body must be a JSON object')
+            return 200, await handler(request), {}
+        except json.JSONDecodeError as e:
+            return 400, {'error': f"Invalid JSON: {e}"}, {}
+        except ServiceError as e:
+            headers = {'Retry-After': '1'} if e.status == 503 else {}
+            return e.status, {'error': str(e)}, headers
+        except Exception as e:
+            return 500, {'error': f"{type(e).__name__}: {e}"}, {}
+    
+    async def _submit_all(self, items: List[Tuple[Hashable, Any]]) -> List[Any]:
+        """Queue items for batching, refusing the request if over max_pending."""
+        if len(items) > self.max_pending:
+            raise ServiceError(413, f"{len(items)} items exceed max_pending ({self.max_pending})")
+        if self.pending + len(items) > self.max_pending:
+            self.rejected += 1
+            raise ServiceError(503, f"Server busy ({self.pending} items pending)")
+        self.pending += len(items)
+        try:
+            return await asyncio.gather(*(self.batcher.submit(key, payload) for key, payload in items))
+        finally:
+            self.pending -= len(items)
+    
+    async def _run_batch(self, key: Hashable, payloads: List[Any]) -> List[Any]:
+        kind = key[0]
+        if kind == 'detect':
+            function, args = _detect_group, (key[1], np.stack(payloads))
+        else:
+            function, args = _completion_group, (payloads,)
+        
+        async with self._compute_slots:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+    
+    async def _handle_detect(self, request: Dict) -> Dict:
+        telemetry = request.get('telemetry', {})
+        signal = request.get('signal', telemetry.get('coherence_signal'))
+        sampling_rate = request.get('sampling_rate', telemetry.get('sampling_rate'))
+        if signal is None or sampling_rate is None:
+            raise ServiceError(400, "Expected 'signal' and 'sampling_rate'")
+        
+        try:
+            signal = np.asarray(signal, dtype=np.float64)
+            sampling_rate = float(sampling_rate)
+        except (TypeError, ValueError):
+            raise ServiceError(400, "'signal' must be a list of numbers")
+        if signal.ndim != 1 or len(signal) < 2:
+            raise ServiceError(400, "'signal' must be a flat list of at least 2 samples")
+        if not np.isfinite(sampling_rate) or sampling_rate <= 0:
+            raise ServiceError(400, "'sampling_rate' must be positive")
+        
+        # Same rate and length share a frequency grid, so they batch together
+        result, = await self._submit_all([(('detect', sampling_rate, len(signal)), signal)])
+        return result
+    
+    async def _handle_resonance(self, request: Dict) -> Dict:
+        if 'pairs' in request:
+            pairs = request['pairs']
+        elif 'session_a' in request and 'session_b' in request:
+            pairs = [(request['session_a'], request['session_b'])]
+        else:
+            raise ServiceError(400, "Expected 'session_a' and 'session_b', or 'pairs'")
+        
+        if not isinstance(pairs, list) or not all(
+            isinstance(pair, (list, tuple)) and len(pair) == 2
+            and all(isinstance(s, list) and all(isinstance(u, str) for u in s) for s in pair)
+            for pair in pairs
+        ):
+            raise ServiceError(400, 'Each session must be a list of utterance strings')
+        
+        scores = await self._submit_all([(('completion',), tuple(pair)) for pair in pairs])
+        if 'pairs' in request:
+            return {'completion_scores': scores}
+        return {'completion_rate': scores[0]}
+    
+    async def _handle_health(self, request: Dict) -> Dict:
+        return {
+            'status': 'busy' if self.pending >= self.max_pending else 'ok',
+            'uptime_seconds': time.monotonic() - self._started,
+            'workers': self.n_workers,
+            'pending': self.pending,
+            'max_pending': self.max_pending,
+            'rejected': self.rejected,
+            'responses': {str(status): count for status, count in sorted(self.status_counts.items())}
+        }
+    
+    async def _handle_metrics(self, request: Dict) -> Dict:
+        return {
+            'latency': {path: histogram.summary() for path, histogram in self.histograms.items()},
+            'batch_sizes': {str(size): count for size, count in sorted(self.batcher.batch_sizes.items())},
+            'pending': self.pending,
+            'rejected': self.rejected
+        }
+
+# Per-process detector, reused across batches
+_detector = None
+
+def _detect_group(sampling_rate: float, signals: np.ndarray) -> List[Dict]:
+    """Detection results for equal-length signals, one periodogram call for all."""
+    global _detector
+    if _detector is None:
+        _detector = ArchitectureFrequencyDetector()
+    
+    if len(signals) == 1:
+        results = [_detector.detect_frequency(signals[0], sampling_rate)]
+    else:
+        columns = _detector.detect_frequency_batch(signals, sampling_rate)
+        results = [{key: values[i] for key, values in columns.items()} for i in range(len(signals))]
+    
+    return [{key: _json_value(value) for key, value in result.items()} for result in results]
+
+def _json_value(value: Any) -> Any:
+    """Python scalar for a result value; NaN and infinities become None (null)."""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+def _completion_group(pairs: List[Tuple[List[str], List[str]]]) -> List[float]:
+    """Completion rates of session pairs, each distinct session fingerprinted once."""
+    # A fresh vocabulary per batch: a long-lived one would intern every
+    # word ever seen by the service
+    validator = PatternValidator(use_fingerprints=True)
+    
+    fingerprints = {}
+    scores = []
+    for pair in pairs:
+        a, b = (
+            fingerprints[key] if key in fingerprints
+            else fingerprints.setdefault(key, validator.session_fingerprints(
+                validator.tokenize(session)))
+            for key, session in ((tuple(session), session) for session in pair)
+        )
+        
+        if not len(a) or not len(b):
+            scores.append(0.0)
+            continue
+        intersection = len(np.intersect1d(a, b, assume_unique=True))
+        scores.append(intersection / (len(a) + len(b) - intersection))
+    return scores
+
+def main():
+    """Main function for command-line interface."""
+    parser = argparse.ArgumentParser(description="Codex 67 local validation service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8067)
+    parser.add_argument('--workers', type=int, help='Process pool size (default: CPU count)')
+    parser.add_argument('--max-batch', type=int, default=64, help='Items per batched call')
+    parser.add_argument('--max-delay-ms', type=float, default=5.0,
+                        help='Longest a request waits for its batch to fill')
+    parser.add_argument('--max-pending', type=int, default=1024,
+                        help='Queued items before requests are refused with 503')
+    parser.add_argument('--max-body-mb', type=float, default=64.0)
+    args = parser.parse_args()
+    
+    service = ValidationService(args.host, args.port, args.workers, args.max_batch,
+                                args.max_delay_ms / 1e3, args.max_pending,
+                                int(args.max_body_mb * (1 << 20)))
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
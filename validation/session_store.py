@@ -0,0 +1,260 @@
+"""
+DISK-BACKED SESSION STORE
+Conversation corpora larger than RAM, scored block by block.
+
+A store is a directory:
+
+    manifest.json        format, version and counts
+    session_ids.json     session id of every session, in store order
+    vocabulary.txt       one word per line; line number = token id
+    tokens.u32           token ids of all sessions back to back (raw uint32)
+    offsets.npy          n_sessions + 1 token offsets into tokens.u32
+    word_keys.npy        64-bit key of every vocabulary word
+    patterns.u64         sorted distinct n-gram fingerprints per session
+    pattern_offsets.npy  n_sessions + 1 offsets into patterns.u64
+
+Token and pattern files are memory-mapped, so only the blocks being
+scored are resident. Pattern fingerprints are the same uint64 values
+PatternValidator produces in fingerprint mode.
+"""
+
+import json
+import numpy as np
+from fractions import Fraction
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Union
+
+from validation import metrics
+from validation.pattern_completion import (
+    Vocabulary, ngram_fingerprints, _build_postings, _count_shared_patterns, _sorted_unique
+)
+from validation.incremental_completion import _cross_shared_patterns, _exact_units, SUM_SCALE_BITS
+
+STORE_FORMAT = 'codex67-session-store'
+STORE_VERSION = 1
+
+# Tokens buffered in memory before being appended to tokens.u32
+WRITE_BUFFER_TOKENS = 1 << 20
+
+# Memory allowed for pairwise scoring when none is given (bytes)
+DEFAULT_MEMORY_BUDGET = 1 << 30
+
+# Approximate bytes held per pattern of the two blocks being compared:
+# posting rows, their sort permutation, the probe filter and lookups
+BYTES_PER_PATTERN = 96
+
+class SessionStore:
+    def __init__(self, path: Union[str, Path]):
+        """Open an existing store read-only (see SessionStore.create)."""
+        self.path = Path(path)
+        with open(self.path / 'manifest.json', 'r') as f:
+            self.manifest = json.load(f)
+        if self.manifest.get('format') != STORE_FORMAT:
+            raise ValueError(f"'{self.path}' is not a {STORE_FORMAT}")
+        if self.manifest.get('version', 1) > STORE_VERSION:
+            raise ValueError(f"Unsupported session store version {self.manifest['version']}")
+        
+        with open(self.path / 'session_ids.json', 'r') as f:
+            self.session_ids = json.load(f)
+        self.offsets = np.load(self.path / 'offsets.npy', mmap_mode='r')
+        self.word_keys = np.load(self.path / 'word_keys.npy')
+        n_tokens = int(self.offsets[-1])
+        self.tokens = (np.memmap(self.path / 'tokens.u32', dtype=np.uint32, mode='r', shape=(n_tokens,))
+                       if n_tokens else np.zeros(0, dtype=np.uint32))
+        self._vocabulary = None
+        self._patterns = None
+    
+    @classmethod
+    def create(cls, path: Union[str, Path]) -> 'SessionStoreWriter':
+        """Start a new store; add sessions to the returned writer, then close it."""
+        return SessionStoreWriter(path)
+    
+    @classmethod
+    def from_corpus(cls, path: Union[str, Path], conversation_corpus: Dict) -> 'SessionStore':
+        """Write an in-memory corpus to a new store and open it."""
+        with cls.create(path) as writer:
+            writer.add_corpus(conversation_corpus)
+        return cls(path)
+    
+    def __len__(self) -> int:
+        return len(self.session_ids)
+    
+    def session_words(self, index: int) -> List[str]:
+        """Words of one session, decoded through the vocabulary."""
+        if self._vocabulary is None:
+            with open(self.path / 'vocabulary.txt', 'r') as f:
+                self._vocabulary = f.read().split('\n')
+        return [self._vocabulary[t] for t in self.tokens[self.offsets[index]:self.offsets[index + 1]]]
+    
+    def fingerprints(self, index: int) -> np.ndarray:
+        """Sorted distinct n-gram fingerprints of one session from its tokens."""
+        keys = self.word_keys[self.tokens[self.offsets[index]:self.offsets[index + 1]]]
+        fingerprints = ngram_fingerprints(keys)
+        metrics.count('ngrams_hashed', sum(len(f) for f in fingerprints))
+        return _sorted_unique(np.concatenate(fingerprints))
+    
+    def build_patterns(self, block_sessions: int = 4096) -> None:
+        """Extract every session's fingerprints once into patterns.u64."""
+        pattern_offsets = np.zeros(len(self) + 1, dtype=np.int64)
+        with open(self.path / 'patterns.u64', 'wb') as f:
+            for start in range(0, len(self), block_sessions):
+                stop = min(start + block_sessions, len(self))
+                rows = [self.fingerprints(i) for i in range(start, stop)]
+                pattern_offsets[start + 1:stop + 1] = pattern_offsets[start] + np.cumsum([len(r) for r in rows])
+                if rows:
+                    np.concatenate(rows).tofile(f)
+        np.save(self.path / 'pattern_offsets.npy', pattern_offsets)
+        self._patterns = None
+    
+    def pattern_rows(self, start: int, stop: int) -> List[np.ndarray]:
+        """Fingerprint rows of sessions start..stop-1 as int64 pattern ids."""
+        patterns, pattern_offsets = self._open_patterns()
+        base = int(pattern_offsets[start])
+        block = np.asarray(patterns[base:int(pattern_offsets[stop])]).view(np.int64)
+        return np.split(block, np.asarray(pattern_offsets[start + 1:stop]) - base)
+    
+    def iter_blocks(self, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> Iterator[Tuple[int, int]]:
+        """
+        Session ranges (start, stop) whose patterns fit half the budget.
+        
+        Two blocks are held at a time while scoring. A session with more
+        patterns than that forms a block of its own.
+        """
+        _, pattern_offsets = self._open_patterns()
+        per_block = max(1, memory_budget // (2 * BYTES_PER_PATTERN))
+        start = 0
+        while start < len(self):
+            stop = int(np.searchsorted(pattern_offsets, pattern_offsets[start] + per_block, side='right')) - 1
+            stop = min(max(stop, start + 1), len(self))
+            yield start, stop
+            start = stop
+    
+    def mean_completion(self, memory_budget: int = DEFAULT_MEMORY_BUDGET) -> float:
+        """
+        Mean completion score over all session pairs, block by block.
+        
+        Every pair of blocks (including each block with itself) is scored
+        from two in-memory posting tables, so peak memory follows the
+        budget rather than the corpus. The score sum is exact, so the mean
+        equals the in-memory result correctly rounded.
+        """
+        n_sessions = len(self)
+        n_pairs = n_sessions * (n_sessions - 1) // 2
+        if n_pairs == 0:
+            return float('nan')
+        
+        _, pattern_offsets = self._open_patterns()
+        sizes = np.diff(np.asarray(pattern_offsets))
+        blocks = list(self.iter_blocks(memory_budget))
+        units = 0
+        
+        for i, (start, stop) in enumerate(blocks):
+            postings = _build_postings(self.pattern_rows(start, stop), np.arange(start, stop))
+            
+            # Pairs within the block
+            local = postings.copy()
+            local[:, 1] -= start
+            codes, shared = _count_shared_patterns(local, stop - start)
+            rows = start + codes // (stop - start)
+            cols = start + codes % (stop - start)
+            units += _exact_units(shared / (sizes[rows] + sizes[cols] - shared))
+            
+            # Pairs against every later block. A byte table over the low
+            # fingerprint bits rejects most probes before any binary search.
+            filter_mask = (1 << int(np.ceil(np.log2(8 * len(postings) + 1)))) - 1
+            present = np.zeros(filter_mask + 1, dtype=bool)
+            present[postings[:, 0] & filter_mask] = True
+            
+            for other_start, other_stop in blocks[i + 1:]:
+                probes = np.concatenate(self.pattern_rows(other_start, other_stop))
+                owners = np.repeat(np.arange(other_stop - other_start), sizes[other_start:other_stop])
+                keep = present[probes & filter_mask]
+                codes, shared = _cross_shared_patterns(np.column_stack([probes[keep], owners[keep]]),
+                                                       postings, n_sessions)
+                rows = other_start + codes // n_sessions
+                cols = codes % n_sessions
+                units += _exact_units(shared / (sizes[rows] + sizes[cols] - shared))
+        
+        metrics.count('pairs_scored', n_pairs)
+        return float(Fraction(units, n_pairs << SUM_SCALE_BITS))
+    
+    def _open_patterns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Memory-map the pattern file, extracting it first if missing."""
+        if self._patterns is None:
+            if not (self.path / 'pattern_offsets.npy').exists():
+                self.build_patterns()
+            pattern_offsets = np.load(self.path / 'pattern_offsets.npy', mmap_mode='r')
+            n_patterns = int(pattern_offsets[-1])
+            patterns = (np.memmap(self.path / 'patterns.u64', dtype=np.uint64, mode='r', shape=(n_patterns,))
+                        if n_patterns else np.zeros(0, dtype=np.uint64))
+            self._patterns = (patterns, pattern_offsets)
+        return self._patterns
+
+class SessionStoreWriter:
+    """Appends sessions to a new store; use as a context manager."""
+    
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.vocabulary = Vocabulary()
+        self.session_ids = []
+        self.offsets = [0]
+        self._buffer = []
+        self._buffered = 0
+        self._tokens = open(self.path / 'tokens.u32', 'wb')
+    
+    def __enter__(self) -> 'SessionStoreWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def add(self, session_id, session: List[str]) -> None:
+        """Append one session (a list of utterances, as in a corpus dict)."""
+        token_ids = self.vocabulary.encode_session(session).view(np.uint32)
+        self._buffer.append(token_ids)
+        self._buffered += len(token_ids)
+        self.session_ids.append(session_id)
+        self.offsets.append(self.offsets[-1] + len(token_ids))
+        if self._buffered >= WRITE_BUFFER_TOKENS:
+            self._flush()
+    
+    def add_corpus(self, conversation_corpus: Dict) -> None:
+        """Append every session of a corpus dict (or any (id, session) items)."""
+        items = conversation_corpus.items() if isinstance(conversation_corpus, dict) else conversation_corpus
+        for session_id, session in items:
+            self.add(session_id, session)
+    
+    def close(self) -> None:
+        """Flush tokens and write the offset index, vocabulary and manifest."""
+        if self._tokens.closed:
+            return
+        self._flush()
+        self._tokens.close()
+        
+        words = self.vocabulary.words
+        with open(self.path / 'vocabulary.txt', 'w') as f:
+            f.write('\n'.join(words))
+        np.save(self.path / 'word_keys.npy', self.vocabulary.keys)
+        np.save(self.path / 'offsets.npy', np.array(self.offsets, dtype=np.int64))
+        with open(self.path / 'session_ids.json', 'w') as f:
+            json.dump(self.session_ids, f)
+        
+        # A rewritten store invalidates any extracted patterns
+        for stale in ('patterns.u64', 'pattern_offsets.npy'):
+            (self.path / stale).unlink(missing_ok=True)
+        
+        with open(self.path / 'manifest.json', 'w') as f:
+            json.dump({
+                'format': STORE_FORMAT,
+                'version': STORE_VERSION,
+                'n_sessions': len(self.session_ids),
+                'n_tokens': self.offsets[-1],
+                'vocabulary_size': len(words)
+            }, f, indent=2)
+    
+    def _flush(self) -> None:
+        if self._buffer:
+            np.concatenate(self._buffer).tofile(self._tokens)
+            self._buffer = []
+            self._buffered = 0
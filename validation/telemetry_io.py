@@ -0,0 +1,142 @@
+"""
+TELEMETRY CONTAINER FORMAT
+JSON manifest plus binary sidecar arrays for large validation inputs.
+
+A container is a directory holding `manifest.json` and one sidecar file
+per large numeric array. The manifest carries every non-array field of
+the original JSON input, and under "arrays" maps dotted field paths
+(e.g. "quantum_telemetry.coherence_signal") to sidecars:
+
+    {"file": "quantum_telemetry.coherence_signal.npy"}
+    {"file": "signal.f64", "dtype": "<f8", "shape": [12000000]}
+
+`.npy` sidecars are opened with np.load(mmap_mode='r'); raw sidecars
+need dtype and shape and are opened with np.memmap. Either way the
+samples never pass through Python float objects.
+"""
+
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+CONTAINER_FORMAT = 'codex67-container'
+CONTAINER_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# Telemetry fields converted to sidecars by default
+DEFAULT_ARRAY_FIELDS = [
+    'quantum_telemetry.coherence_signal',
+    'quantum_telemetry.t1_times',
+    'quantum_telemetry.t2_times',
+    'quantum_telemetry.gate_fidelities',
+    'quantum_telemetry.error_rates'
+]
+
+def is_container(path: Union[str, Path]) -> bool:
+    """Whether path is a container directory or its manifest."""
+    path = Path(path)
+    if path.is_dir():
+        path = path / MANIFEST_NAME
+    if not path.is_file() or path.suffix != '.json':
+        return False
+    with open(path, 'r') as f:
+        head = f.read(256)
+    return CONTAINER_FORMAT in head
+
+def load_container(path: Union[str, Path]) -> Dict:
+    """Load a container, memory-mapping every sidecar array."""
+    path = Path(path)
+    manifest_path = path / MANIFEST_NAME if path.is_dir() else path
+    
+    with open(manifest_path, 'r') as f:
+        manifest = json.load(f)
+    
+    if manifest.get('format') != CONTAINER_FORMAT:
+        raise ValueError(f"'{manifest_path}' is not a {CONTAINER_FORMAT} manifest")
+    if manifest.get('version', 1) > CONTAINER_VERSION:
+        raise ValueError(f"Unsupported container version {manifest['version']}")
+    
+    data = manifest.get('data', {})
+    for field, spec in manifest.get('arrays', {}).items():
+        _set_field(data, field, _open_sidecar(manifest_path.parent, spec))
+    return data
+
+def convert_json_to_container(json_path: Union[str, Path],
+                              output_dir: Union[str, Path],
+                              array_fields: Optional[Iterable[str]] = None) -> Path:
+    """
+    Convert a legacy JSON input file into a container directory.
+    
+    Args:
+        json_path: Existing JSON test data file
+        output_dir: Directory to create (manifest plus .npy sidecars)
+        array_fields: Dotted field paths to move into sidecars; defaults
+            to the quantum telemetry signal fields
+    
+    Returns:
+        Path of the written manifest
+    """
+    with open(json_path, 'r') as f:
+        data = json.load(f)
+    return write_container(data, output_dir, array_fields)
+
+def write_container(data: Dict, output_dir: Union[str, Path],
+                    array_fields: Optional[Iterable[str]] = None) -> Path:
+    """Write test data as a container, moving numeric arrays to .npy sidecars."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    array_fields = DEFAULT_ARRAY_FIELDS if array_fields is None else list(array_fields)
+    
+    # Sidecar fields are popped from a copy of each containing dict
+    data = dict(data)
+    arrays = {}
+    for field in array_fields:
+        parent, key = _parent_of(data, field, copy=True)
+        if parent is None or key not in parent:
+            continue
+        values = np.asarray(parent.pop(key), dtype=np.float64)
+        filename = f"{field}.npy"
+        np.save(output_dir / filename, values)
+        arrays[field] = {'file': filename}
+    
+    manifest = {
+        'format': CONTAINER_FORMAT,
+        'version': CONTAINER_VERSION,
+        'data': data,
+        'arrays': arrays
+    }
+    manifest_path = output_dir / MANIFEST_NAME
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest_path
+
+def _open_sidecar(base: Path, spec: Dict) -> np.ndarray:
+    """Memory-map one sidecar file described by a manifest entry."""
+    path = base / spec['file']
+    if path.suffix == '.npy':
+        return np.load(path, mmap_mode='r')
+    return np.memmap(path, dtype=np.dtype(spec.get('dtype', '<f8')), mode='r',
+                     offset=spec.get('offset', 0),
+                     shape=tuple(spec['shape']) if 'shape' in spec else None)
+
+def _parent_of(data: Dict, field: str, copy: bool = False):
+    """Containing dict and final key of a dotted field path."""
+    *path, key = field.split('.')
+    parent = data
+    for part in path:
+        child = parent.get(part)
+        if not isinstance(child, dict):
+            return None, key
+        if copy:
+            child = parent[part] = dict(child)
+        parent = child
+    return parent, key
+
+def _set_field(data: Dict, field: str, value) -> None:
+    """Assign a dotted field path, creating intermediate dicts."""
+    *path, key = field.split('.')
+    parent = data
+    for part in path:
+        parent = parent.setdefault(part, {})
+    parent[key] = value
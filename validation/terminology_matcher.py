@@ -0,0 +1,178 @@
+"""
+TERMINOLOGY MATCHING
+Aho-Corasick scan of transcripts for a specialized term list.
+
+Terms and text are compared as sequences of lower-cased words (runs of
+\\w characters), so a term only matches on word boundaries and
+punctuation or whitespace between its words is ignored ("meta-validation"
+matches "meta validation"). The automaton runs over words rather than
+characters: words outside every term reset it to the root without
+touching the goto tables, so one pass costs a dict lookup per word.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Union
+
+from validation import metrics
+
+WORD = re.compile(r'\w+')
+
+# Characters read per chunk when streaming a transcript file
+TRANSCRIPT_CHUNK_CHARS = 1 << 20
+
+class TerminologyMatcher:
+    def __init__(self, terms: Iterable[str]):
+        """
+        Build the automaton once for a term list.
+        
+        Args:
+            terms: Terms (single words or phrases); terms with the same
+                word sequence are counted under the first spelling
+        """
+        self.terms: List[str] = []
+        self.max_term_words = 0
+        
+        # Trie over words: goto[state][word] -> state, term id ending at state
+        self._goto: List[Dict[str, int]] = [{}]
+        terminal: List[int] = [-1]
+        for term in terms:
+            words = WORD.findall(term.lower())
+            if not words:
+                continue
+            state = 0
+            for word in words:
+                if word not in self._goto[state]:
+                    self._goto[state][word] = len(self._goto)
+                    self._goto.append({})
+                    terminal.append(-1)
+                state = self._goto[state][word]
+            if terminal[state] == -1:
+                terminal[state] = len(self.terms)
+                self.terms.append(term)
+                self.max_term_words = max(self.max_term_words, len(words))
+        
+        self._alphabet = frozenset(w for edges in self._goto for w in edges)
+        self._fail, self._outputs = self._link(terminal)
+        self._lengths = [len(WORD.findall(t.lower())) for t in self.terms]
+    
+    def __len__(self) -> int:
+        return len(self.terms)
+    
+    def scan(self, text: str, positions: bool = True) -> Dict:
+        """Term counts (and character offsets) in one text; see scan_stream."""
+        return self.scan_stream([text], positions)
+    
+    def scan_stream(self, chunks: Iterable[str], positions: bool = True) -> Dict:
+        """
+        Scan a transcript given as consecutive text chunks in one pass.
+        
+        Automaton state carries across chunks, and a word cut by a chunk
+        boundary is held back and completed by the next chunk, so results
+        do not depend on where the text is split.
+        
+        Returns:
+            Dict with 'counts' and, with positions, 'positions' (offsets
+            of each match start in the lower-cased text, which equal those
+            in the original except after the few characters whose lower
+            case is longer) for the terms found, plus
+            'terms_matched', 'n_terms', 'terminology_usage' (fraction of
+            terms found at least once), 'n_words' and 'n_chars'
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        alphabet, lengths = self._alphabet, self._lengths
+        window = max(self.max_term_words, 1)
+        
+        counts = [0] * len(self.terms)
+        found: Dict[int, List[int]] = {}
+        starts = [0] * window  # Offsets of the last `window` words, as a ring
+        state, n_words, offset, carry = 0, 0, 0, ''
+        
+        for chunk in _with_tail(chunks):
+            text = carry + chunk.lower() if chunk is not None else carry
+            end = len(text)
+            if chunk is not None and end and _is_word_char(text[-1]):
+                # Hold back a word that may continue in the next chunk
+                end = _last_word_start(text)
+            
+            for match in WORD.finditer(text, 0, end):
+                word = match.group()
+                starts[n_words % window] = offset + match.start()
+                n_words += 1
+                if word not in alphabet:
+                    state = 0
+                    continue
+                while word not in goto[state] and state:
+                    state = fail[state]
+                state = goto[state].get(word, 0)
+                for term_id in outputs[state]:
+                    counts[term_id] += 1
+                    if positions:
+                        found.setdefault(term_id, []).append(
+                            starts[(n_words - lengths[term_id]) % window])
+            
+            carry = text[end:]
+            offset += end
+        
+        metrics.count('transcript_words', n_words)
+        matched = [i for i, count in enumerate(counts) if count]
+        result = {
+            'counts': {self.terms[i]: counts[i] for i in matched},
+            'terms_matched': len(matched),
+            'n_terms': len(self.terms),
+            'terminology_usage': len(matched) / len(self.terms) if self.terms else 0.0,
+            'n_words': n_words,
+            'n_chars': offset
+        }
+        if positions:
+            result['positions'] = {self.terms[i]: found[i] for i in matched}
+        return result
+    
+    def _link(self, terminal: List[int]):
+        """Failure links and merged outputs, breadth first over the trie."""
+        goto = self._goto
+        fail = [0] * len(goto)
+        outputs = [[t] if t >= 0 else [] for t in terminal]
+        
+        queue = list(goto[0].values())
+        for state in queue:
+            for word, child in goto[state].items():
+                queue.append(child)
+                link = fail[state]
+                while word not in goto[link] and link:
+                    link = fail[link]
+                fail[child] = goto[link].get(word, 0)
+                outputs[child] = outputs[child] + outputs[fail[child]]
+        return fail, outputs
+
+def iter_transcript(source: Union[str, Path, Iterable[str]],
+                    chunk_chars: int = TRANSCRIPT_CHUNK_CHARS) -> Iterator[str]:
+    """Text chunks from a transcript string, a file path or an iterable of strings."""
+    if isinstance(source, Path):
+        with open(source, 'r', encoding='utf-8', errors='replace') as f:
+            while True:
+                chunk = f.read(chunk_chars)
+                if not chunk:
+                    return
+                yield chunk
+    elif isinstance(source, str):
+        yield source
+    else:
+        for chunk in source:
+            yield chunk
+
+def _with_tail(chunks: Iterable[str]) -> Iterator[str]:
+    """The chunks followed by None, which flushes the held-back word."""
+    for chunk in chunks:
+        yield chunk
+    yield None
+
+def _is_word_char(char: str) -> bool:
+    return WORD.match(char) is not None
+
+def _last_word_start(text: str) -> int:
+    """Start of the word run at the end of text."""
+    start = len(text)
+    while start and _is_word_char(text[start - 1]):
+        start -= 1
+    return start
@@ -0,0 +1,243 @@
+"""
+VOCABULARY SYNCHRONIZATION
+Sparse participant x term analysis of shared terminology emergence.
+
+Conversation data is reduced once to sparse count matrices: one
+participant x term matrix over the whole record and one per time
+bucket. Pairwise synchronization (Jaccard overlap of participant
+vocabularies) and emergence rates then come from sparse matrix
+products, computed in row blocks so that tens of thousands of
+participants never need a dense participant x participant matrix.
+
+Accepted conversation_data layouts:
+
+    {"conversations": [[utterance, ...], ...], "participants": [...]}
+        utterance i of every conversation belongs to participant
+        i % len(participants), so longer conversations take turns round
+        the list (participant_i when no list is given); conversations
+        are in time order
+    {"messages": [{"participant": p, "text": t, "timestamp": s}, ...]}
+        timestamp is optional (message order is used instead)
+"""
+
+import numpy as np
+from scipy import sparse, stats
+from typing import Dict, List, Tuple
+
+from validation import metrics
+
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at',
+                        'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were'})
+
+ARCHITECTURE_TERMS = frozenset({
+    'quantum', 'system', 'pulse', 'coherence', 'oscillation',
+    'pattern', 'resonance', 'vocabulary', 'synchronization',
+    'meta', 'validation', 'architecture', 'lattice', 'node',
+    'consciousness', 'rhythm', 'substrate', 'intrinsic',
+    'biological', 'hrv', 'detection', 'network'
+})
+
+# Sync score expected without shared terminology emergence
+SYNC_BASELINE = 0.25
+
+# Upper bound on participant pairs materialized per sparse product block
+PAIR_BLOCK_SIZE = 1 << 22
+
+class VocabularySyncEngine:
+    def __init__(self, n_time_buckets: int = 2, sync_threshold: float = 0.65,
+                 min_term_length: int = 4, alpha: float = 0.05):
+        """
+        Args:
+            n_time_buckets: Equal-width time buckets; bucket 0 is the
+                "early" vocabulary that later terms are compared against
+            sync_threshold: Mean sync score for synchronization
+            min_term_length: Shorter words are not terms
+            alpha: Significance level of the test against SYNC_BASELINE
+        """
+        self.n_time_buckets = max(int(n_time_buckets), 1)
+        self.sync_threshold = sync_threshold
+        self.min_term_length = min_term_length
+        self.alpha = alpha
+    
+    def extract_terms(self, text: str) -> List[str]:
+        """Lower-cased words of at least min_term_length that are not stop words."""
+        min_length = self.min_term_length
+        return [w for w in text.lower().split() if len(w) >= min_length and w not in STOP_WORDS]
+    
+    def build_matrices(self, conversation_data: Dict) -> Dict:
+        """
+        Term counts as sparse matrices.
+        
+        Returns:
+            Dict with 'participants' (ids in row order), 'terms' (column
+            order), 'counts' (participants x terms CSR) and 'bucket_counts'
+            (one participants x terms CSR per time bucket)
+        """
+        participant_ids, term_ids = {}, {}
+        rows, cols, times = [], [], []
+        
+        for participant, text, time in _iter_messages(conversation_data):
+            row = participant_ids.setdefault(participant, len(participant_ids))
+            terms = [term_ids.setdefault(t, len(term_ids)) for t in self.extract_terms(text)]
+            rows.append(np.full(len(terms), row, dtype=np.int64))
+            cols.append(np.array(terms, dtype=np.int64))
+            times.append(np.full(len(terms), time, dtype=np.float64))
+        
+        rows = np.concatenate(rows) if rows else np.zeros(0, dtype=np.int64)
+        cols = np.concatenate(cols) if cols else np.zeros(0, dtype=np.int64)
+        times = np.concatenate(times) if times else np.zeros(0)
+        shape = (len(participant_ids), len(term_ids))
+        metrics.count('term_occurrences', len(cols))
+        
+        # Equal-width buckets over the observed time span
+        if len(times) and times.max() > times.min():
+            buckets = ((times - times.min()) / (times.max() - times.min()) * self.n_time_buckets).astype(np.int64)
+            buckets = np.minimum(buckets, self.n_time_buckets - 1)
+        else:
+            buckets = np.zeros(len(times), dtype=np.int64)
+        
+        ones = np.ones(len(cols), dtype=np.int64)
+        counts = sparse.csr_matrix((ones, (rows, cols)), shape=shape)
+        bucket_counts = [
+            sparse.csr_matrix((ones[buckets == b], (rows[buckets == b], cols[buckets == b])), shape=shape)
+            for b in range(self.n_time_buckets)
+        ]
+        
+        return {
+            'participants': list(participant_ids),
+            'terms': list(term_ids),
+            'counts': counts,
+            'bucket_counts': bucket_counts
+        }
+    
+    def pair_scores(self, matrix: sparse.spmatrix,
+                    keep_pairs: bool = True) -> Dict:
+        """
+        Jaccard overlap of the nonzero columns of every row pair.
+        
+        Intersections come from block-wise products B[rows] @ B.T of the
+        binarized matrix, keeping the upper triangle. Pairs with no
+        shared term score 0 and are only counted in the totals. Pairs
+        where either row is empty are excluded, as in the reference
+        all-pairs loop.
+        
+        Returns:
+            Dict with 'n_pairs', 'sum', 'sum_sq' and, with keep_pairs,
+            'rows', 'cols', 'scores' of the overlapping pairs
+        """
+        binary = (sparse.csr_matrix(matrix) > 0).astype(np.int32)
+        sizes = np.diff(binary.indptr)
+        active = np.flatnonzero(sizes)
+        binary, sizes = binary[active], sizes[active]
+        n_active = len(active)
+        transposed = binary.T.tocsr()
+        
+        total, total_sq = 0.0, 0.0
+        row_chunks, col_chunks, score_chunks = [], [], []
+        block = max(1, PAIR_BLOCK_SIZE // max(n_active, 1))
+        
+        for start in range(0, n_active, block):
+            shared = (binary[start:start + block] @ transposed).tocoo()
+            i = shared.row.astype(np.int64) + start
+            j = shared.col.astype(np.int64)
+            upper = i < j
+            i, j, inter = i[upper], j[upper], shared.data[upper]
+            scores = inter / (sizes[i] + sizes[j] - inter)
+            total += float(scores.sum())
+            total_sq += float(np.dot(scores, scores))
+            if keep_pairs:
+                row_chunks.append(active[i])
+                col_chunks.append(active[j])
+                score_chunks.append(scores)
+        
+        n_pairs = n_active * (n_active - 1) // 2
+        metrics.count('pairs_scored', n_pairs)
+        result = {'n_pairs': n_pairs, 'sum': total, 'sum_sq': total_sq}
+        if keep_pairs:
+            result['rows'] = np.concatenate(row_chunks) if row_chunks else np.zeros(0, dtype=np.int64)
+            result['cols'] = np.concatenate(col_chunks) if col_chunks else np.zeros(0, dtype=np.int64)
+            result['scores'] = np.concatenate(score_chunks) if score_chunks else np.zeros(0)
+        return result
+    
+    def analyze(self, conversation_data: Dict) -> Dict:
+        """Synchronization, emergence and significance of a conversation record."""
+        matrices = self.build_matrices(conversation_data)
+        counts, bucket_counts = matrices['counts'], matrices['bucket_counts']
+        
+        # Whole-record synchronization
+        overall = self.pair_scores(counts, keep_pairs=False)
+        mean_sync, std_sync = _mean_std(overall)
+        p_value = self._significance(mean_sync, std_sync, overall['n_pairs'])
+        
+        # Synchronization inside each time bucket
+        sync_by_bucket = [_mean_std(self.pair_scores(b, keep_pairs=False))[0] for b in bucket_counts]
+        
+        # Emergent terms: used after the first bucket but never in it
+        early_terms = np.diff(bucket_counts[0].tocsc().indptr) > 0
+        late = sum(bucket_counts[1:], sparse.csr_matrix(counts.shape, dtype=np.int64))
+        late_terms = np.diff(late.tocsc().indptr) > 0
+        emergent = late @ sparse.diags((~early_terms).astype(np.int64), dtype=np.int64)
+        emergent.eliminate_zeros()
+        
+        late_sizes = np.diff(late.indptr)
+        emergent_sizes = np.diff(emergent.indptr)
+        has_late = late_sizes > 0
+        n_late_terms = int(late_terms.sum())
+        emergent_sync = _mean_std(self.pair_scores(emergent, keep_pairs=False))[0]
+        
+        all_terms = matrices['terms']
+        architectural = sum(1 for t in all_terms if t in ARCHITECTURE_TERMS)
+        
+        return {
+            'n_participants': counts.shape[0],
+            'n_active_participants': int((np.diff(counts.indptr) > 0).sum()),
+            'n_terms': counts.shape[1],
+            'n_pairs': overall['n_pairs'],
+            'mean_sync_score': mean_sync,
+            'sync_std': std_sync,
+            'sync_consistency': float(1.0 - std_sync / mean_sync) if mean_sync > 0 else 0.0,
+            'sync_threshold': self.sync_threshold,
+            'p_value': p_value,
+            'effect_size': float((mean_sync - SYNC_BASELINE) / std_sync) if std_sync > 0 else 0.0,
+            'synchronized': bool(mean_sync >= self.sync_threshold and p_value <= self.alpha),
+            'n_time_buckets': self.n_time_buckets,
+            'sync_by_bucket': sync_by_bucket,
+            'terms_emerged': int((late_terms & ~early_terms).sum()),
+            'spontaneity': float((late_terms & ~early_terms).sum() / n_late_terms) if n_late_terms else 0.0,
+            'mean_emergence_rate': (float(np.mean(emergent_sizes[has_late] / late_sizes[has_late]))
+                                    if has_late.any() else 0.0),
+            'emergent_sync_score': emergent_sync,
+            'architectural_relevance': architectural / len(all_terms) if all_terms else 0.0
+        }
+    
+    def _significance(self, mean: float, std: float, n: int) -> float:
+        """One-tailed one-sample t-test of the pair scores against SYNC_BASELINE."""
+        if n < 2:
+            return 1.0
+        if std == 0:
+            return 0.0 if mean > SYNC_BASELINE else 1.0
+        t_stat = (mean - SYNC_BASELINE) / (std * np.sqrt(n / (n - 1)) / np.sqrt(n))
+        return float(stats.t.sf(t_stat, n - 1))
+
+def _mean_std(pair_totals: Dict) -> Tuple[float, float]:
+    """Mean and population std over all pairs from score totals."""
+    n = pair_totals['n_pairs']
+    if n == 0:
+        return 0.0, 0.0
+    mean = pair_totals['sum'] / n
+    return float(mean), float(np.sqrt(max(pair_totals['sum_sq'] / n - mean * mean, 0.0)))
+
+def _iter_messages(conversation_data: Dict):
+    """(participant, text, time) for every message of either layout."""
+    if 'messages' in conversation_data:
+        for k, message in enumerate(conversation_data['messages']):
+            yield message.get('participant'), message.get('text', ''), float(message.get('timestamp', k))
+        return
+    
+    # Speakers take turns round the participant list; without one every
+    # utterance position is a participant
+    participants = conversation_data.get('participants')
+    for time, conversation in enumerate(conversation_data.get('conversations', [])):
+        for i, utterance in enumerate(conversation):
+            participant = participants[i % len(participants)] if participants else f"participant_{i}"
+            yield participant, utterance, float(time)